@@ -76,3 +76,64 @@ BACKEND_API_HOST = os.getenv("BACKEND_API_HOST", "127.0.0.1")
 BACKEND_API_PORT = os.getenv("BACKEND_API_PORT", 8000)
 BACKEND_API_USERNAME = os.getenv("BACKEND_API_USERNAME", "admin")
 BACKEND_API_PASSWORD = os.getenv("BACKEND_API_PASSWORD", "admin")
+BACKEND_API_POOL_SIZE = int(os.getenv("BACKEND_API_POOL_SIZE", 8))
+BACKEND_API_HEALTH_CHECK_INTERVAL = float(os.getenv("BACKEND_API_HEALTH_CHECK_INTERVAL", 30))
+BACKEND_API_FANOUT_WORKERS = int(os.getenv("BACKEND_API_FANOUT_WORKERS", 8))
+BACKEND_API_FANOUT_TIMEOUT = float(os.getenv("BACKEND_API_FANOUT_TIMEOUT", 30))
+# Bulk order cancellation: cancels in flight at once, and cancels per second per connector
+BULK_CANCEL_MAX_CONCURRENCY = int(os.getenv("BULK_CANCEL_MAX_CONCURRENCY", 5))
+BULK_CANCEL_RATE_LIMIT = float(os.getenv("BULK_CANCEL_RATE_LIMIT", 10))
+# Trading page account tables: rows per API page when following the pagination cursor, and the most rows loaded
+ACCOUNT_DATA_PAGE_SIZE = int(os.getenv("ACCOUNT_DATA_PAGE_SIZE", 500))
+ACCOUNT_DATA_MAX_ROWS = int(os.getenv("ACCOUNT_DATA_MAX_ROWS", 10000))
+# Trading page watchlist: pairs added for the selected exchange on first visit, and seconds between
+# price polls (one batched request per connector, shared by all sessions)
+WATCHLIST_DEFAULT_PAIRS = [p.strip() for p in os.getenv("WATCHLIST_DEFAULT_PAIRS", "BTC-USDT,ETH-USDT,SOL-USDT").split(",") if p.strip()]
+WATCHLIST_REFRESH_INTERVAL = float(os.getenv("WATCHLIST_REFRESH_INTERVAL", 5))
+# Instances page: bot statuses and controller configs are polled once per interval in the background for
+# all sessions; polling pauses after FLEET_POLL_IDLE_TIMEOUT seconds without viewers
+FLEET_POLL_INTERVAL = float(os.getenv("FLEET_POLL_INTERVAL", 10))
+FLEET_POLL_IDLE_TIMEOUT = float(os.getenv("FLEET_POLL_IDLE_TIMEOUT", 300))
+# Instances page fleet operations: controller config updates in flight at once across all bots (also
+# bounded by BACKEND_API_FANOUT_WORKERS and BACKEND_API_POOL_SIZE)
+FLEET_OPS_MAX_CONCURRENCY = int(os.getenv("FLEET_OPS_MAX_CONCURRENCY", 8))
+# Log lines kept per bot and log kind (error, general); each poll only appends the lines not seen yet
+BOT_LOG_TAIL_LINES = int(os.getenv("BOT_LOG_TAIL_LINES", 1000))
+# Background jobs (deploy, stop, archive, delete): jobs in flight at once, and the backend is checked for
+# completion after JOB_POLL_INTERVAL seconds, doubling up to JOB_POLL_MAX_INTERVAL, for up to JOB_TIMEOUT seconds
+JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", 4))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", 1))
+JOB_POLL_MAX_INTERVAL = float(os.getenv("JOB_POLL_MAX_INTERVAL", 15))
+JOB_TIMEOUT = float(os.getenv("JOB_TIMEOUT", 300))
+BACKEND_API_CACHE_ENABLED = os.getenv("BACKEND_API_CACHE_ENABLED", "True").lower() in (
+    "true",
+    "1",
+    "t",
+)
+
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "False").lower() in (
+    "true",
+    "1",
+    "t",
+)
+
+# Trading page market data: "off" polls REST on every view, "websocket" streams from the API's
+# /ws/market-data endpoint and "poll" polls REST once per market in the background for all sessions
+MARKET_DATA_STREAM = os.getenv("MARKET_DATA_STREAM", "off").lower()
+MARKET_DATA_STREAM_MAX_TRADES = int(os.getenv("MARKET_DATA_STREAM_MAX_TRADES", 500))
+MARKET_DATA_STREAM_MAX_CANDLES = int(os.getenv("MARKET_DATA_STREAM_MAX_CANDLES", 1000))
+
+# Candles kept per (connector, pair, interval) by the shared incremental candle store; refreshes
+# only download the candles opened since the last cached one
+CANDLE_STORE_MAX_CANDLES = int(os.getenv("CANDLE_STORE_MAX_CANDLES", 5000))
+# Coarser candles are resampled locally from this interval (empty disables it), so switching chart
+# intervals needs no request. The Trading page keeps CANDLE_RESAMPLE_BASE_CANDLES of them per market
+# and config pages resample when the base interval needs at most CANDLE_RESAMPLE_MAX_BASE_ROWS rows
+CANDLE_RESAMPLE_BASE_INTERVAL = os.getenv("CANDLE_RESAMPLE_BASE_INTERVAL", "1m")
+CANDLE_RESAMPLE_BASE_CANDLES = int(os.getenv("CANDLE_RESAMPLE_BASE_CANDLES", 2000))
+CANDLE_RESAMPLE_MAX_BASE_ROWS = int(os.getenv("CANDLE_RESAMPLE_MAX_BASE_ROWS", 20000))
+
+# Historical candles are kept on disk (Parquet, one file per month) so they are only downloaded once,
+# across sessions and restarts. Needs pyarrow or fastparquet
+CANDLE_ARCHIVE_ENABLED = os.getenv("CANDLE_ARCHIVE_ENABLED", "True").lower() in ("true", "1", "t")
+CANDLE_ARCHIVE_PATH = os.getenv("CANDLE_ARCHIVE_PATH", "data/candles/archive")
@@ -0,0 +1,61 @@
+import argparse
+import time
+
+from benchmarks.fake_backend.fixtures import Scale, SyntheticBackend
+from benchmarks.fake_backend.server import Latency, serve
+
+
+def _router_latency(value: str):
+    router, _, ms = value.partition("=")
+    if not ms:
+        raise argparse.ArgumentTypeError("expected ROUTER=MS, e.g. market-data=150")
+    return router, float(ms)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.fake_backend",
+        description="Serve synthetic Hummingbot API data so the dashboard can be benchmarked without a backend or Docker.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every response")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Uniform random delay added on top of --latency-ms")
+    parser.add_argument(
+        "--router-latency",
+        type=_router_latency,
+        action="append",
+        default=[],
+        metavar="ROUTER=MS",
+        help="Per-router delay overriding --latency-ms, keyed by the first path segment (e.g. market-data=150); repeatable",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+
+    scale = parser.add_argument_group("scale")
+    defaults = Scale()
+    for name, value in defaults.to_dict().items():
+        scale.add_argument(f"--{name.replace('_', '-')}", type=int, default=value, dest=f"scale_{name}")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scale = Scale(**{name[len("scale_"):]: value for name, value in vars(args).items() if name.startswith("scale_")})
+    started = time.perf_counter()
+    backend = SyntheticBackend(scale)
+    latency = Latency(args.latency_ms, args.jitter_ms, dict(args.router_latency))
+    server = serve(args.host, args.port, backend, latency, args.verbose)
+    host, port = server.server_address[:2]
+    print(f"Generated fixtures in {time.perf_counter() - started:.1f}s: {scale.to_dict()}")
+    print(f"Fake Hummingbot API listening on {server.url}")
+    print(f"Point the dashboard at it with BACKEND_API_HOST={host} BACKEND_API_PORT={port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,986 @@
+import datetime
+import json
+import math
+import threading
+import time
+import zlib
+from typing import List, Optional, Tuple
+
+CONNECTORS = ["binance", "binance_perpetual", "kucoin", "okx", "okx_perpetual", "gate_io", "hyperliquid_perpetual"]
+
+# Trading pairs and the price level their synthetic series oscillates around
+TRADING_PAIRS = {
+    "BTC-USDT": 65000.0,
+    "ETH-USDT": 3200.0,
+    "SOL-USDT": 150.0,
+    "BNB-USDT": 580.0,
+    "XRP-USDT": 0.55,
+    "DOGE-USDT": 0.12,
+    "AVAX-USDT": 28.0,
+    "LINK-USDT": 14.0,
+    "ARB-USDT": 0.85,
+    "WLD-USDT": 2.4,
+}
+
+CONTROLLERS = {
+    "directional_trading": ["bollinger_v1", "macd_bb_v1", "supertrend_v1", "kalman_filter_v1"],
+    "market_making": ["pmm_simple", "pmm_dynamic", "dman_maker_v2"],
+    "generic": ["grid_strike", "xemm_controller", "assignment_manager_v1"],
+}
+
+INTERVAL_SECONDS = {"1s": 1, "1m": 60, "3m": 180, "5m": 300, "15m": 900, "30m": 1800, "1h": 3600, "4h": 14400, "1d": 86400}
+
+CLOSE_TYPES = ["TAKE_PROFIT", "STOP_LOSS", "TIME_LIMIT", "TRAILING_STOP", "EARLY_STOP", "FAILED"]
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(value: int) -> int:
+    """splitmix64 finaliser: cheap, stateless and well distributed."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+def noise(*parts) -> float:
+    """Deterministic pseudo-random number in [0, 1) for the given ints/strings."""
+    value = 0
+    for part in parts:
+        if isinstance(part, str):
+            part = zlib.crc32(part.encode())
+        value = _mix(value ^ (int(part) & _MASK))
+    return value / 2**64
+
+
+def _short_id(db_path: str) -> str:
+    return f"{zlib.crc32(db_path.encode()):08x}"
+
+
+def _iso(timestamp: float) -> str:
+    return datetime.datetime.fromtimestamp(timestamp, tz=datetime.timezone.utc).isoformat()
+
+
+class Scale:
+    """How much synthetic data the fake backend serves."""
+
+    def __init__(
+        self,
+        accounts: int = 5,
+        bots: int = 50,
+        controllers_per_bot: int = 3,
+        log_lines: int = 50,
+        configs: int = 200,
+        trades: int = 10_000,
+        orders: int = 5_000,
+        active_orders: int = 100,
+        positions: int = 20,
+        archived_bots: int = 20,
+        archived_trades: int = 2_000,
+        history_days: int = 30,
+        seed: int = 42,
+    ):
+        self.accounts = accounts
+        self.bots = bots
+        self.controllers_per_bot = controllers_per_bot
+        self.log_lines = log_lines
+        self.configs = configs
+        self.trades = trades
+        self.orders = orders
+        self.active_orders = active_orders
+        self.positions = positions
+        self.archived_bots = archived_bots
+        self.archived_trades = archived_trades
+        self.history_days = history_days
+        self.seed = seed
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class SyntheticBackend:
+    """Deterministic stand-in for the Hummingbot API state.
+
+    Small collections (accounts, configs, bots, open orders, positions) live in memory so writes
+    from the dashboard are reflected on the next read. Large ones (trade and order history, candles,
+    archived trades) are computed from their index on demand, so a million trades cost no memory.
+    """
+
+    def __init__(self, scale: Optional[Scale] = None):
+        self.scale = scale or Scale()
+        self.seed = self.scale.seed
+        # Every history is anchored here so paging through it is stable while the server runs
+        self.anchor = float(int(time.time()))
+        self._lock = threading.Lock()
+        self._order_counter = 0
+
+        self.accounts = ["master_account"] + [f"account_{i}" for i in range(1, self.scale.accounts)]
+        self.credentials = {
+            account: [c for j, c in enumerate(CONNECTORS) if j == 0 or noise(self.seed, account, c) < 0.5]
+            for account in self.accounts
+        }
+        self.controller_configs = {config["id"]: config for config in (self._controller_config(i) for i in range(self.scale.configs))}
+        self.bots = {}
+        for i in range(self.scale.bots):
+            name = f"hummingbot-bot_{i:04d}"
+            self.bots[name] = {
+                "status": "running" if noise(self.seed, name, "running") < 0.85 else "stopped",
+                "deployed_at": self.anchor - noise(self.seed, name, "age") * 14 * 86400,
+                "controllers": [
+                    self._controller_config(self.scale.configs + i * self.scale.controllers_per_bot + j)
+                    for j in range(self.scale.controllers_per_bot)
+                ],
+            }
+        self.active_orders = [self._active_order(i) for i in range(self.scale.active_orders)]
+        self.positions = [self._position(i) for i in range(self.scale.positions)]
+        self.databases = [self._database_path(i) for i in range(self.scale.archived_bots)]
+
+    # Market data ----------------------------------------------------------------------------------
+
+    def price(self, trading_pair: str, timestamp: float) -> float:
+        base = TRADING_PAIRS.get(trading_pair, 1.0 + 99 * noise(self.seed, trading_pair))
+        phase = noise(self.seed, trading_pair, "phase") * 2 * math.pi
+        drift = 0.06 * math.sin(2 * math.pi * timestamp / (9 * 86400) + phase)
+        swing = 0.012 * math.sin(2 * math.pi * timestamp / 5400 + 2 * phase)
+        wiggle = 0.002 * (noise(self.seed, trading_pair, int(timestamp)) - 0.5)
+        return base * (1 + drift + swing + wiggle)
+
+    def candle(self, trading_pair: str, interval_seconds: int, timestamp: int) -> dict:
+        open_price = self.price(trading_pair, timestamp)
+        close_price = self.price(trading_pair, timestamp + interval_seconds)
+        spread = 0.0015 * math.sqrt(interval_seconds / 60)
+        high = max(open_price, close_price) * (1 + spread * noise(self.seed, trading_pair, timestamp, "high"))
+        low = min(open_price, close_price) * (1 - spread * noise(self.seed, trading_pair, timestamp, "low"))
+        volume = (interval_seconds / 60) * (5 + 20 * noise(self.seed, trading_pair, timestamp, "volume")) * 1000 / math.sqrt(open_price)
+        return {
+            "timestamp": timestamp,
+            "open": open_price,
+            "high": high,
+            "low": low,
+            "close": close_price,
+            "volume": volume,
+            "quote_asset_volume": volume * close_price,
+            "n_trades": int(10 + 500 * noise(self.seed, trading_pair, timestamp, "n")),
+            "taker_buy_base_volume": volume * 0.5,
+            "taker_buy_quote_volume": volume * close_price * 0.5,
+        }
+
+    def candles(self, trading_pair: str, interval: str, start_time: int, end_time: int) -> List[dict]:
+        step = INTERVAL_SECONDS.get(interval, 60)
+        first = int(start_time) - int(start_time) % step
+        return [self.candle(trading_pair, step, ts) for ts in range(first, int(end_time) + 1, step)]
+
+    def last_candles(self, trading_pair: str, interval: str, max_records: int) -> List[dict]:
+        step = INTERVAL_SECONDS.get(interval, 60)
+        now = int(time.time())
+        last = now - now % step
+        return self.candles(trading_pair, interval, last - (max_records - 1) * step, last)
+
+    def order_book(self, trading_pair: str, depth: int) -> dict:
+        now = time.time()
+        mid = self.price(trading_pair, now)
+        tick = mid * 0.0001
+        second = int(now)
+        bids = []
+        asks = []
+        for level in range(depth):
+            bids.append({"price": mid - tick * (level + 1), "amount": self._level_amount(trading_pair, mid, second, "bid", level)})
+            asks.append({"price": mid + tick * (level + 1), "amount": self._level_amount(trading_pair, mid, second, "ask", level)})
+        return {"trading_pair": trading_pair, "bids": bids, "asks": asks, "update_id": second, "timestamp": now}
+
+    def _level_amount(self, trading_pair: str, mid: float, second: int, side: str, level: int) -> float:
+        return (200 + 4000 * noise(self.seed, trading_pair, second, side, level)) * (1 + level / 10) / mid
+
+    def quote_volume_for_price(self, trading_pair: str, price: float, is_buy: bool) -> dict:
+        book = self.order_book(trading_pair, 100)
+        levels = book["asks"] if is_buy else book["bids"]
+        crossed = [lvl for lvl in levels if (lvl["price"] <= price if is_buy else lvl["price"] >= price)]
+        return {
+            "trading_pair": trading_pair,
+            "price": price,
+            "is_buy": is_buy,
+            "result_volume": sum(lvl["amount"] for lvl in crossed),
+            "result_quote_volume": sum(lvl["amount"] * lvl["price"] for lvl in crossed),
+            "timestamp": book["timestamp"],
+        }
+
+    def prices(self, connector_name: str, trading_pairs: List[str]) -> dict:
+        now = time.time()
+        return {"connector": connector_name, "prices": {pair: self.price(pair, now) for pair in trading_pairs}, "timestamp": now}
+
+    def funding_info(self, trading_pair: str) -> dict:
+        now = time.time()
+        mark = self.price(trading_pair, now)
+        return {
+            "trading_pair": trading_pair,
+            "funding_rate": 0.0001 * (noise(self.seed, trading_pair, int(now // 3600)) * 2 - 0.5),
+            "next_funding_time": (int(now) // 28800 + 1) * 28800,
+            "mark_price": mark,
+            "index_price": mark * (1 - 0.0002),
+        }
+
+    # Accounts, portfolio ------------------------------------------------------------------------
+
+    def add_account(self, account_name: str) -> dict:
+        with self._lock:
+            if account_name in self.credentials:
+                raise ValueError(f"Account {account_name} already exists")
+            self.accounts.append(account_name)
+            self.credentials[account_name] = []
+        return {"message": "Account added successfully."}
+
+    def delete_account(self, account_name: str) -> dict:
+        with self._lock:
+            if account_name not in self.credentials:
+                raise KeyError(f"Account {account_name} not found")
+            self.accounts.remove(account_name)
+            del self.credentials[account_name]
+        return {"message": "Account deleted successfully."}
+
+    def add_credential(self, account_name: str, connector_name: str) -> dict:
+        with self._lock:
+            credentials = self.credentials.setdefault(account_name, [])
+            if connector_name not in credentials:
+                credentials.append(connector_name)
+        return {"message": "Connector credentials added successfully."}
+
+    def delete_credential(self, account_name: str, connector_name: str) -> dict:
+        with self._lock:
+            if connector_name not in self.credentials.get(account_name, []):
+                raise KeyError(f"Credential {connector_name} not found for {account_name}")
+            self.credentials[account_name].remove(connector_name)
+        return {"message": "Credential deleted successfully."}
+
+    def _token_balances(self, account: str, connector: str, timestamp: float) -> List[dict]:
+        balances = []
+        for pair in list(TRADING_PAIRS)[:6]:
+            token = pair.split("-")[0]
+            if noise(self.seed, account, connector, token) > 0.6:
+                continue
+            units = 1000 * noise(self.seed, account, connector, token, "units") / math.sqrt(TRADING_PAIRS[pair])
+            price = self.price(pair, timestamp)
+            balances.append(self._balance(token, units, price, account, connector))
+        stable_units = 500 + 50_000 * noise(self.seed, account, connector, "USDT")
+        balances.append(self._balance("USDT", stable_units, 1.0, account, connector))
+        return balances
+
+    def _balance(self, token: str, units: float, price: float, account: str, connector: str) -> dict:
+        return {
+            "token": token,
+            "units": units,
+            "available_units": units * (0.6 + 0.4 * noise(self.seed, account, connector, token, "free")),
+            "price": price,
+            "value": units * price,
+        }
+
+    def portfolio_state(self, account_names=None, connector_names=None, timestamp: Optional[float] = None) -> dict:
+        timestamp = time.time() if timestamp is None else timestamp
+        state = {}
+        for account in account_names or self.accounts:
+            if account not in self.credentials:
+                continue
+            state[account] = {
+                connector: self._token_balances(account, connector, timestamp)
+                for connector in self.credentials[account]
+                if not connector_names or connector in connector_names
+            }
+        return state
+
+    def portfolio_history(
+        self, account_names=None, connector_names=None, limit=100, cursor=None, start_time=None, end_time=None, interval=None
+    ) -> dict:
+        step = INTERVAL_SECONDS.get(interval or "5m", 300)
+        latest = self.anchor - self.anchor % step
+        earliest = max(start_time or 0, self.anchor - self.scale.history_days * 86400)
+        if end_time:
+            latest = min(latest, end_time - end_time % step)
+        index = int(cursor or 0)
+        records = []
+        while len(records) < limit:
+            timestamp = latest - index * step
+            if timestamp < earliest:
+                break
+            records.append({"timestamp": _iso(timestamp), "state": self.portfolio_state(account_names, connector_names, timestamp)})
+            index += 1
+        has_more = latest - index * step >= earliest
+        return {"data": records, "pagination": {"limit": limit, "has_more": has_more, "next_cursor": str(index) if has_more else None}}
+
+    # Trading ------------------------------------------------------------------------------------
+
+    def _position(self, i: int) -> dict:
+        account = self.accounts[i % len(self.accounts)]
+        connector = [c for c in CONNECTORS if c.endswith("_perpetual")][i % 3]
+        pair = list(TRADING_PAIRS)[i % len(TRADING_PAIRS)]
+        entry = self.price(pair, self.anchor - 3600 * (1 + i))
+        side = "LONG" if noise(self.seed, "position", i) < 0.6 else "SHORT"
+        amount = (100 + 5000 * noise(self.seed, "position", i, "size")) / entry
+        mark = self.price(pair, self.anchor)
+        return {
+            "account_name": account,
+            "connector_name": connector,
+            "trading_pair": pair,
+            "side": side,
+            "amount": amount if side == "LONG" else -amount,
+            "entry_price": entry,
+            "mark_price": mark,
+            "unrealized_pnl": (mark - entry) * amount * (1 if side == "LONG" else -1),
+            "leverage": int(1 + 19 * noise(self.seed, "position", i, "lev")),
+            "position_side": "BOTH",
+            "timestamp": self.anchor - 3600 * (1 + i),
+        }
+
+    def _next_order_id(self) -> str:
+        with self._lock:
+            self._order_counter += 1
+            return f"fake-{int(time.time() * 1000)}-{self._order_counter}"
+
+    def _active_order(self, i: int) -> dict:
+        account = self.accounts[i % len(self.accounts)]
+        connector = CONNECTORS[i % len(CONNECTORS)]
+        pair = list(TRADING_PAIRS)[i % len(TRADING_PAIRS)]
+        side = "BUY" if noise(self.seed, "active", i) < 0.5 else "SELL"
+        mid = self.price(pair, self.anchor)
+        offset = 0.001 + 0.02 * noise(self.seed, "active", i, "offset")
+        created = self.anchor - 60 * i
+        return {
+            "client_order_id": f"active-{i:06d}",
+            "exchange_order_id": str(10_000_000 + i),
+            "account_name": account,
+            "connector_name": connector,
+            "trading_pair": pair,
+            "trade_type": side,
+            "order_type": "LIMIT",
+            "amount": (50 + 1000 * noise(self.seed, "active", i, "size")) / mid,
+            "price": mid * (1 - offset if side == "BUY" else 1 + offset),
+            "filled_amount": 0.0,
+            "status": "OPEN",
+            "created_at": _iso(created),
+            "timestamp": created,
+        }
+
+    def _history_row(self, kind: str, i: int, total: int) -> dict:
+        """Trade/order number ``i`` of ``total``, newest first, spread over the configured history."""
+        account = self.accounts[i % len(self.accounts)]
+        connector = CONNECTORS[(i // len(self.accounts)) % len(CONNECTORS)]
+        pair = list(TRADING_PAIRS)[(i // 7) % len(TRADING_PAIRS)]
+        timestamp = self.anchor - (i + 1) * (self.scale.history_days * 86400 / max(total, 1))
+        price = self.price(pair, timestamp)
+        side = "BUY" if noise(self.seed, kind, i) < 0.5 else "SELL"
+        amount = (20 + 2000 * noise(self.seed, kind, i, "size")) / price
+        row = {
+            "account_name": account,
+            "connector_name": connector,
+            "trading_pair": pair,
+            "trade_type": side,
+            "price": price,
+            "amount": amount,
+            "timestamp": timestamp,
+        }
+        if kind == "trade":
+            row.update(
+                {
+                    "trade_id": f"trade-{i:08d}",
+                    "client_order_id": f"order-{i // 2:08d}",
+                    "order_type": "MARKET" if i % 3 == 0 else "LIMIT",
+                    "fee_paid": amount * price * 0.0004,
+                    "fee_currency": "USDT",
+                }
+            )
+        else:
+            status = "FILLED" if noise(self.seed, kind, i, "status") < 0.7 else "CANCELED"
+            row.update(
+                {
+                    "client_order_id": f"order-{i:08d}",
+                    "order_type": "MARKET" if i % 3 == 0 else "LIMIT",
+                    "status": status,
+                    "filled_amount": amount if status == "FILLED" else 0.0,
+                    "avg_price": price if status == "FILLED" else 0.0,
+                    "created_at": _iso(timestamp),
+                }
+            )
+        return row
+
+    def _history_row_keys(self, i: int) -> Tuple[str, str, str]:
+        return (
+            self.accounts[i % len(self.accounts)],
+            CONNECTORS[(i // len(self.accounts)) % len(CONNECTORS)],
+            list(TRADING_PAIRS)[(i // 7) % len(TRADING_PAIRS)],
+        )
+
+    def _history_page(self, kind: str, total: int, filters: dict) -> dict:
+        """Cursor pagination over the index-generated history; filters are checked before a row is built."""
+        limit = int(filters.get("limit") or 50)
+        index = int(filters.get("cursor") or 0)
+        accounts = set(filters.get("account_names") or [])
+        connectors = set(filters.get("connector_names") or [])
+        pairs = set(filters.get("trading_pairs") or [])
+        trade_types = set(filters.get("trade_types") or [])
+        status = filters.get("status")
+        start_time = filters.get("start_time")
+        end_time = filters.get("end_time")
+        spacing = self.scale.history_days * 86400 / max(total, 1)
+        if end_time:
+            # Skip straight to the first row inside the window rather than scanning towards it
+            index = max(index, int((self.anchor - end_time) / spacing) - 1)
+
+        rows = []
+        while index < total and len(rows) < limit:
+            i = index
+            index += 1
+            if start_time and self.anchor - (i + 1) * spacing < start_time:
+                index = total
+                break
+            account, connector, pair = self._history_row_keys(i)
+            if (accounts and account not in accounts) or (connectors and connector not in connectors) or (pairs and pair not in pairs):
+                continue
+            row = self._history_row(kind, i, total)
+            if (trade_types and row["trade_type"] not in trade_types) or (status and row.get("status") != status):
+                continue
+            if end_time and row["timestamp"] > end_time:
+                continue
+            rows.append(row)
+        has_more = index < total
+        return {"data": rows, "pagination": {"limit": limit, "has_more": has_more, "next_cursor": str(index) if has_more else None}}
+
+    def trades(self, filters: dict) -> dict:
+        return self._history_page("trade", self.scale.trades, filters)
+
+    def search_orders(self, filters: dict) -> dict:
+        return self._history_page("order", self.scale.orders, filters)
+
+    def _paginate(self, rows: List[dict], filters: dict) -> dict:
+        accounts = set(filters.get("account_names") or [])
+        connectors = set(filters.get("connector_names") or [])
+        pairs = set(filters.get("trading_pairs") or [])
+        rows = [
+            row
+            for row in rows
+            if (not accounts or row["account_name"] in accounts)
+            and (not connectors or row["connector_name"] in connectors)
+            and (not pairs or row["trading_pair"] in pairs)
+        ]
+        limit = int(filters.get("limit") or 50)
+        start = int(filters.get("cursor") or 0)
+        has_more = start + limit < len(rows)
+        return {
+            "data": rows[start:start + limit],
+            "pagination": {
+                "limit": limit,
+                "has_more": has_more,
+                "next_cursor": str(start + limit) if has_more else None,
+                "total_count": len(rows),
+            },
+        }
+
+    def get_positions(self, filters: dict) -> dict:
+        with self._lock:
+            return self._paginate(list(self.positions), filters)
+
+    def get_active_orders(self, filters: dict) -> dict:
+        with self._lock:
+            return self._paginate(list(self.active_orders), filters)
+
+    def place_order(self, request: dict) -> dict:
+        order_id = self._next_order_id()
+        if request.get("order_type", "MARKET") != "MARKET":
+            order = {
+                "client_order_id": order_id,
+                "exchange_order_id": order_id,
+                "account_name": request["account_name"],
+                "connector_name": request["connector_name"],
+                "trading_pair": request["trading_pair"],
+                "trade_type": request["trade_type"],
+                "order_type": request["order_type"],
+                "amount": request["amount"],
+                "price": request.get("price"),
+                "filled_amount": 0.0,
+                "status": "OPEN",
+                "created_at": _iso(time.time()),
+                "timestamp": time.time(),
+            }
+            with self._lock:
+                self.active_orders.insert(0, order)
+        return {"status": "submitted", "order_id": order_id, **{k: request.get(k) for k in ("account_name", "connector_name", "trading_pair")}}
+
+    def cancel_order(self, account_name: str, connector_name: str, client_order_id: str) -> dict:
+        with self._lock:
+            before = len(self.active_orders)
+            self.active_orders = [
+                order
+                for order in self.active_orders
+                if not (
+                    order["client_order_id"] == client_order_id
+                    and order["account_name"] == account_name
+                    and order["connector_name"] == connector_name
+                )
+            ]
+            found = len(self.active_orders) < before
+        if not found:
+            return {"status": "error", "message": f"Order {client_order_id} not found"}
+        return {"status": "success", "client_order_id": client_order_id, "message": "Order cancellation submitted"}
+
+    # Controllers, bots --------------------------------------------------------------------------
+
+    def _controller_config(self, i: int) -> dict:
+        controller_types = list(CONTROLLERS)
+        controller_type = controller_types[i % len(controller_types)]
+        controller_name = CONTROLLERS[controller_type][(i // len(controller_types)) % len(CONTROLLERS[controller_type])]
+        pair = list(TRADING_PAIRS)[i % len(TRADING_PAIRS)]
+        connector = CONNECTORS[(i // 3) % len(CONNECTORS)]
+        return {
+            "id": f"{controller_name}_{pair.split('-')[0].lower()}_{i:05d}",
+            "controller_name": controller_name,
+            "controller_type": controller_type,
+            "connector_name": connector,
+            "trading_pair": pair,
+            "total_amount_quote": float(100 * (1 + int(50 * noise(self.seed, "config", i)))),
+            "leverage": 1 if "perpetual" not in connector else 10,
+            "manual_kill_switch": False,
+            "candles_config": [],
+            "stop_loss": 0.03,
+            "take_profit": 0.02,
+            "time_limit": 2700,
+        }
+
+    def list_controllers(self) -> dict:
+        return {controller_type: list(names) for controller_type, names in CONTROLLERS.items()}
+
+    def list_controller_configs(self) -> List[dict]:
+        with self._lock:
+            return list(self.controller_configs.values())
+
+    def save_controller_config(self, config_name: str, config: dict) -> dict:
+        with self._lock:
+            self.controller_configs[config_name] = {**config, "id": config_name}
+        return {"message": f"Configuration '{config_name}' saved successfully"}
+
+    def delete_controller_config(self, config_name: str) -> dict:
+        with self._lock:
+            if self.controller_configs.pop(config_name, None) is None:
+                raise KeyError(f"Configuration '{config_name}' not found")
+        return {"message": f"Configuration '{config_name}' deleted successfully"}
+
+    def _controller_performance(self, bot_name: str, controller_id: str) -> dict:
+        # Grows with uptime so polling pages see the numbers move
+        minutes = int(time.time() // 60)
+        volume = 10_000 * noise(self.seed, bot_name, controller_id, "volume") * (1 + (minutes % 1440) / 1440)
+        realized = volume * 0.002 * (noise(self.seed, bot_name, controller_id, "realized") - 0.4)
+        unrealized = volume * 0.001 * (noise(self.seed, bot_name, controller_id, minutes) - 0.5)
+        return {
+            "realized_pnl_quote": realized,
+            "unrealized_pnl_quote": unrealized,
+            "global_pnl_quote": realized + unrealized,
+            "global_pnl_pct": (realized + unrealized) / volume if volume else 0.0,
+            "volume_traded": volume,
+            "close_type_counts": {
+                f"CloseType.{close_type}": int(20 * noise(self.seed, bot_name, controller_id, close_type)) for close_type in CLOSE_TYPES
+            },
+        }
+
+    def _logs(self, bot_name: str, level: str, count: int) -> List[dict]:
+        now = time.time()
+        return [
+            {
+                "level_name": level,
+                "msg": f"{'Order filled' if level == 'INFO' else 'Request timed out'} ({bot_name} #{j})",
+                "timestamp": now - (count - j) * 5,
+                "logger_name": "hummingbot.strategy_v2.executors.position_executor" if level == "INFO" else "hummingbot.connector.exchange_base",
+            }
+            for j in range(count)
+        ]
+
+    def active_bots_status(self) -> dict:
+        with self._lock:
+            bots = dict(self.bots)
+        return {
+            "status": "success",
+            "data": {
+                name: {"bot_name": name, "status": bot["status"], "recently_active": bot["status"] == "running"} for name, bot in bots.items()
+            },
+        }
+
+    def bot_status(self, bot_name: str) -> dict:
+        with self._lock:
+            bot = self.bots.get(bot_name)
+        if bot is None:
+            return {"status": "error", "message": f"Bot {bot_name} not found"}
+        running = bot["status"] == "running"
+        performance = {}
+        for config in bot["controllers"]:
+            if noise(self.seed, bot_name, config["id"], "error") < 0.03:
+                performance[config["id"]] = {"status": "error", "error": "Controller crashed: insufficient balance"}
+            else:
+                performance[config["id"]] = {"status": "running", "performance": self._controller_performance(bot_name, config["id"])}
+        return {
+            "status": "success",
+            "data": {
+                "status": bot["status"],
+                "performance": performance if running else {},
+                "error_logs": self._logs(bot_name, "ERROR", max(1, self.scale.log_lines // 10)),
+                "general_logs": self._logs(bot_name, "INFO", self.scale.log_lines),
+                "recently_active": running,
+            },
+        }
+
+    def bot_controller_configs(self, bot_name: str) -> List[dict]:
+        with self._lock:
+            bot = self.bots.get(bot_name)
+            return [dict(config) for config in bot["controllers"]] if bot else []
+
+    def update_bot_controller_config(self, bot_name: str, controller_name: str, config: dict) -> dict:
+        with self._lock:
+            bot = self.bots.get(bot_name)
+            if bot is None:
+                raise KeyError(f"Bot {bot_name} not found")
+            for controller in bot["controllers"]:
+                if controller["id"] == controller_name:
+                    controller.update(config)
+                    return {"status": "success", "message": f"Controller {controller_name} updated"}
+        raise KeyError(f"Controller {controller_name} not found in {bot_name}")
+
+    def deploy_v2_controllers(self, request: dict) -> dict:
+        name = f"hummingbot-{request['instance_name']}"
+        with self._lock:
+            controllers = [
+                {**self.controller_configs[config_name.replace(".yml", "")]}
+                for config_name in request.get("controllers_config", [])
+                if config_name.replace(".yml", "") in self.controller_configs
+            ]
+            self.bots[name] = {"status": "running", "deployed_at": time.time(), "controllers": controllers}
+        return {"success": True, "message": f"Instance {name} created successfully.", "unique_instance_name": name}
+
+    def stop_bot(self, bot_name: str) -> dict:
+        with self._lock:
+            bot = self.bots.get(bot_name)
+            if bot is None:
+                raise KeyError(f"Bot {bot_name} not found")
+            bot["status"] = "stopped"
+        return {"status": "success", "message": f"Stop-and-archive started for {bot_name}"}
+
+    def remove_bot(self, bot_name: str) -> dict:
+        with self._lock:
+            bot = self.bots.pop(bot_name, None)
+            if bot is not None:
+                self.databases.insert(0, self._database_path(len(self.databases), bot_name.replace("hummingbot-", "")))
+        if bot is None:
+            raise KeyError(f"Container {bot_name} not found")
+        return {"success": True, "message": f"Container {bot_name} removed"}
+
+    # Archived bots, bot runs --------------------------------------------------------------------
+
+    def _database_path(self, i: int, bot_name: Optional[str] = None) -> str:
+        bot_name = bot_name or f"archived_bot_{i:04d}"
+        started = datetime.datetime.fromtimestamp(self.anchor - (i + 1) * 86400, tz=datetime.timezone.utc)
+        folder = f"{bot_name}-{started:%Y%m%d-%H%M}"
+        return f"bots/archived/{folder}/data/{folder}-{started:%Y%m%d-%H%M%S}.sqlite"
+
+    def _database_index(self, db_path: str) -> int:
+        return zlib.crc32(db_path.encode())
+
+    def database_status(self, db_path: str) -> dict:
+        healthy = noise(self.seed, db_path, "healthy") > 0.05
+        return {
+            "db_path": db_path,
+            "healthy": healthy,
+            "status": {
+                "general_status": healthy,
+                "trade_fill": healthy,
+                "orders": healthy,
+                "order_status": True,
+                "executors": healthy,
+                "positions": True,
+                "controllers": True,
+            },
+        }
+
+    def _database_window(self, db_path: str) -> Tuple[float, float, str, str]:
+        idx = self._database_index(db_path)
+        end = self.anchor - (idx % 90) * 86400
+        start = end - (1 + idx % 5) * 86400
+        connector = CONNECTORS[idx % len(CONNECTORS)]
+        pair = list(TRADING_PAIRS)[idx % len(TRADING_PAIRS)]
+        return start, end, connector, pair
+
+    def _archived_trade(self, db_path: str, i: int) -> dict:
+        start, end, connector, pair = self._database_window(db_path)
+        timestamp = start + (i + 0.5) * (end - start) / self.scale.archived_trades
+        price = self.price(pair, timestamp)
+        amount = (20 + 500 * noise(self.seed, db_path, i)) / price
+        return {
+            "trade_id": f"{i:08d}",
+            "config_file_path": "conf_v2.yml",
+            "strategy": "v2_with_controllers",
+            "connector_name": connector,
+            "trading_pair": pair,
+            "base_asset": pair.split("-")[0],
+            "quote_asset": pair.split("-")[1],
+            "timestamp": int(timestamp * 1000),
+            "order_id": f"order-{i // 2:08d}",
+            "trade_type": "BUY" if noise(self.seed, db_path, i, "side") < 0.5 else "SELL",
+            "order_type": "LIMIT",
+            "price": price,
+            "amount": amount,
+            "trade_fee_in_quote": amount * price * 0.0004,
+            "exchange_trade_id": f"{_short_id(db_path)}-{i}",
+        }
+
+    def database_summary(self, db_path: str) -> dict:
+        start, end, connector, pair = self._database_window(db_path)
+        volume = sum(t["amount"] * t["price"] for t in (self._archived_trade(db_path, i) for i in range(0, self.scale.archived_trades, 97))) * 97
+        realized = volume * 0.001 * (noise(self.seed, db_path, "pnl") - 0.4)
+        return {
+            "db_path": db_path,
+            "total_trades": self.scale.archived_trades,
+            "total_orders": self.scale.archived_trades // 2,
+            "exchanges": [connector],
+            "trading_pairs": [pair],
+            "start_time": start,
+            "end_time": end,
+            "total_volume_quote": volume,
+            "total_fees_quote": volume * 0.0004,
+            "final_realized_pnl_quote": realized,
+            "final_net_pnl_quote": realized - volume * 0.0004,
+        }
+
+    def database_performance(self, db_path: str) -> dict:
+        trades = [self._archived_trade(db_path, i) for i in range(self.scale.archived_trades)]
+        rows = []
+        realized = 0.0
+        net_position = 0.0
+        fees = 0.0
+        buy_cost = buy_amount = sell_cost = sell_amount = 0.0
+        for trade in trades:
+            signed = trade["amount"] if trade["trade_type"] == "BUY" else -trade["amount"]
+            fee = trade["trade_fee_in_quote"]
+            fees += fee
+            net_position += signed
+            if signed > 0:
+                buy_cost += trade["amount"] * trade["price"]
+                buy_amount += trade["amount"]
+            else:
+                sell_cost += trade["amount"] * trade["price"]
+                sell_amount += trade["amount"]
+            buy_avg = buy_cost / buy_amount if buy_amount else 0.0
+            sell_avg = sell_cost / sell_amount if sell_amount else 0.0
+            step_realized = (sell_avg - buy_avg) * min(trade["amount"], buy_amount, sell_amount) if buy_avg and sell_avg else 0.0
+            realized += step_realized
+            unrealized = net_position * (trade["price"] - (buy_avg if net_position > 0 else sell_avg or trade["price"]))
+            rows.append(
+                {
+                    "timestamp": trade["timestamp"],
+                    "price": trade["price"],
+                    "amount": trade["amount"],
+                    "trade_type": trade["trade_type"],
+                    "net_position": net_position,
+                    "buy_avg_price": buy_avg,
+                    "sell_avg_price": sell_avg,
+                    "realized_trade_pnl_quote": step_realized,
+                    "unrealized_trade_pnl_quote": unrealized,
+                    "fees_quote": fee,
+                    "net_pnl_quote": realized + unrealized - fees,
+                }
+            )
+        return {"db_path": db_path, "performance_data": rows}
+
+    def database_trades(self, db_path: str, limit: int, offset: int) -> dict:
+        end = min(offset + limit, self.scale.archived_trades)
+        trades = [self._archived_trade(db_path, i) for i in range(offset, end)]
+        return {"db_path": db_path, "trades": trades, "total": self.scale.archived_trades, "limit": limit, "offset": offset}
+
+    def database_orders(self, db_path: str, limit: int, offset: int, status: Optional[str] = None) -> dict:
+        total = self.scale.archived_trades // 2
+        orders = []
+        for i in range(offset, min(offset + limit, total)):
+            trade = self._archived_trade(db_path, i * 2)
+            order = {
+                "client_order_id": trade["order_id"],
+                "connector_name": trade["connector_name"],
+                "trading_pair": trade["trading_pair"],
+                "trade_type": trade["trade_type"],
+                "order_type": trade["order_type"],
+                "amount": trade["amount"] * 2,
+                "price": trade["price"],
+                "creation_timestamp": trade["timestamp"],
+                "last_status": "FILLED",
+            }
+            if status and order["last_status"] != status:
+                continue
+            orders.append(order)
+        return {"db_path": db_path, "orders": orders, "total": total, "limit": limit, "offset": offset}
+
+    def database_positions(self, db_path: str, limit: int, offset: int) -> dict:
+        start, end, connector, pair = self._database_window(db_path)
+        total = 10
+        positions = [
+            {
+                "connector_name": connector,
+                "trading_pair": pair,
+                "timestamp": int((start + (i + 1) * (end - start) / (total + 1)) * 1000),
+                "volume_traded_quote": 1000 * noise(self.seed, db_path, "position", i),
+                "amount": noise(self.seed, db_path, "position", i, "amount"),
+                "breakeven_price": self.price(pair, start + i * 3600),
+                "unrealized_pnl_quote": 10 * (noise(self.seed, db_path, "position", i, "pnl") - 0.5),
+                "cum_fees_quote": 0.4 * noise(self.seed, db_path, "position", i),
+                "side": "BUY" if i % 2 == 0 else "SELL",
+            }
+            for i in range(offset, min(offset + limit, total))
+        ]
+        return {"db_path": db_path, "positions": positions, "total": total, "limit": limit, "offset": offset}
+
+    def database_executors(self, db_path: str) -> dict:
+        start, end, connector, pair = self._database_window(db_path)
+        count = max(1, self.scale.archived_trades // 20)
+        executors = []
+        for i in range(count):
+            opened = start + i * (end - start) / count
+            closed = opened + (end - start) / count * 0.8
+            entry = self.price(pair, opened)
+            exit_price = self.price(pair, closed)
+            side = 1 if noise(self.seed, db_path, "executor", i) < 0.5 else 2
+            filled = 100 + 900 * noise(self.seed, db_path, "executor", i, "filled")
+            pnl_pct = (exit_price / entry - 1) * (1 if side == 1 else -1)
+            executors.append(
+                {
+                    "id": f"{_short_id(db_path)}-executor-{i}",
+                    "type": "position_executor",
+                    "timestamp": opened,
+                    "close_timestamp": closed,
+                    "close_type": 1 + i % 6,
+                    "status": 4,
+                    "controller_id": f"controller_{_short_id(db_path)}",
+                    "net_pnl_pct": pnl_pct,
+                    "net_pnl_quote": pnl_pct * filled,
+                    "cum_fees_quote": filled * 0.0008,
+                    "filled_amount_quote": filled,
+                    "is_active": False,
+                    "is_trading": False,
+                    "config": {"connector_name": connector, "trading_pair": pair, "side": side, "amount": filled / entry},
+                    "custom_info": {"current_position_average_price": entry, "close_price": exit_price, "side": side},
+                }
+            )
+        return {"db_path": db_path, "executors": executors, "total": len(executors)}
+
+    def database_controllers(self, db_path: str) -> dict:
+        start, end, connector, pair = self._database_window(db_path)
+        config = self._controller_config(self._database_index(db_path) % 10_000)
+        config.update({"id": f"controller_{_short_id(db_path)}", "connector_name": connector, "trading_pair": pair})
+        controller = {"id": config["id"], "controller_id": config["id"], "timestamp": start, "type": config["controller_type"], "config": config}
+        return {"db_path": db_path, "controllers": [controller], "total": 1}
+
+    def bot_runs(self, params: dict) -> dict:
+        limit = int(params.get("limit", 100))
+        offset = int(params.get("offset", 0))
+        include_final_status = str(params.get("include_final_status", "false")).lower() == "true"
+        with self._lock:
+            databases = list(self.databases)
+            running = [name for name, bot in self.bots.items() if bot["status"] == "running"]
+        runs = []
+        for i, db_path in enumerate(databases):
+            start, end, connector, pair = self._database_window(db_path)
+            bot_name = db_path.split("/")[2]
+            run = {
+                "id": i + 1,
+                "bot_name": bot_name,
+                "instance_name": f"hummingbot-{bot_name}",
+                "account_name": self.accounts[i % len(self.accounts)],
+                "strategy_type": "controller",
+                "strategy_name": "v2_with_controllers",
+                "config_name": "conf_v2.yml",
+                "image_version": "hummingbot/hummingbot:latest",
+                "deployed_at": _iso(start),
+                "stopped_at": _iso(end),
+                "run_status": "STOPPED",
+                "deployment_status": "ARCHIVED",
+            }
+            if include_final_status:
+                controller_id = f"controller_{_short_id(db_path)}"
+                run["final_status"] = json.dumps(
+                    {"performance": {controller_id: {"status": "stopped", "performance": self._controller_performance(bot_name, controller_id)}}}
+                )
+            runs.append(run)
+        for j, name in enumerate(running):
+            runs.append(
+                {
+                    "id": len(databases) + j + 1,
+                    "bot_name": name.replace("hummingbot-", ""),
+                    "instance_name": name,
+                    "account_name": self.accounts[j % len(self.accounts)],
+                    "strategy_type": "controller",
+                    "strategy_name": "v2_with_controllers",
+                    "config_name": "conf_v2.yml",
+                    "image_version": "hummingbot/hummingbot:latest",
+                    "deployed_at": _iso(self.bots[name]["deployed_at"]),
+                    "stopped_at": None,
+                    "run_status": "RUNNING",
+                    "deployment_status": "DEPLOYED",
+                }
+            )
+        for field in ("bot_name", "account_name", "strategy_type", "strategy_name", "run_status", "deployment_status"):
+            if params.get(field):
+                runs = [run for run in runs if run.get(field) == params[field]]
+        return {"data": runs[offset:offset + limit], "total": len(runs), "limit": limit, "offset": offset}
+
+    # Backtesting ---------------------------------------------------------------------------------
+
+    def run_backtesting(self, request: dict) -> dict:
+        config = request.get("config") or {}
+        pair = config.get("trading_pair", "BTC-USDT")
+        resolution = request.get("backtesting_resolution", "1m")
+        start_time = int(request.get("start_time") or self.anchor - 86400)
+        end_time = int(request.get("end_time") or self.anchor)
+        candles = self.candles(pair, resolution, start_time, end_time)
+        step = max(1, len(candles) // 100)
+        executors = []
+        for i in range(0, max(len(candles) - step, 0), step):
+            entry, close = candles[i], candles[min(i + step // 2 + 1, len(candles) - 1)]
+            side = 1 if noise(self.seed, pair, entry["timestamp"], "bt") < 0.5 else 2
+            pnl_pct = (close["close"] / entry["close"] - 1) * (1 if side == 1 else -1) - request.get("trade_cost", 0.0006) * 2
+            filled = float(config.get("total_amount_quote", 1000)) / 10
+            executors.append(
+                {
+                    "id": f"bt-{i}",
+                    "timestamp": entry["timestamp"],
+                    "close_timestamp": close["timestamp"],
+                    "close_type": 3 if pnl_pct > 0 else 4,
+                    "net_pnl_pct": pnl_pct,
+                    "net_pnl_quote": pnl_pct * filled,
+                    "cum_fees_quote": filled * request.get("trade_cost", 0.0006) * 2,
+                    "filled_amount_quote": filled,
+                    "is_active": False,
+                    "config": {"trading_pair": pair, "side": side},
+                    "custom_info": {"current_position_average_price": entry["close"], "close_price": close["close"]},
+                }
+            )
+        pnl = [executor["net_pnl_quote"] for executor in executors]
+        wins = [p for p in pnl if p > 0]
+        longs = [e for e in executors if e["config"]["side"] == 1]
+        return {
+            "processed_data": {key: [candle[key] for candle in candles] for key in ("timestamp", "open", "high", "low", "close", "volume")},
+            "executors": executors,
+            "results": {
+                "net_pnl": sum(pnl) / max(float(config.get("total_amount_quote", 1000)), 1.0),
+                "net_pnl_quote": sum(pnl),
+                "total_executors": len(executors),
+                "total_executors_with_position": len(executors),
+                "total_volume": sum(e["filled_amount_quote"] for e in executors) * 2,
+                "total_long": len(longs),
+                "total_short": len(executors) - len(longs),
+                "accuracy": len(wins) / len(pnl) if pnl else 0.0,
+                "accuracy_long": sum(1 for e in longs if e["net_pnl_quote"] > 0) / len(longs) if longs else 0.0,
+                "accuracy_short": 0.0,
+                "max_drawdown_usd": min(0.0, min(pnl, default=0.0) * 3),
+                "max_drawdown_pct": min(0.0, min(pnl, default=0.0) * 3) / max(float(config.get("total_amount_quote", 1000)), 1.0),
+                "sharpe_ratio": 0.0,
+                "profit_factor": sum(wins) / abs(sum(p for p in pnl if p < 0)) if any(p < 0 for p in pnl) else 0.0,
+                "close_types": {
+                    "TAKE_PROFIT": sum(1 for e in executors if e["close_type"] == 3),
+                    "STOP_LOSS": sum(1 for e in executors if e["close_type"] == 4),
+                },
+            },
+        }
+
+    # Misc ------------------------------------------------------------------------------------------
+
+    def connector_config_map(self, connector_name: str) -> List[str]:
+        prefix = connector_name.replace("_perpetual", "")
+        return [f"{prefix}_api_key", f"{prefix}_api_secret"] + ([f"{prefix}_passphrase"] if prefix in ("kucoin", "okx") else [])
@@ -0,0 +1,272 @@
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks.fake_backend.fixtures import CONNECTORS, SyntheticBackend
+
+
+class Latency:
+    """Injected response delay: ``base_ms`` plus uniform ``jitter_ms``, overridable per router (path prefix)."""
+
+    def __init__(self, base_ms: float = 0.0, jitter_ms: float = 0.0, per_router: Optional[Dict[str, float]] = None):
+        self.base_ms = base_ms
+        self.jitter_ms = jitter_ms
+        self.per_router = per_router or {}
+
+    def delay(self, path: str) -> float:
+        router = path.strip("/").split("/", 1)[0]
+        base_ms = self.per_router.get(router, self.base_ms)
+        return (base_ms + random.uniform(0, self.jitter_ms)) / 1000
+
+
+class _Route:
+    def __init__(self, method: str, pattern: str, handler: Callable):
+        self.method = method
+        self.regex = re.compile("^" + pattern + "$")
+        self.handler = handler
+
+
+def build_routes(backend: SyntheticBackend) -> List[_Route]:
+    """Route table mirroring the Hummingbot API paths the dashboard calls through ``hummingbot_api_client``.
+
+    Handlers take ``(match, params, body)`` and return the JSON-serialisable response.
+    """
+    b = backend
+    routes = [
+        # docker
+        ("GET", r"/docker/running", lambda m, p, j: {"is_docker_running": True}),
+        (
+            "GET",
+            r"/docker/available-images/?",
+            lambda m, p, j: [f"hummingbot/{p.get('image_name') or 'hummingbot'}:{tag}" for tag in ("latest", "development", "2.7.0")],
+        ),
+        (
+            "GET",
+            r"/docker/active-containers",
+            lambda m, p, j: [{"id": name, "name": name, "status": "running"} for name, bot in b.bots.items() if bot["status"] == "running"],
+        ),
+        ("POST", r"/docker/stop-container/(?P<name>[^/]+)", lambda m, p, j: b.stop_bot(m["name"])),
+        ("POST", r"/docker/remove-container/(?P<name>[^/]+)", lambda m, p, j: b.remove_bot(m["name"])),
+        # accounts
+        ("GET", r"/accounts/?", lambda m, p, j: list(b.accounts)),
+        ("GET", r"/accounts/(?P<account>[^/]+)/credentials", lambda m, p, j: list(b.credentials.get(m["account"], []))),
+        ("POST", r"/accounts/add-account", lambda m, p, j: b.add_account(p["account_name"])),
+        ("POST", r"/accounts/delete-account", lambda m, p, j: b.delete_account(p["account_name"])),
+        (
+            "POST",
+            r"/accounts/add-credential/(?P<account>[^/]+)/(?P<connector>[^/]+)",
+            lambda m, p, j: b.add_credential(m["account"], m["connector"]),
+        ),
+        (
+            "POST",
+            r"/accounts/delete-credential/(?P<account>[^/]+)/(?P<connector>[^/]+)",
+            lambda m, p, j: b.delete_credential(m["account"], m["connector"]),
+        ),
+        # connectors
+        ("GET", r"/connectors/?", lambda m, p, j: list(CONNECTORS)),
+        ("GET", r"/connectors/(?P<connector>[^/]+)/config-map", lambda m, p, j: b.connector_config_map(m["connector"])),
+        # market data
+        ("GET", r"/market-data/available-candle-connectors", lambda m, p, j: list(CONNECTORS)),
+        (
+            "POST",
+            r"/market-data/candles",
+            lambda m, p, j: b.last_candles(j["trading_pair"], j.get("interval", "1m"), int(j.get("max_records", 100))),
+        ),
+        (
+            "POST",
+            r"/market-data/historical-candles",
+            lambda m, p, j: b.candles(
+                j["trading_pair"], j.get("interval", "1m"), j.get("start_time", b.anchor - 86400), j.get("end_time", time.time())
+            ),
+        ),
+        ("POST", r"/market-data/prices", lambda m, p, j: b.prices(j["connector_name"], j["trading_pairs"])),
+        ("POST", r"/market-data/order-book", lambda m, p, j: b.order_book(j["trading_pair"], int(j.get("depth", 10)))),
+        ("POST", r"/market-data/funding-info", lambda m, p, j: b.funding_info(j["trading_pair"])),
+        (
+            "POST",
+            r"/market-data/order-book/quote-volume-for-price",
+            lambda m, p, j: b.quote_volume_for_price(j["trading_pair"], float(j["price"]), bool(j["is_buy"])),
+        ),
+        # trading
+        ("POST", r"/trading/orders", lambda m, p, j: b.place_order(j)),
+        ("POST", r"/trading/positions", lambda m, p, j: b.get_positions(j)),
+        ("POST", r"/trading/orders/active", lambda m, p, j: b.get_active_orders(j)),
+        ("POST", r"/trading/orders/search", lambda m, p, j: b.search_orders(j)),
+        ("POST", r"/trading/trades", lambda m, p, j: b.trades(j)),
+        (
+            "POST",
+            r"/trading/(?P<account>[^/]+)/(?P<connector>[^/]+)/orders/(?P<order_id>[^/]+)/cancel",
+            lambda m, p, j: b.cancel_order(m["account"], m["connector"], m["order_id"]),
+        ),
+        # portfolio
+        ("POST", r"/portfolio/state", lambda m, p, j: b.portfolio_state(j.get("account_names"), j.get("connector_names"))),
+        (
+            "POST",
+            r"/portfolio/history",
+            lambda m, p, j: b.portfolio_history(
+                j.get("account_names"),
+                j.get("connector_names"),
+                int(j.get("limit", 100)),
+                j.get("cursor"),
+                j.get("start_time"),
+                j.get("end_time"),
+                j.get("interval"),
+            ),
+        ),
+        # controllers
+        ("GET", r"/controllers/?", lambda m, p, j: b.list_controllers()),
+        ("GET", r"/controllers/configs/?", lambda m, p, j: b.list_controller_configs()),
+        ("POST", r"/controllers/configs/(?P<name>[^/]+)", lambda m, p, j: b.save_controller_config(m["name"], j)),
+        ("DELETE", r"/controllers/configs/(?P<name>[^/]+)", lambda m, p, j: b.delete_controller_config(m["name"])),
+        ("GET", r"/controllers/bots/(?P<bot>[^/]+)/configs", lambda m, p, j: b.bot_controller_configs(m["bot"])),
+        (
+            "POST",
+            r"/controllers/bots/(?P<bot>[^/]+)/(?P<controller>[^/]+)/config",
+            lambda m, p, j: b.update_bot_controller_config(m["bot"], m["controller"], j),
+        ),
+        # bot orchestration
+        ("GET", r"/bot-orchestration/status", lambda m, p, j: b.active_bots_status()),
+        ("GET", r"/bot-orchestration/bot-runs", lambda m, p, j: b.bot_runs(p)),
+        ("GET", r"/bot-orchestration/(?P<bot>[^/]+)/status", lambda m, p, j: b.bot_status(m["bot"])),
+        ("POST", r"/bot-orchestration/deploy-v2-controllers", lambda m, p, j: b.deploy_v2_controllers(j)),
+        ("POST", r"/bot-orchestration/stop-and-archive-bot/(?P<bot>[^/]+)", lambda m, p, j: b.stop_bot(m["bot"])),
+        # archived bots; database paths contain slashes, so the path group is greedy
+        ("GET", r"/archived-bots/?", lambda m, p, j: list(b.databases)),
+        ("GET", r"/archived-bots/(?P<db>.+)/status", lambda m, p, j: b.database_status(m["db"])),
+        ("GET", r"/archived-bots/(?P<db>.+)/summary", lambda m, p, j: b.database_summary(m["db"])),
+        ("GET", r"/archived-bots/(?P<db>.+)/performance", lambda m, p, j: b.database_performance(m["db"])),
+        (
+            "GET",
+            r"/archived-bots/(?P<db>.+)/trades",
+            lambda m, p, j: b.database_trades(m["db"], int(p.get("limit", 100)), int(p.get("offset", 0))),
+        ),
+        (
+            "GET",
+            r"/archived-bots/(?P<db>.+)/orders",
+            lambda m, p, j: b.database_orders(m["db"], int(p.get("limit", 100)), int(p.get("offset", 0)), p.get("status")),
+        ),
+        (
+            "GET",
+            r"/archived-bots/(?P<db>.+)/positions",
+            lambda m, p, j: b.database_positions(m["db"], int(p.get("limit", 100)), int(p.get("offset", 0))),
+        ),
+        ("GET", r"/archived-bots/(?P<db>.+)/executors", lambda m, p, j: b.database_executors(m["db"])),
+        ("GET", r"/archived-bots/(?P<db>.+)/controllers", lambda m, p, j: b.database_controllers(m["db"])),
+        # backtesting
+        ("POST", r"/backtesting/run", lambda m, p, j: b.run_backtesting(j)),
+    ]
+    return [_Route(method, pattern, handler) for method, pattern, handler in routes]
+
+
+class FakeBackendHandler(BaseHTTPRequestHandler):
+    # Keep-alive, like the real API behind uvicorn, so pooled aiohttp sessions reuse connections
+    protocol_version = "HTTP/1.1"
+    server: "FakeBackendServer"
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+        delay = self.server.latency.delay(url.path)
+        if delay > 0:
+            time.sleep(delay)
+
+        for route in self.server.routes:
+            if route.method != method:
+                continue
+            match = route.regex.match(url.path)
+            if match is None:
+                continue
+            try:
+                body = json.loads(raw_body) if raw_body else {}
+                return self._respond(200, route.handler(match, params, body))
+            except KeyError as e:
+                return self._respond(404, {"detail": str(e).strip("'\"")})
+            except (ValueError, TypeError) as e:
+                return self._respond(400, {"detail": str(e)})
+        self._respond(404, {"detail": f"Not Found: {method} {url.path}"})
+
+    def _respond(self, status: int, payload) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.record(self.command, urlsplit(self.path).path, status, len(data))
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class FakeBackendServer(ThreadingHTTPServer):
+    """Threaded HTTP stand-in for the Hummingbot API serving ``SyntheticBackend`` data."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], backend: SyntheticBackend, latency: Optional[Latency] = None, verbose: bool = False):
+        super().__init__(address, FakeBackendHandler)
+        self.backend = backend
+        self.latency = latency or Latency()
+        self.routes = build_routes(backend)
+        self.verbose = verbose
+        self._stats_lock = threading.Lock()
+        self.requests: Dict[str, int] = {}
+        self.bytes_sent = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, method: str, path: str, status: int, size: int) -> None:
+        # Archived-bot paths embed the database path; count them per endpoint, not per database
+        endpoint = re.sub(r"^/archived-bots/.+/(\w+)$", r"/archived-bots/{db}/\1", path)
+        with self._stats_lock:
+            key = f"{method} {endpoint} {status}"
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.bytes_sent += size
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {"requests": dict(self.requests), "total_requests": sum(self.requests.values()), "bytes_sent": self.bytes_sent}
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self.requests.clear()
+            self.bytes_sent = 0
+
+    def start_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.serve_forever, name="fake-backend", daemon=True)
+        thread.start()
+        return thread
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    backend: Optional[SyntheticBackend] = None,
+    latency: Optional[Latency] = None,
+    verbose: bool = False,
+) -> FakeBackendServer:
+    """Create the server bound to ``host:port`` (port 0 picks a free one) without starting it."""
+    return FakeBackendServer((host, port), backend or SyntheticBackend(), latency, verbose)
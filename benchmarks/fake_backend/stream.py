@@ -0,0 +1,103 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional
+
+from benchmarks.fake_backend.fixtures import SyntheticBackend, noise
+
+
+class SyntheticMarketDataSocket:
+    """In-process stand-in for ``hummingbot_api_client``'s ``MarketDataWebSocket``.
+
+    Pushes the same order books and candles the fake HTTP server serves, plus synthetic public
+    trades, every ``update_interval`` seconds, without a network connection.
+    """
+
+    def __init__(self, backend: SyntheticBackend, trades_per_second: int = 5):
+        self.backend = backend
+        self.trades_per_second = trades_per_second
+        self.closed = False
+        self._subscription: Optional[Dict[str, Any]] = None
+        self._next_push = 0.0
+        self._last_trade_ts = time.time()
+
+    async def _subscribe(self, **subscription) -> str:
+        self._subscription = subscription
+        return f"synthetic-{subscription['type']}-{subscription['connector']}-{subscription['trading_pair']}"
+
+    async def subscribe_order_book(self, connector: str, trading_pair: str, depth: int = 10, update_interval: float = 1.0) -> str:
+        return await self._subscribe(
+            type="order_book", connector=connector, trading_pair=trading_pair, depth=depth, update_interval=update_interval
+        )
+
+    async def subscribe_trades(self, connector: str, trading_pair: str, update_interval: float = 1.0) -> str:
+        return await self._subscribe(type="trades", connector=connector, trading_pair=trading_pair, update_interval=update_interval)
+
+    async def subscribe_candles(
+        self, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 100, update_interval: float = 1.0
+    ) -> str:
+        return await self._subscribe(
+            type="candles",
+            connector=connector,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+            update_interval=update_interval,
+        )
+
+    def _trades(self, trading_pair: str, now: float) -> List[dict]:
+        count = max(1, int((now - self._last_trade_ts) * self.trades_per_second))
+        step = (now - self._last_trade_ts) / count
+        trades = []
+        for i in range(count):
+            ts = self._last_trade_ts + step * (i + 1)
+            trades.append(
+                {
+                    "timestamp": ts,
+                    "price": self.backend.price(trading_pair, ts),
+                    "amount": 0.001 + noise(self.backend.seed, trading_pair, ts, "amount"),
+                    "trade_type": "BUY" if noise(self.backend.seed, trading_pair, ts, "side") < 0.5 else "SELL",
+                }
+            )
+        self._last_trade_ts = now
+        return trades
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        if self.closed or self._subscription is None:
+            raise StopAsyncIteration
+        sub = self._subscription
+        delay = self._next_push - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._next_push = time.monotonic() + sub["update_interval"]
+        pair = sub["trading_pair"]
+        if sub["type"] == "order_book":
+            data = self.backend.order_book(pair, sub["depth"])
+        elif sub["type"] == "trades":
+            data = self._trades(pair, time.time())
+        else:
+            # After the first push only the last two candles change, like the real stream's incremental updates
+            data = self.backend.last_candles(pair, sub["interval"], sub["max_records"])
+            sub["max_records"] = 2
+        return {"type": sub["type"], "subscription_id": f"synthetic-{sub['type']}", "data": data}
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class SyntheticMarketDataSource:
+    """``MarketDataStream`` source backed by ``SyntheticBackend``, for offline runs and load tests."""
+
+    def __init__(self, backend: Optional[SyntheticBackend] = None):
+        self.backend = backend or SyntheticBackend()
+
+    @asynccontextmanager
+    async def connect(self):
+        socket = SyntheticMarketDataSocket(self.backend)
+        try:
+            yield socket
+        finally:
+            await socket.close()
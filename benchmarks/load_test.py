@@ -0,0 +1,299 @@
+"""Multi-session load test: drives concurrent ``AppTest`` sessions through ``main.py`` navigation.
+
+Every session runs in its own thread of this process, so the sessions share what a dashboard
+container shares (backend client pool, caches, fan-out threads, the GIL and memory). Each page
+listed in ``frontend/pages/permissions.py`` is loaded by ``--sessions`` sessions at once and rerun
+``--reruns`` times; the report gives rerun latency percentiles, peak RSS and backend calls per rerun.
+
+    python -m benchmarks.load_test --sessions 8 --reruns 5 --pages instances trading
+"""
+
+import argparse
+import ast
+import json
+import math
+import os
+import resource
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+ROOT = Path(__file__).resolve().parent.parent
+MAIN_SCRIPT = ROOT / "main.py"
+PERMISSIONS_FILE = ROOT / "frontend" / "pages" / "permissions.py"
+
+
+class PageSpec:
+    def __init__(self, path: str, title: str, url_path: str, section: str):
+        self.path = path
+        self.title = title
+        self.url_path = url_path
+        self.section = section
+
+
+def discover_pages() -> List[PageSpec]:
+    """Read the ``st.Page(...)`` registrations from permissions.py without a Streamlit runtime."""
+    tree = ast.parse(PERMISSIONS_FILE.read_text())
+    pages = []
+    for function in tree.body:
+        if not isinstance(function, ast.FunctionDef):
+            continue
+        for node in ast.walk(function):
+            if isinstance(node, ast.Call) and getattr(node.func, "attr", None) == "Page" and node.args:
+                kwargs = {kw.arg: ast.literal_eval(kw.value) for kw in node.keywords if kw.arg in ("title", "url_path")}
+                path = ast.literal_eval(node.args[0])
+                pages.append(PageSpec(path, kwargs.get("title", path), kwargs.get("url_path", Path(path).parent.name), function.name))
+    return pages
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    # Multiplying first keeps whole ranks exact: 7 / 100 * 100 is 7.000000000000001, which ceil takes to 8
+    rank = max(1, math.ceil(pct * len(ordered) / 100))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def _current_rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+class RssSampler:
+    """Samples this process' resident set size in the background and keeps the peak since ``reset``.
+
+    Falls back to the lifetime peak from ``getrusage`` where /proc is not available (macOS).
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self):
+        rss = _current_rss_bytes()
+        if rss is None:
+            max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            rss = max_rss if sys.platform == "darwin" else max_rss * 1024
+        self.peak = max(self.peak, rss)
+
+    def reset(self):
+        self.peak = 0
+        self.sample()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+
+class SessionResult:
+    def __init__(self):
+        self.cold_ms: Optional[float] = None
+        self.rerun_ms: List[float] = []
+        self.exceptions: List[str] = []
+        self.error_elements = 0
+
+
+def run_session(page: PageSpec, reruns: int, timeout: float, result: SessionResult) -> None:
+    from streamlit.testing.v1 import AppTest
+
+    try:
+        app = AppTest.from_file(str(MAIN_SCRIPT), default_timeout=timeout)
+        app.run()
+        app.switch_page(page.path)
+        started = time.perf_counter()
+        app.run()
+        result.cold_ms = (time.perf_counter() - started) * 1000
+        for _ in range(reruns):
+            started = time.perf_counter()
+            app.run()
+            result.rerun_ms.append((time.perf_counter() - started) * 1000)
+        result.exceptions = [str(e.value) for e in app.exception]
+        result.error_elements = len(app.error)
+    except Exception as e:
+        result.exceptions.append(f"{type(e).__name__}: {e}")
+
+
+def load_page(page: PageSpec, sessions: int, reruns: int, timeout: float, pool, sampler: RssSampler) -> dict:
+    """Load ``page`` from ``sessions`` concurrent sessions and summarise their reruns."""
+    results = [SessionResult() for _ in range(sessions)]
+    threads = [threading.Thread(target=run_session, args=(page, reruns, timeout, r), name=f"session-{i}") for i, r in enumerate(results)]
+    pool_before = pool.stats()
+    sampler.reset()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall_s = time.perf_counter() - started
+    sampler.sample()
+    pool_after = pool.stats()
+
+    rerun_ms = [ms for r in results for ms in r.rerun_ms]
+    cold_ms = [r.cold_ms for r in results if r.cold_ms is not None]
+    # Every completed run (cold load and reruns) goes through the pool
+    runs = len(rerun_ms) + len(cold_ms)
+    exceptions = sorted({e for r in results for e in r.exceptions})
+    return {
+        "page": page.url_path,
+        "title": page.title,
+        "section": page.section,
+        "sessions": sessions,
+        "reruns": len(rerun_ms),
+        "wall_s": round(wall_s, 2),
+        "cold_p50_ms": _round(percentile(cold_ms, 50)),
+        "p50_ms": _round(percentile(rerun_ms, 50)),
+        "p95_ms": _round(percentile(rerun_ms, 95)),
+        "p99_ms": _round(percentile(rerun_ms, 99)),
+        "max_ms": _round(max(rerun_ms, default=None)),
+        "peak_rss_mb": round(sampler.peak / 2**20, 1),
+        "api_calls_per_rerun": _round((pool_after["calls"] - pool_before["calls"]) / runs) if runs else None,
+        "backend_requests_per_rerun": _round((pool_after["requests"] - pool_before["requests"]) / runs) if runs else None,
+        "error_elements": sum(r.error_elements for r in results),
+        "exceptions": exceptions,
+    }
+
+
+def _round(value: Optional[float], digits: int = 1) -> Optional[float]:
+    return None if value is None else round(value, digits)
+
+
+COLUMNS = [
+    ("page", "{:<22}"),
+    ("p50_ms", "{:>9}"),
+    ("p95_ms", "{:>9}"),
+    ("p99_ms", "{:>9}"),
+    ("cold_p50_ms", "{:>12}"),
+    ("peak_rss_mb", "{:>12}"),
+    ("api_calls_per_rerun", "{:>10}"),
+    ("backend_requests_per_rerun", "{:>10}"),
+]
+HEADERS = {"api_calls_per_rerun": "calls/run", "backend_requests_per_rerun": "reqs/run"}
+
+
+def format_row(row: dict) -> str:
+    line = "".join(fmt.format("-" if row[name] is None else row[name]) for name, fmt in COLUMNS)
+    if row["exceptions"]:
+        line += f"\n    ! {row['exceptions'][0][:120]}"
+    return line
+
+
+def format_report(rows: List[dict]) -> str:
+    header = "".join(fmt.format(HEADERS.get(name, name)) for name, fmt in COLUMNS)
+    return "\n".join([header] + [format_row(row) for row in rows])
+
+
+def compare_to_baseline(rows: List[dict], baseline_path: str, max_regression: float) -> List[str]:
+    """Pages whose p95 rerun time or backend requests per rerun grew more than ``max_regression``."""
+    with open(baseline_path) as f:
+        baseline = {row["page"]: row for row in json.load(f)["pages"]}
+    regressions = []
+    for row in rows:
+        before = baseline.get(row["page"])
+        if before is None:
+            continue
+        for metric in ("p95_ms", "backend_requests_per_rerun"):
+            old, new = before.get(metric), row.get(metric)
+            if old and new and new > old * (1 + max_regression):
+                regressions.append(f"{row['page']}: {metric} {old} -> {new} (+{(new / old - 1):.0%})")
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent sessions per page")
+    parser.add_argument("--reruns", type=int, default=5, help="Reruns per session after the first load")
+    parser.add_argument("--pages", nargs="*", help="url_path of the pages to load (default: every page in permissions.py)")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds a single run may take")
+    parser.add_argument("--backend-url", help="Use a running Hummingbot API (or fake backend) instead of starting the fake backend")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Injected latency of the embedded fake backend")
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--bots", type=int, default=50, help="Bots served by the embedded fake backend")
+    parser.add_argument("--trades", type=int, default=100_000, help="Trades served by the embedded fake backend")
+    parser.add_argument("--configs", type=int, default=500, help="Controller configs served by the embedded fake backend")
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--baseline", help="JSON report of a previous run; exit 1 if a page regressed")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed relative growth against --baseline")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    server = None
+    if args.backend_url:
+        host_port = args.backend_url.split("://", 1)[-1].rstrip("/")
+        host, _, port = host_port.partition(":")
+    else:
+        from benchmarks.fake_backend.fixtures import Scale, SyntheticBackend
+        from benchmarks.fake_backend.server import Latency, serve
+
+        backend = SyntheticBackend(Scale(bots=args.bots, trades=args.trades, configs=args.configs))
+        server = serve(port=0, backend=backend, latency=Latency(args.latency_ms, args.jitter_ms))
+        server.start_in_background()
+        host, port = server.server_address[:2]
+
+    # CONFIG is read at import time, so the environment must be in place before the dashboard is imported
+    os.environ["BACKEND_API_HOST"] = str(host)
+    os.environ["BACKEND_API_PORT"] = str(port or 8000)
+    os.environ["AUTH_SYSTEM_ENABLED"] = "False"
+    sys.path.insert(0, str(ROOT))
+
+    from streamlit.logger import set_log_level
+
+    # Bare-mode AppTest sessions log a "missing ScriptRunContext" warning for every cached call
+    set_log_level("error")
+    from frontend.st_utils import get_backend_api_pool
+
+    pages = discover_pages()
+    if args.pages:
+        pages = [page for page in pages if page.url_path in args.pages]
+    pool = get_backend_api_pool()
+    sampler = RssSampler().start()
+
+    print(f"Backend {pool.base_url} · {args.sessions} sessions × {args.reruns} reruns · {len(pages)} pages\n", flush=True)
+    rows = []
+    for page in pages:
+        row = load_page(page, args.sessions, args.reruns, args.timeout, pool, sampler)
+        rows.append(row)
+        print(format_row(row), flush=True)
+    sampler.stop()
+
+    print("\n" + format_report(rows))
+    report = {
+        "started_at": time.time(),
+        "sessions": args.sessions,
+        "reruns": args.reruns,
+        "backend": pool.base_url,
+        "fake_backend": server.stats() if server else None,
+        "pages": rows,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if server is not None:
+        server.shutdown()
+
+    if args.baseline:
+        regressions = compare_to_baseline(rows, args.baseline, args.max_regression)
+        if regressions:
+            print("\nRegressions against baseline:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
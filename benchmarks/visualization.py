@@ -0,0 +1,403 @@
+"""Micro-benchmarks for the Plotly figure builders on synthetic inputs of 1k, 100k and 1M rows.
+
+Each case builds its figure from pre-generated input, then serialises it the way ``st.plotly_chart``
+does (``plotly.io.to_json(validate=False)``); the report gives the build time, the serialisation time
+and the size of the JSON sent to the browser.
+
+    python -m benchmarks.visualization --sizes 1000 100000 --output charts.json
+    python -m benchmarks.visualization --baseline charts.json --max-regression 0.2
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+TRADING_PAGE = ROOT / "frontend" / "pages" / "orchestration" / "trading" / "app.py"
+ARCHIVED_BOTS_PAGE = ROOT / "frontend" / "pages" / "orchestration" / "archived_bots" / "app.py"
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+# Secondary inputs (trade markers, executors on a candle chart, performance rows) scale with the candles
+TRADES_PER_CANDLE = 0.1
+ANCHOR = 1_700_000_000
+
+
+def load_page_functions(page: Path) -> dict:
+    """Module-level imports, constants and functions of a page script, without running the page body.
+
+    Pages render as a side effect of being imported, so their chart builders cannot be imported directly.
+    Decorators are dropped: they are Streamlit caching/fragment wrappers that need a script run context.
+    """
+    tree = ast.parse(page.read_text(), filename=str(page))
+    body = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            body.append(node)
+        elif isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant) and all(isinstance(t, ast.Name) for t in node.targets):
+            body.append(node)
+        elif isinstance(node, ast.FunctionDef):
+            node.decorator_list = []
+            body.append(node)
+    namespace = {"__name__": f"benchmarks.pages.{page.parent.name}", "__file__": str(page)}
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(page), "exec"), namespace)
+    return namespace
+
+
+# Synthetic inputs, seeded so runs are comparable
+
+
+def make_candles(rows: int, seed: int = 0) -> List[dict]:
+    rng = np.random.default_rng(seed)
+    close = 50_000 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.0008, rows)) * close
+    frame = pd.DataFrame(
+        {
+            "timestamp": ANCHOR + np.arange(rows, dtype=np.int64) * 60,
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.gamma(2.0, 5.0, rows),
+        }
+    )
+    return frame.to_dict("records")
+
+
+def make_trades(rows: int, span_rows: int, seed: int = 1) -> List[dict]:
+    """``rows`` fills spread over the time range of ``span_rows`` one-minute candles."""
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "timestamp": np.sort(ANCHOR + rng.uniform(0, span_rows * 60, rows)),
+            "price": 50_000 * np.exp(rng.normal(0, 0.01, rows)),
+            "amount": rng.gamma(2.0, 0.01, rows),
+            "trade_type": np.where(rng.random(rows) < 0.5, "BUY", "SELL"),
+            "pnl": rng.normal(0, 5, rows),
+        }
+    )
+    return frame.to_dict("records")
+
+
+def make_order_book(rows: int, mid: float = 50_000.0, depth_percentage: float = 1.0) -> dict:
+    """``rows`` levels split between both sides, all within ``depth_percentage`` of the mid price."""
+    levels = max(1, rows // 2)
+    tick = mid * depth_percentage / 100 / levels
+    offsets = (np.arange(levels) + 1) * tick
+    amounts = np.random.default_rng(2).gamma(2.0, 0.5, (2, levels))
+    return {
+        "bids": [{"price": p, "amount": a} for p, a in zip((mid - offsets).tolist(), amounts[0].tolist())],
+        "asks": [{"price": p, "amount": a} for p, a in zip((mid + offsets).tolist(), amounts[1].tolist())],
+    }
+
+
+def make_performance(rows: int, span_rows: int, seed: int = 3) -> dict:
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame(
+        {
+            "timestamp": ANCHOR + np.linspace(0, span_rows * 60, rows),
+            "buy_avg_price": 50_000 * np.exp(rng.normal(0, 0.002, rows)),
+            "sell_avg_price": 50_000 * np.exp(rng.normal(0, 0.002, rows)),
+            "net_pnl_quote": np.cumsum(rng.normal(0, 2, rows)),
+            "unrealized_trade_pnl_quote": rng.normal(0, 10, rows),
+            "fees_quote": rng.gamma(1.0, 0.05, rows),
+            "net_position": np.cumsum(rng.normal(0, 0.01, rows)),
+        }
+    )
+    return {"performance_data": frame.to_dict("records")}
+
+
+def make_executors(rows: int, span_rows: int, buy_side, sell_side, seed: int = 4) -> List[dict]:
+    """Executor dicts as returned by the backtesting endpoint; the sides are ``TradeType`` members."""
+    rng = np.random.default_rng(seed)
+    start = np.sort(ANCHOR + rng.uniform(0, span_rows * 60, rows))
+    close = start + rng.uniform(60, 3_600, rows)
+    entry = 50_000 * np.exp(rng.normal(0, 0.01, rows))
+    exit_ = entry * np.exp(rng.normal(0, 0.002, rows))
+    filled = np.where(rng.random(rows) < 0.8, rng.gamma(2.0, 50, rows), 0.0)
+    pnl = np.where(filled > 0, rng.normal(0, 1, rows), 0.0)
+    is_buy = rng.random(rows) < 0.5
+    return [
+        {
+            "timestamp": ts,
+            "close_timestamp": cts,
+            "custom_info": {"current_position_average_price": ep, "close_price": xp},
+            "config": {"side": buy_side if buy else sell_side},
+            "filled_amount_quote": fq,
+            "net_pnl_quote": pq,
+        }
+        for ts, cts, ep, xp, fq, pq, buy in zip(
+            start.tolist(), close.tolist(), entry.tolist(), exit_.tolist(), filled.tolist(), pnl.tolist(), is_buy.tolist()
+        )
+    ]
+
+
+def make_executors_frame(rows: int, seed: int = 5) -> pd.DataFrame:
+    """Executor summary frame in the shape ``create_combined_subplots`` reads."""
+    rng = np.random.default_rng(seed)
+    close_timestamp = np.sort(ANCHOR + rng.uniform(0, rows * 60, rows))
+    net_pnl_pct = np.where(rng.random(rows) < 0.9, rng.normal(0, 0.01, rows), 0.0)
+    filled = rng.gamma(2.0, 50, rows)
+    return pd.DataFrame(
+        {
+            "close_timestamp": close_timestamp,
+            "close_datetime": pd.to_datetime(close_timestamp, unit="s"),
+            "net_pnl_pct": net_pnl_pct,
+            "net_pnl_quote": net_pnl_pct * filled,
+            "filled_amount_quote": filled,
+        }
+    )
+
+
+# Cases: ``setup(rows)`` generates the input once and returns ``run() -> figure``. It is called before
+# any timing, so only the builder is measured; a case that cannot be imported here is reported as unavailable.
+
+
+def _trading_candlestick(rows: int) -> Callable:
+    create_candlestick_chart = load_page_functions(TRADING_PAGE)["create_candlestick_chart"]
+    candles = make_candles(rows)
+    trades = make_trades(int(rows * TRADES_PER_CANDLE), rows)
+    return lambda: create_candlestick_chart(candles, "binance", "BTC-USDT", "1m", trades)
+
+
+def _trading_order_book(rows: int) -> Callable:
+    create_order_book_chart = load_page_functions(TRADING_PAGE)["create_order_book_chart"]
+    order_book = make_order_book(rows)
+    return lambda: create_order_book_chart(order_book, 50_000.0, 1.0, "BTC-USDT")[0]
+
+
+def _executors_trace(rows: int) -> Callable:
+    import plotly.graph_objects as go
+
+    from frontend.visualization import executors as executors_module
+
+    trade_type = executors_module.TradeType
+    executors = make_executors(rows, rows, trade_type.BUY, trade_type.SELL)
+    return lambda: executors_module.add_executors_trace(go.Figure().set_subplots(1, 1), executors, row=1, col=1)
+
+
+def _backtesting_figure(rows: int) -> Callable:
+    from frontend.visualization import executors as executors_module
+    from frontend.visualization.backtesting import create_backtesting_figure
+
+    trade_type = executors_module.TradeType
+    candles = pd.DataFrame(make_candles(rows))
+    executors = make_executors(int(rows * TRADES_PER_CANDLE), rows, trade_type.BUY, trade_type.SELL)
+    # get_bt_candlestick_trace sets the frame's index, so every run gets its own copy
+    return lambda: create_backtesting_figure(candles.copy(), executors, {"trading_pair": "BTC-USDT"})
+
+
+def _combined_subplots(rows: int) -> Callable:
+    from frontend.visualization.performance_time_evolution import create_combined_subplots
+
+    executors = make_executors_frame(rows)
+    # The builder sorts and adds columns in place
+    return lambda: create_combined_subplots(executors.copy())
+
+
+def _archived_comprehensive_dashboard(rows: int) -> Callable:
+    create_comprehensive_dashboard = load_page_functions(ARCHIVED_BOTS_PAGE)["create_comprehensive_dashboard"]
+    candles = make_candles(rows)
+    trades_rows = int(rows * TRADES_PER_CANDLE)
+    trades = make_trades(trades_rows, rows)
+    performance = make_performance(trades_rows, rows)
+    return lambda: create_comprehensive_dashboard(candles, trades, performance, "BTC-USDT")
+
+
+def _archived_trades_on_chart(rows: int) -> Callable:
+    import plotly.graph_objects as go
+
+    add_trades_to_chart = load_page_functions(ARCHIVED_BOTS_PAGE)["add_trades_to_chart"]
+    trades = make_trades(rows, rows)
+    return lambda: add_trades_to_chart(go.Figure(), trades)
+
+
+CASES: Dict[str, Callable[[int], Callable]] = {
+    "trading.create_candlestick_chart": _trading_candlestick,
+    "trading.create_order_book_chart": _trading_order_book,
+    "executors.add_executors_trace": _executors_trace,
+    "backtesting.create_backtesting_figure": _backtesting_figure,
+    "performance_time_evolution.create_combined_subplots": _combined_subplots,
+    "archived_bots.create_comprehensive_dashboard": _archived_comprehensive_dashboard,
+    "archived_bots.add_trades_to_chart": _archived_trades_on_chart,
+}
+
+
+def _empty_row(name: str, rows: int, status: str, error: Optional[str] = None) -> dict:
+    return {
+        "case": name,
+        "rows": rows,
+        "status": status,
+        "build_ms": None,
+        "build_median_ms": None,
+        "serialize_ms": None,
+        "figure_bytes": None,
+        "traces": None,
+        "error": error,
+    }
+
+
+def run_case(name: str, rows: int, repeat: int) -> dict:
+    import plotly.io
+
+    try:
+        run = CASES[name](rows)
+    except ImportError as e:
+        return _empty_row(name, rows, "unavailable", f"{type(e).__name__}: {e}")
+
+    try:
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fig = run()
+            timings.append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        spec = plotly.io.to_json(fig, validate=False)
+        serialize_ms = (time.perf_counter() - started) * 1000
+    except Exception as e:
+        return _empty_row(name, rows, "error", f"{type(e).__name__}: {e}")
+
+    return {
+        **_empty_row(name, rows, "ok"),
+        "build_ms": round(min(timings), 1),
+        "build_median_ms": round(statistics.median(timings), 1),
+        "serialize_ms": round(serialize_ms, 1),
+        "figure_bytes": len(spec),
+        "traces": len(fig.data),
+    }
+
+
+def run_cases(
+    names: List[str], sizes: List[int], repeat: int, max_seconds: float, on_row: Optional[Callable[[dict], None]] = None
+) -> List[dict]:
+    """Run every case at every size, smallest first.
+
+    Once a size fails, or the previous size's run time scaled linearly by rows exceeds ``max_seconds``,
+    the remaining sizes of that case are skipped: the per-trade trace loops would take hours at 1M rows.
+    """
+    results = []
+    for name in names:
+        stopped: Optional[dict] = None
+        previous: Optional[dict] = None
+        for rows in sorted(sizes):
+            if stopped is None and previous is not None:
+                estimate = (previous["build_ms"] * repeat + previous["serialize_ms"]) / 1000 * rows / previous["rows"]
+                if estimate > max_seconds:
+                    stopped = {"status": "skipped", "error": f"estimated {estimate:,.0f}s exceeds --max-seconds"}
+            if stopped is not None:
+                row = _empty_row(name, rows, stopped["status"], stopped["error"])
+            else:
+                row = run_case(name, rows, repeat)
+                if row["status"] == "ok":
+                    previous = row
+                else:
+                    stopped = {"status": "unavailable" if row["status"] == "unavailable" else "skipped", "error": row["error"]}
+            results.append(row)
+            if on_row is not None:
+                on_row(row)
+    return results
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "-"
+    return f"{size / 2**20:,.1f} MB" if size >= 2**20 else f"{size / 2**10:,.1f} KB"
+
+
+COLUMNS = [
+    ("case", "{:<52}"),
+    ("rows", "{:>10}"),
+    ("build_ms", "{:>11}"),
+    ("serialize_ms", "{:>13}"),
+    ("figure_bytes", "{:>14}"),
+    ("traces", "{:>9}"),
+]
+
+
+def format_row(row: dict) -> str:
+    values = dict(row, rows=f"{row['rows']:,}", figure_bytes=_format_bytes(row["figure_bytes"]))
+    line = "".join(fmt.format("-" if values[name] is None else values[name]) for name, fmt in COLUMNS)
+    if row["status"] != "ok":
+        line += f"  {row['status']}" + (f": {row['error'][:100]}" if row["error"] else "")
+    return line
+
+
+def format_report(rows: List[dict]) -> str:
+    header = "".join(fmt.format(name) for name, fmt in COLUMNS)
+    return "\n".join([header] + [format_row(row) for row in rows])
+
+
+def compare_to_baseline(rows: List[dict], baseline_path: str, max_regression: float) -> List[str]:
+    """Cases whose build time or serialised figure size grew more than ``max_regression`` at the same size."""
+    with open(baseline_path) as f:
+        baseline = {(row["case"], row["rows"]): row for row in json.load(f)["cases"]}
+    regressions = []
+    for row in rows:
+        before = baseline.get((row["case"], row["rows"]))
+        if before is None:
+            continue
+        for metric in ("build_ms", "figure_bytes"):
+            old, new = before.get(metric), row.get(metric)
+            if old and new and new > old * (1 + max_regression):
+                regressions.append(f"{row['case']} @ {row['rows']:,} rows: {metric} {old} -> {new} (+{(new / old - 1):.0%})")
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.visualization", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Input rows per case")
+    parser.add_argument("--cases", nargs="*", choices=sorted(CASES), help="Cases to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Builds per case and size; the fastest is reported")
+    parser.add_argument("--max-seconds", type=float, default=120.0, help="Skip sizes whose extrapolated run time exceeds this")
+    parser.add_argument("--output", help="Write the report as JSON")
+    parser.add_argument("--baseline", help="JSON report of a previous run; exit 1 if a case regressed")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="Allowed relative growth against --baseline")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    sys.path.insert(0, str(ROOT))
+    # Plotly warns on every serialised timestamp that carries nanoseconds
+    warnings.filterwarnings("ignore", message="Discarding nonzero nanoseconds")
+    output = os.path.abspath(args.output) if args.output else None
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+
+    print(f"{len(args.cases or CASES)} cases × sizes {', '.join(f'{n:,}' for n in sorted(args.sizes))} · best of {args.repeat}\n", flush=True)
+    print("".join(fmt.format(name) for name, fmt in COLUMNS), flush=True)
+    # get_win_loss_ratio_fig writes executors.csv to the working directory; keep it out of the checkout
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            rows = run_cases(
+                args.cases or list(CASES), args.sizes, args.repeat, args.max_seconds, on_row=lambda row: print(format_row(row), flush=True)
+            )
+        finally:
+            os.chdir(cwd)
+
+    report = {"started_at": time.time(), "repeat": args.repeat, "sizes": sorted(args.sizes), "cases": rows}
+    if output:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if baseline:
+        regressions = compare_to_baseline(rows, baseline, args.max_regression)
+        if regressions:
+            print("\nRegressions against baseline:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from frontend.api.fanout import fan_out
+
+
+class RateLimiter:
+    """Spaces calls that share a key (e.g. a connector) at least ``1 / rate`` seconds apart, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot: Dict[Any, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: Any) -> float:
+        """Book the next free slot for ``key``; returns its ``time.monotonic()`` start time."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + self.interval
+        return slot
+
+
+def bulk_cancel(
+    cancel: Callable[[dict], Any],
+    orders: List[dict],
+    max_concurrency: Optional[int] = None,
+    rate_limit: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> List[dict]:
+    """Cancel ``orders`` concurrently and return one result row per order, in input order.
+
+    ``cancel(order)`` sends one cancel and returns the API response. At most ``max_concurrency``
+    cancels are in flight and each connector gets at most ``rate_limit`` cancels per second.
+    ``cancel`` runs outside the Streamlit script thread, so it must not call ``st.*``.
+    """
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    # Rate-limit slots are waited for before submission, so no pool worker sleeps
+    not_before = (lambda order: limiter.reserve(order.get("connector_name"))) if limiter else None
+    result = fan_out(cancel, orders, timeout=timeout, max_concurrency=max_concurrency, not_before=not_before)
+    rows = []
+    for order, response, error in result:
+        if error is not None:
+            status, message = "failed", str(error)
+        elif isinstance(response, dict) and response.get("status", "success") != "success":
+            status, message = "failed", response.get("message", "Unknown error")
+        else:
+            status, message = "cancelled", ""
+        rows.append(
+            {
+                "client_order_id": order.get("client_order_id", ""),
+                "connector_name": order.get("connector_name", ""),
+                "trading_pair": order.get("trading_pair", ""),
+                "status": status,
+                "message": message,
+            }
+        )
+    return rows
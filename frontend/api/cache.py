@@ -0,0 +1,206 @@
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from frontend.api.fanout import get_executor
+
+
+def make_call_key(router_name: str, method_name: str, args: tuple, kwargs: dict) -> Tuple:
+    """Hashable key for a backend call; list/dict arguments are keyed by their repr."""
+    return (router_name, method_name, repr(args), repr(sorted(kwargs.items())))
+
+
+class CachePolicy:
+    """How long a read endpoint is fresh (``ttl``), how long it may then be served stale while it is
+    refreshed in the background (``stale_ttl``), and which tags invalidate it."""
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, tags: Iterable[str] = ()):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.tags = tuple(tags)
+
+
+# Read endpoints worth caching, keyed by (router, method)
+DEFAULT_POLICIES: Dict[Tuple[str, str], CachePolicy] = {
+    ("accounts", "list_accounts"): CachePolicy(ttl=60, stale_ttl=300, tags=["accounts"]),
+    ("accounts", "list_account_credentials"): CachePolicy(ttl=60, stale_ttl=300, tags=["credentials"]),
+    ("connectors", "list_connectors"): CachePolicy(ttl=3600, stale_ttl=86400),
+    ("connectors", "get_config_map"): CachePolicy(ttl=3600, stale_ttl=86400),
+    ("docker", "get_available_images"): CachePolicy(ttl=300, stale_ttl=3600, tags=["images"]),
+    ("controllers", "list_controller_configs"): CachePolicy(ttl=30, stale_ttl=300, tags=["controller_configs"]),
+    ("controllers", "list_controllers"): CachePolicy(ttl=300, stale_ttl=3600, tags=["controllers"]),
+    ("controllers", "get_bot_controller_configs"): CachePolicy(ttl=5, stale_ttl=30, tags=["bot_controller_configs"]),
+    ("portfolio", "get_state"): CachePolicy(ttl=10, stale_ttl=30, tags=["portfolio"]),
+    ("portfolio", "get_history"): CachePolicy(ttl=60, stale_ttl=300, tags=["portfolio"]),
+    ("portfolio", "get_distribution"): CachePolicy(ttl=10, stale_ttl=30, tags=["portfolio"]),
+    ("portfolio", "get_accounts_distribution"): CachePolicy(ttl=10, stale_ttl=30, tags=["portfolio"]),
+    ("trading", "get_positions"): CachePolicy(ttl=5, stale_ttl=15, tags=["positions"]),
+    ("trading", "get_active_orders"): CachePolicy(ttl=5, stale_ttl=15, tags=["active_orders"]),
+    ("trading", "search_orders"): CachePolicy(ttl=10, stale_ttl=30, tags=["order_history"]),
+    ("trading", "get_trades"): CachePolicy(ttl=10, stale_ttl=30, tags=["trades"]),
+    ("bot_orchestration", "get_active_bots_status"): CachePolicy(ttl=3, stale_ttl=10, tags=["bot_status"]),
+    ("bot_orchestration", "get_bot_status"): CachePolicy(ttl=3, stale_ttl=10, tags=["bot_status"]),
+    ("bot_orchestration", "get_bot_runs"): CachePolicy(ttl=60, stale_ttl=300, tags=["bot_runs"]),
+    ("archived_bots", "list_databases"): CachePolicy(ttl=60, stale_ttl=300, tags=["archived_bots"]),
+    ("archived_bots", "get_database_status"): CachePolicy(ttl=300, stale_ttl=3600, tags=["archived_bots"]),
+    ("market_data", "get_available_candle_connectors"): CachePolicy(ttl=3600, stale_ttl=86400),
+}
+
+# Write endpoints and the tags they make stale
+DEFAULT_INVALIDATIONS: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    ("trading", "place_order"): ("active_orders", "order_history", "trades", "positions", "portfolio"),
+    ("trading", "cancel_order"): ("active_orders", "order_history"),
+    ("trading", "set_leverage"): ("positions",),
+    ("trading", "set_position_mode"): ("positions",),
+    ("controllers", "create_or_update_controller"): ("controllers",),
+    ("controllers", "delete_controller"): ("controllers",),
+    ("controllers", "create_or_update_controller_config"): ("controller_configs",),
+    ("controllers", "delete_controller_config"): ("controller_configs",),
+    ("controllers", "update_bot_controller_config"): ("bot_controller_configs", "bot_status"),
+    ("bot_orchestration", "deploy_v2_controllers"): ("bot_status", "bot_runs"),
+    ("bot_orchestration", "deploy_v2_script"): ("bot_status", "bot_runs"),
+    ("bot_orchestration", "start_bot"): ("bot_status",),
+    ("bot_orchestration", "stop_bot"): ("bot_status",),
+    ("bot_orchestration", "stop_and_archive_bot"): ("bot_status", "bot_runs", "archived_bots"),
+    ("bot_orchestration", "delete_bot_run"): ("bot_runs",),
+    ("docker", "start_container"): ("bot_status",),
+    ("docker", "stop_container"): ("bot_status",),
+    ("docker", "clean_exited_containers"): ("bot_status",),
+    ("docker", "remove_container"): ("bot_status", "archived_bots"),
+    ("docker", "pull_image"): ("images",),
+    ("archived_bots", "delete_archived_bot"): ("archived_bots",),
+    ("accounts", "add_account"): ("accounts", "credentials", "portfolio"),
+    ("accounts", "delete_account"): ("accounts", "credentials", "portfolio"),
+    ("accounts", "add_credential"): ("credentials", "portfolio"),
+    ("accounts", "delete_credential"): ("credentials", "portfolio"),
+}
+
+
+class _CacheEntry:
+    __slots__ = ("value", "fetched_at", "policy", "refreshing")
+
+    def __init__(self, value: Any, fetched_at: float, policy: CachePolicy):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.policy = policy
+        self.refreshing = False
+
+
+class BackendCache:
+    """Pool middleware caching backend reads per endpoint with write-through invalidation.
+
+    Fresh entries are served directly. Entries past their ``ttl`` but within ``stale_ttl`` are served
+    as-is while a single background refresh runs. Calls to a write endpoint drop every entry tagged
+    with what that write changes, and a refresh that started before the write is not stored.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[Tuple[str, str], CachePolicy]] = None,
+        invalidations: Optional[Dict[Tuple[str, str], Tuple[str, ...]]] = None,
+        max_entries: int = 2000,
+    ):
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.invalidations = dict(DEFAULT_INVALIDATIONS if invalidations is None else invalidations)
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple, _CacheEntry] = {}
+        self._tag_generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __call__(self, call_next: Callable, router_name: str, method_name: str, args: tuple, kwargs: dict) -> Any:
+        endpoint = (router_name, method_name)
+        if endpoint in self.invalidations:
+            try:
+                return call_next(router_name, method_name, args, kwargs)
+            finally:
+                self.invalidate(*self.invalidations[endpoint])
+
+        policy = self.policies.get(endpoint)
+        if policy is None:
+            return call_next(router_name, method_name, args, kwargs)
+
+        key = make_call_key(router_name, method_name, args, kwargs)
+        now = time.monotonic()
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = now - entry.fetched_at
+                if age < policy.ttl:
+                    self.hits += 1
+                    return copy.deepcopy(entry.value)
+                if age < policy.ttl + policy.stale_ttl:
+                    self.stale_hits += 1
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        refresh = True
+                    value = entry.value
+                else:
+                    entry = None
+            if entry is None:
+                self.misses += 1
+            generations = self._generations(policy.tags)
+
+        if entry is not None:
+            if refresh:
+                get_executor().submit(self._refresh, call_next, key, policy, router_name, method_name, args, kwargs)
+            return copy.deepcopy(value)
+
+        value = call_next(router_name, method_name, args, kwargs)
+        self._store(key, policy, value, generations)
+        return copy.deepcopy(value)
+
+    def _generations(self, tags: Tuple[str, ...]) -> Tuple[int, ...]:
+        return tuple(self._tag_generations.get(tag, 0) for tag in tags)
+
+    def _store(self, key: Tuple, policy: CachePolicy, value: Any, generations: Tuple[int, ...]) -> None:
+        with self._lock:
+            if self._generations(policy.tags) != generations:
+                # Invalidated while the request was in flight: the result may predate the write
+                self._entries.pop(key, None)
+                return
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                oldest_key = min(self._entries, key=lambda k: self._entries[k].fetched_at)
+                del self._entries[oldest_key]
+            self._entries[key] = _CacheEntry(value, time.monotonic(), policy)
+
+    def _refresh(self, call_next: Callable, key: Tuple, policy: CachePolicy, router_name: str, method_name: str, args: tuple, kwargs: dict):
+        with self._lock:
+            generations = self._generations(policy.tags)
+        try:
+            value = call_next(router_name, method_name, args, kwargs)
+        except Exception:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.refreshing = False
+            return
+        self._store(key, policy, value, generations)
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every cached entry carrying any of ``tags``."""
+        with self._lock:
+            for tag in tags:
+                self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+            self._entries = {key: entry for key, entry in self._entries.items() if not set(entry.policy.tags) & set(tags)}
+
+    def invalidate_endpoint(self, router_name: str, method_name: str) -> None:
+        with self._lock:
+            self._entries = {key: entry for key, entry in self._entries.items() if key[:2] != (router_name, method_name)}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+            }
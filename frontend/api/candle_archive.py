@@ -0,0 +1,202 @@
+import importlib.util
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+import pandas as pd
+
+from frontend.api.candle_resample import bucket_starts, interval_to_seconds
+
+# Inclusive range of candle open times, in seconds
+Range = Tuple[int, int]
+
+
+def parquet_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None or importlib.util.find_spec("fastparquet") is not None
+
+
+def align(timestamp: float, interval: str) -> int:
+    """Open time of the ``interval`` candle ``timestamp`` falls in."""
+    return int(bucket_starts(int(timestamp), interval))
+
+
+def merge_ranges(ranges: List[Range], step: int) -> List[Range]:
+    """Sort ranges and merge the ones that overlap or touch (the next candle opens right after)."""
+    merged: List[Range] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + step:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_ranges(covered: List[Range], start: int, end: int, step: int) -> List[Range]:
+    """Parts of ``[start, end]`` not in the (merged) ``covered`` ranges."""
+    missing: List[Range] = []
+    cursor = start
+    for covered_start, covered_end in covered:
+        if covered_end < cursor:
+            continue
+        if covered_start > end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start - step))
+        cursor = max(cursor, covered_end + step)
+    if cursor <= end:
+        missing.append((cursor, end))
+    return missing
+
+
+def month_start(timestamp: int) -> datetime:
+    moment = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month_start(timestamp: int) -> int:
+    start = month_start(timestamp)
+    if start.month == 12:
+        return int(start.replace(year=start.year + 1, month=1).timestamp())
+    return int(start.replace(month=start.month + 1).timestamp())
+
+
+def month_chunks(start: int, end: int, interval: str) -> List[Range]:
+    """Split ``[start, end]`` at month boundaries, so each fetch fills (part of) one partition."""
+    step = interval_to_seconds(interval)
+    chunks: List[Range] = []
+    cursor = start
+    while cursor <= end:
+        # Last candle opening before the next month
+        boundary = next_month_start(cursor)
+        chunk_end = min(end, align(boundary - 1, interval))
+        if chunk_end < cursor:
+            chunk_end = cursor
+        chunks.append((cursor, chunk_end))
+        cursor = chunk_end + step
+    return chunks
+
+
+class CandleArchive:
+    """Persistent, month-partitioned candle store shared by every session and kept across restarts.
+
+    Candles live in ``<root>/<connector>/<trading pair>/<interval>/<YYYY-MM>.parquet``, next to a
+    ``coverage.json`` index of the open-time ranges already downloaded. A read only fetches the
+    ranges missing from the index, one month at a time, so an interrupted download keeps its
+    progress. Candles that have not closed yet are fetched on every read and never stored.
+
+    ``fetch(connector, trading_pair, interval, start_time, end_time)`` returns the candles opening in
+    ``[start_time, end_time]`` as a list of dicts with a ``timestamp`` in seconds.
+    """
+
+    def __init__(self, root: str, fetch: Callable[[str, str, str, int, int], List[dict]]):
+        self.root = root
+        self._fetch = fetch
+        self._locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.rows_fetched = 0
+        self.rows_read = 0
+
+    def _series_lock(self, key: Tuple[str, str, str]) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def _series_dir(self, connector: str, trading_pair: str, interval: str) -> str:
+        return os.path.join(self.root, connector, trading_pair, interval)
+
+    def _download(self, connector: str, trading_pair: str, interval: str, start: int, end: int) -> pd.DataFrame:
+        candles = self._fetch(connector, trading_pair, interval, start, end) or []
+        with self._lock:
+            self.fetches += 1
+            self.rows_fetched += len(candles)
+        df = pd.DataFrame(candles)
+        if df.empty or "timestamp" not in df.columns:
+            return pd.DataFrame()
+        return df[(df["timestamp"] >= start) & (df["timestamp"] <= end)]
+
+    def coverage(self, connector: str, trading_pair: str, interval: str) -> List[Range]:
+        """Open-time ranges already stored for a series."""
+        path = os.path.join(self._series_dir(connector, trading_pair, interval), "coverage.json")
+        if not os.path.exists(path):
+            return []
+        with open(path) as f:
+            return [tuple(r) for r in json.load(f)]
+
+    def _save_coverage(self, series_dir: str, covered: List[Range]) -> None:
+        path = os.path.join(series_dir, "coverage.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump([list(r) for r in covered], f)
+        os.replace(path + ".tmp", path)
+
+    def _write(self, series_dir: str, candles: pd.DataFrame) -> None:
+        months = pd.to_datetime(candles["timestamp"], unit="s").dt.strftime("%Y-%m")
+        for month, rows in candles.groupby(months.to_numpy()):
+            path = os.path.join(series_dir, f"{month}.parquet")
+            if os.path.exists(path):
+                rows = pd.concat([pd.read_parquet(path), rows], ignore_index=True)
+            rows = rows.drop_duplicates("timestamp", keep="last").sort_values("timestamp")
+            rows.to_parquet(path + ".tmp", index=False)
+            os.replace(path + ".tmp", path)
+
+    def _read(self, series_dir: str, start: int, end: int) -> pd.DataFrame:
+        frames = []
+        cursor = int(month_start(start).timestamp())
+        while cursor <= end:
+            path = os.path.join(series_dir, f"{month_start(cursor):%Y-%m}.parquet")
+            if os.path.exists(path):
+                frames.append(pd.read_parquet(path))
+            cursor = next_month_start(cursor)
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True)
+        return df[(df["timestamp"] >= start) & (df["timestamp"] <= end)]
+
+    def get(self, connector: str, trading_pair: str, interval: str, start_time: float, end_time: float) -> pd.DataFrame:
+        """Candles opening in ``[start_time, end_time]``, downloading only what isn't stored yet."""
+        step = interval_to_seconds(interval)
+        start = align(start_time, interval)
+        end = align(end_time, interval)
+        # Open time of the last closed candle; anything later is still changing
+        last_closed = align(time.time(), interval) - step
+        stored_end = min(end, last_closed)
+        series_dir = self._series_dir(connector, trading_pair, interval)
+        frames = []
+        with self._series_lock((connector, trading_pair, interval)):
+            if start <= stored_end:
+                covered = self.coverage(connector, trading_pair, interval)
+                # Empty chunks not known to be empty yet; a fetch error raises and records nothing
+                unconfirmed: List[Range] = []
+                for gap_start, gap_end in missing_ranges(covered, start, stored_end, step):
+                    for chunk in month_chunks(gap_start, gap_end, interval):
+                        candles = self._download(connector, trading_pair, interval, *chunk)
+                        # Empty is final only when the market has candles after it (before its listing,
+                        # or a closed gap in its past); otherwise the chunk is retried next time
+                        if candles.empty and not any(covered_start > chunk[1] for covered_start, _ in covered):
+                            unconfirmed.append(chunk)
+                            continue
+                        os.makedirs(series_dir, exist_ok=True)
+                        if candles.empty:
+                            confirmed = [chunk]
+                        else:
+                            self._write(series_dir, candles)
+                            confirmed, unconfirmed = unconfirmed + [chunk], []
+                        covered = merge_ranges(covered + confirmed, step)
+                        self._save_coverage(series_dir, covered)
+                frames.append(self._read(series_dir, start, stored_end))
+        if end > stored_end:
+            frames.append(self._download(connector, trading_pair, interval, max(start, stored_end + step), end))
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame()
+        df = pd.concat(frames, ignore_index=True).drop_duplicates("timestamp", keep="last")
+        df = df.sort_values("timestamp").reset_index(drop=True)
+        with self._lock:
+            self.rows_read += len(df)
+        return df
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"fetches": self.fetches, "rows_fetched": self.rows_fetched, "rows_read": self.rows_read}
@@ -0,0 +1,85 @@
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+# Intervals offered by the exchanges' candle feeds, finest first
+STANDARD_INTERVALS = ["1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "12h", "1d", "1w"]
+# Weekly candles open on Monday 00:00 UTC; the Unix epoch fell on a Thursday
+WEEK_OFFSET = 4 * 86400
+
+# How each candle column is rolled up into a coarser candle
+OHLCV_AGGREGATIONS = {
+    "open": "first",
+    "high": "max",
+    "low": "min",
+    "close": "last",
+    "volume": "sum",
+    "quote_asset_volume": "sum",
+    "n_trades": "sum",
+    "taker_buy_base_volume": "sum",
+    "taker_buy_quote_volume": "sum",
+}
+
+
+def interval_to_seconds(interval: str) -> int:
+    """Length of a candle interval such as ``"15m"`` or ``"4h"`` in seconds."""
+    try:
+        return int(interval[:-1]) * INTERVAL_UNITS[interval[-1]]
+    except (KeyError, ValueError):
+        raise ValueError(f"Unsupported candle interval: {interval!r}")
+
+
+def can_resample(base_interval: str, interval: str) -> bool:
+    """Whether ``interval`` candles can be built exactly from ``base_interval`` candles."""
+    base_step, step = interval_to_seconds(base_interval), interval_to_seconds(interval)
+    return step > base_step and step % base_step == 0
+
+
+def bucket_starts(timestamps: np.ndarray, interval: str) -> np.ndarray:
+    """Open time of the ``interval`` candle each timestamp (in seconds) falls in, aligned like the exchanges."""
+    step = interval_to_seconds(interval)
+    offset = WEEK_OFFSET if step % INTERVAL_UNITS["w"] == 0 else 0
+    return timestamps - (timestamps - offset) % step
+
+
+def resample_candles(candles: pd.DataFrame, interval: str) -> pd.DataFrame:
+    """Aggregate finer candles (``timestamp`` in seconds, sorted) into ``interval`` candles.
+
+    The first bucket is dropped when the base candles start after its open, since its open price would
+    be wrong; the last bucket is kept even if incomplete, as the still-forming candle. Columns without
+    an aggregation rule are dropped.
+    """
+    if candles.empty:
+        return candles
+    timestamps = candles["timestamp"].to_numpy(dtype="float64")
+    buckets = bucket_starts(timestamps, interval)
+    aggregations = {column: rule for column, rule in OHLCV_AGGREGATIONS.items() if column in candles.columns}
+    resampled = candles[list(aggregations)].groupby(buckets, sort=True).agg(aggregations)
+    resampled.insert(0, "timestamp", resampled.index.to_numpy(dtype="float64"))
+    if timestamps[0] != buckets[0]:
+        resampled = resampled.iloc[1:]
+    resampled.index = pd.to_datetime(resampled["timestamp"], unit="s")
+    return resampled
+
+
+def resample_records(candles: List[dict], interval: str) -> List[dict]:
+    """``resample_candles`` for the list-of-dicts candles the backend API returns."""
+    if not candles:
+        return []
+    return resample_candles(pd.DataFrame(candles), interval).to_dict("records")
+
+
+def choose_base_interval(interval: str, span_seconds: float, max_rows: int, base_interval: str = "1m") -> Optional[str]:
+    """Finest standard interval, no finer than ``base_interval``, that ``interval`` can be resampled from
+    with at most ``max_rows`` candles over ``span_seconds``. None when ``interval`` itself is the best option.
+    """
+    base_step = interval_to_seconds(base_interval)
+    for candidate in STANDARD_INTERVALS:
+        step = interval_to_seconds(candidate)
+        if step < base_step or not can_resample(candidate, interval):
+            continue
+        if span_seconds / step <= max_rows:
+            return candidate
+    return None
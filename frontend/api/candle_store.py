@@ -0,0 +1,153 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from frontend.api.candle_resample import can_resample, interval_to_seconds, resample_records
+
+
+class CandleSeries:
+    """Append-only, bounded window of candles for one (connector, trading pair, interval)."""
+
+    def __init__(self, interval: str, max_candles: int):
+        self.interval = interval
+        self.step = interval_to_seconds(interval)
+        self.candles: deque = deque(maxlen=max_candles)
+        # The store fetches a series from one thread at a time, so concurrent sessions share each tail fetch
+        self.lock = threading.Lock()
+        self.last_fetch = 0.0
+        # Records asked for by the last full download; the exchange may have had fewer
+        self.window = 0
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return self.candles[-1]["timestamp"] if self.candles else None
+
+    def replace(self, candles: List[dict]) -> None:
+        self.candles.clear()
+        self.candles.extend(sorted(candles, key=lambda c: c["timestamp"]))
+
+    def merge(self, candles: List[dict]) -> bool:
+        """Append candles newer than the cached ones; the ones overlapping the tail (the forming candle)
+        replace their cached version. Returns False when the fetched candles leave a gap."""
+        if not candles:
+            return True
+        candles = sorted(candles, key=lambda c: c["timestamp"])
+        first = candles[0]["timestamp"]
+        if self.candles and first > self.candles[-1]["timestamp"] + self.step:
+            return False
+        while self.candles and self.candles[-1]["timestamp"] >= first:
+            self.candles.pop()
+        self.candles.extend(candles)
+        return True
+
+    def tail(self, max_records: int) -> List[dict]:
+        return list(self.candles)[-max_records:]
+
+
+class CandleStore:
+    """Process-wide incremental candle cache shared by every session.
+
+    The first read of a series downloads the full window. Later reads only fetch the candles opened
+    since the last cached one, plus the forming candle, which replaces its cached version. Each series
+    keeps at most ``max_candles``.
+
+    Intervals that are a multiple of ``base_interval`` are resampled locally from the base series
+    (kept at least ``base_candles`` long) whenever it can cover the requested window, so switching
+    between them needs no request. Pass ``base_interval=None`` to always fetch each interval natively.
+
+    ``fetch(connector, trading_pair, interval, max_records)`` returns the last ``max_records`` candles
+    as a list of dicts with a ``timestamp`` in seconds.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str, str, int], List[dict]],
+        max_candles: int = 5000,
+        base_interval: Optional[str] = "1m",
+        base_candles: int = 2000,
+    ):
+        self._fetch = fetch
+        self.max_candles = max_candles
+        self.base_interval = base_interval
+        self.base_candles = min(base_candles, max_candles)
+        self._series: Dict[Tuple[str, str, str], CandleSeries] = {}
+        self._lock = threading.Lock()
+        # Candle rows downloaded, and rows handed to callers
+        self.rows_fetched = 0
+        self.rows_served = 0
+        self.fetches = 0
+
+    def _get_series(self, connector: str, trading_pair: str, interval: str) -> CandleSeries:
+        with self._lock:
+            series = self._series.get((connector, trading_pair, interval))
+            if series is None:
+                series = CandleSeries(interval, self.max_candles)
+                self._series[(connector, trading_pair, interval)] = series
+            return series
+
+    def _download(self, connector: str, trading_pair: str, interval: str, max_records: int) -> List[dict]:
+        candles = self._fetch(connector, trading_pair, interval, max_records) or []
+        with self._lock:
+            self.fetches += 1
+            self.rows_fetched += len(candles)
+        return candles
+
+    def get(self, connector: str, trading_pair: str, interval: str, max_records: int = 100, max_age: float = 0.0) -> List[dict]:
+        """The last ``max_records`` candles, fetching only what is missing from the cached window.
+
+        ``max_age`` skips the tail fetch entirely when the series was refreshed that recently.
+        """
+        candles = None
+        if self.base_interval == interval:
+            # Keep the base series deep enough that switching to a coarser interval needs no request
+            candles = self._read(connector, trading_pair, interval, max(max_records, self.base_candles), max_age)[-max_records:]
+        elif self.base_interval and can_resample(self.base_interval, interval):
+            ratio = interval_to_seconds(interval) // interval_to_seconds(self.base_interval)
+            # One extra bucket, since the first one is dropped when the base window starts mid-bucket
+            base_records = max(ratio * (max_records + 1), self.base_candles)
+            if base_records <= self.max_candles:
+                base = self._read(connector, trading_pair, self.base_interval, base_records, max_age)
+                candles = resample_records(base, interval)[-max_records:]
+        if candles is None:
+            candles = self._read(connector, trading_pair, interval, max_records, max_age)
+        with self._lock:
+            self.rows_served += len(candles)
+        return candles
+
+    def _read(self, connector: str, trading_pair: str, interval: str, max_records: int, max_age: float) -> List[dict]:
+        max_records = min(max_records, self.max_candles)
+        series = self._get_series(connector, trading_pair, interval)
+        with series.lock:
+            now = time.time()
+            if series.window < max_records or not series.candles:
+                # Cold series or a longer window than cached: download the whole window once
+                series.replace(self._download(connector, trading_pair, interval, max_records))
+                series.window = max_records
+                series.last_fetch = now
+            elif now - series.last_fetch >= max_age:
+                # Candles opened since the last cached one, plus the cached (possibly still forming) last one
+                missing = int((now - series.last_timestamp) // series.step) + 1
+                if missing >= max_records:
+                    series.replace(self._download(connector, trading_pair, interval, max_records))
+                elif not series.merge(self._download(connector, trading_pair, interval, missing + 1)):
+                    series.replace(self._download(connector, trading_pair, interval, max_records))
+                series.last_fetch = now
+            return series.tail(max_records)
+
+    def invalidate(self, connector: Optional[str] = None, trading_pair: Optional[str] = None) -> None:
+        """Drop the cached series of a market (or all of them) so the next read downloads the full window."""
+        with self._lock:
+            for key in list(self._series):
+                if (connector is None or key[0] == connector) and (trading_pair is None or key[1] == trading_pair):
+                    del self._series[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "series": len(self._series),
+                "candles": sum(len(series.candles) for series in self._series.values()),
+                "fetches": self.fetches,
+                "rows_fetched": self.rows_fetched,
+                "rows_served": self.rows_served,
+            }
@@ -0,0 +1,234 @@
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackendClientPool:
+    """Process-wide pool of backend API clients shared by every Streamlit session.
+
+    ``SyncHummingbotAPIClient`` drives its own event loop, so a single instance can't be used by
+    two script threads at the same time. The pool keeps up to ``size`` entered clients (each one
+    holding a keep-alive HTTP session) and leases them per call, which bounds the number of sockets
+    open to the API no matter how many browser tabs are connected.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        size: int = 4,
+        health_check_interval: float = 30.0,
+        lease_timeout: float = 60.0,
+        timeout: Optional[float] = None,
+    ):
+        self.base_url = base_url
+        self._username = username
+        self._password = password
+        self._timeout = timeout
+        self.size = max(1, int(size))
+        self.health_check_interval = health_check_interval
+        self.lease_timeout = lease_timeout
+
+        self._idle = deque()
+        self._clients = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._stop_event = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._middlewares = []
+        # Calls made by pages, and the ones that reached the API after the middlewares (cache, coalescing)
+        self.calls = 0
+        self.requests = 0
+
+        # Health state, refreshed on a timer instead of once per session
+        self.reachable = False
+        self.docker_running = False
+        self.last_error: Optional[str] = None
+        self.last_health_check = 0.0
+
+    def _create_client(self):
+        from hummingbot_api_client import SyncHummingbotAPIClient
+
+        client = SyncHummingbotAPIClient(
+            base_url=self.base_url,
+            username=self._username,
+            password=self._password,
+            timeout=self._timeout,
+        )
+        client.__enter__()
+        with self._lock:
+            self._clients.append(client)
+        return client
+
+    def _discard_client(self, client):
+        with self._lock:
+            if client in self._clients:
+                self._clients.remove(client)
+        try:
+            client.__exit__(None, None, None)
+        except Exception:
+            pass  # Ignore cleanup errors
+
+    @contextmanager
+    def lease(self):
+        """Borrow a client for exclusive use, creating one lazily while the pool has free slots."""
+        if self._closed:
+            raise RuntimeError("Backend client pool is closed")
+        if not self._slots.acquire(timeout=self.lease_timeout):
+            raise TimeoutError(f"No backend client available after {self.lease_timeout:.0f}s (pool size {self.size})")
+        client = None
+        try:
+            with self._lock:
+                client = self._idle.popleft() if self._idle else None
+            if client is None:
+                client = self._create_client()
+            yield client
+        except RuntimeError:
+            # A client whose event loop is broken can't be reused safely
+            if client is not None:
+                self._discard_client(client)
+                client = None
+            raise
+        finally:
+            if client is not None:
+                with self._lock:
+                    if self._closed:
+                        client_to_close = client
+                    else:
+                        self._idle.append(client)
+                        client_to_close = None
+                if client_to_close is not None:
+                    self._discard_client(client_to_close)
+            self._slots.release()
+
+    def add_middleware(self, middleware: Callable) -> None:
+        """Wrap every pooled call with ``middleware(call_next, router_name, method_name, args, kwargs)``.
+
+        Middlewares added first are outermost.
+        """
+        self._middlewares.append(middleware)
+
+    def get_middleware(self, middleware_type: type):
+        return next((m for m in self._middlewares if isinstance(m, middleware_type)), None)
+
+    def _leased_call(self, router_name: str, method_name: str, args: tuple, kwargs: dict) -> Any:
+        with self.lease() as client:
+            return getattr(getattr(client, router_name), method_name)(*args, **kwargs)
+
+    def _request(self, router_name: str, method_name: str, args: tuple, kwargs: dict) -> Any:
+        with self._lock:
+            self.requests += 1
+        return self._leased_call(router_name, method_name, args, kwargs)
+
+    def call(self, router_name: str, method_name: str, *args, **kwargs) -> Any:
+        """Run ``client.<router_name>.<method_name>(*args, **kwargs)`` through the middlewares on a leased client."""
+        with self._lock:
+            self.calls += 1
+        call_next = self._request
+        for middleware in reversed(self._middlewares):
+            call_next = functools.partial(middleware, call_next)
+        return call_next(router_name, method_name, args, kwargs)
+
+    def check_health(self) -> bool:
+        """Check that the API is reachable and Docker is running, updating the cached health state."""
+        try:
+            docker_running = bool(self._leased_call("docker", "is_running", (), {}))
+            self.reachable = True
+            self.docker_running = docker_running
+            self.last_error = None if docker_running else "Docker is not running. Please make sure Docker is running."
+        except Exception as e:
+            self.reachable = False
+            self.docker_running = False
+            self.last_error = f"Failed to initialize API client: {str(e)}"
+        self.last_health_check = time.time()
+        return self.is_healthy()
+
+    def is_healthy(self) -> bool:
+        return self.reachable and self.docker_running
+
+    def _health_loop(self):
+        while not self._stop_event.wait(self.health_check_interval):
+            self.check_health()
+
+    def start(self):
+        """Run a first health check and start the periodic health checker."""
+        self.check_health()
+        if self._health_thread is None and self.health_check_interval > 0:
+            self._health_thread = threading.Thread(target=self._health_loop, name="backend-api-health", daemon=True)
+            self._health_thread.start()
+        return self
+
+    def close(self):
+        """Stop the health checker and exit every client context."""
+        self._closed = True
+        self._stop_event.set()
+        if self._health_thread is not None and self._health_thread is not threading.current_thread():
+            self._health_thread.join(timeout=5)
+        with self._lock:
+            clients = list(self._clients)
+            self._clients.clear()
+            self._idle.clear()
+        for client in clients:
+            try:
+                client.__exit__(None, None, None)
+            except Exception:
+                pass  # Ignore cleanup errors
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "open_clients": len(self._clients),
+                "idle_clients": len(self._idle),
+                "healthy": self.is_healthy(),
+                "last_health_check": self.last_health_check,
+                "calls": self.calls,
+                "requests": self.requests,
+            }
+
+    def client(self) -> "PooledBackendClient":
+        return PooledBackendClient(self)
+
+
+class PooledBackendClient:
+    """Drop-in stand-in for ``SyncHummingbotAPIClient`` that routes every call through the pool.
+
+    Pages keep using ``client.<router>.<method>(...)``; each call leases a pooled client for its
+    duration only.
+    """
+
+    def __init__(self, pool: BackendClientPool):
+        self._pool = pool
+
+    @property
+    def pool(self) -> BackendClientPool:
+        return self._pool
+
+    def __getattr__(self, router_name: str) -> "_PooledRouter":
+        if router_name.startswith("_"):
+            raise AttributeError(router_name)
+        return _PooledRouter(self._pool, router_name)
+
+
+class _PooledRouter:
+    def __init__(self, pool: BackendClientPool, router_name: str):
+        self._pool = pool
+        self._router_name = router_name
+
+    def __getattr__(self, method_name: str):
+        if method_name.startswith("_"):
+            raise AttributeError(method_name)
+
+        def pooled_call(*args, **kwargs):
+            return self._pool.call(self._router_name, method_name, *args, **kwargs)
+
+        pooled_call.__name__ = method_name
+        return pooled_call
@@ -0,0 +1,150 @@
+import contextvars
+import heapq
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Shared, bounded thread pool used for every fan-out in the process."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from CONFIG import BACKEND_API_FANOUT_WORKERS
+
+            _executor = ThreadPoolExecutor(max_workers=BACKEND_API_FANOUT_WORKERS, thread_name_prefix="backend-fanout")
+        return _executor
+
+
+class FanOutResult:
+    """Ordered results of a fan-out; failed items keep ``None`` in ``results`` and their error in ``errors``."""
+
+    def __init__(self, items: List[Any], results: List[Any], errors: Dict[int, Exception]):
+        self.items = items
+        self.results = results
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def failures(self) -> List[tuple]:
+        """(item, exception) pairs for the calls that raised or timed out, in input order."""
+        return [(self.items[i], self.errors[i]) for i in sorted(self.errors)]
+
+    def successes(self) -> List[tuple]:
+        """(item, result) pairs for the calls that completed, in input order."""
+        return [(item, result) for i, (item, result) in enumerate(zip(self.items, self.results)) if i not in self.errors]
+
+    def to_dict(self, default: Any = None) -> Dict[Any, Any]:
+        """Map each item to its result, using ``default`` for failures."""
+        return {item: (default if i in self.errors else result) for i, (item, result) in enumerate(zip(self.items, self.results))}
+
+    def __iter__(self):
+        for i, (item, result) in enumerate(zip(self.items, self.results)):
+            yield item, result, self.errors.get(i)
+
+    def __len__(self):
+        return len(self.items)
+
+
+def fan_out(
+    fn: Callable[[Any], Any],
+    items: Iterable[Any],
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    on_result: Optional[Callable[[Any, Any, Optional[Exception]], None]] = None,
+    not_before: Optional[Callable[[Any], float]] = None,
+) -> FanOutResult:
+    """Call ``fn(item)`` for every item concurrently on the shared thread pool.
+
+    ``timeout`` applies to each call, measured from when it starts running; a call that exceeds it is
+    reported as a ``TimeoutError`` and no longer waited for. ``max_concurrency`` caps how many calls of
+    this fan-out run at once (e.g. to respect an exchange rate limit). Exceptions never propagate: they
+    are collected per item so callers can render partial results.
+
+    Throttling happens on the calling thread, never in the shared workers: at most ``max_concurrency``
+    calls are submitted and the next one only as one finishes. ``not_before(item)`` is asked for each
+    item as it gets a slot and returns the ``time.monotonic()`` time it may start (e.g. a rate limiter
+    reservation); the call is submitted once that time has come.
+
+    ``on_result(item, result, error)`` is called as each call finishes (or times out), in completion
+    order and on the calling thread, so it may update the page (e.g. a progress bar).
+
+    ``fn`` runs outside the Streamlit script thread, so it must not call ``st.*``.
+    """
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    errors: Dict[int, Exception] = {}
+    if not items:
+        return FanOutResult(items, results, errors)
+
+    started: List[Optional[float]] = [None] * len(items)
+    limit = max_concurrency or len(items)
+
+    def run(index, item):
+        started[index] = time.monotonic()
+        return fn(item)
+
+    executor = get_executor()
+    futures: Dict[Any, int] = {}
+    pending: set = set()
+    scheduled: List[tuple] = []  # (start time, index) heap of items holding a slot but not submitted yet
+    next_index = 0
+
+    def finish(index, result, error):
+        results[index] = result
+        if error is not None:
+            errors[index] = error
+        if on_result is not None:
+            on_result(items[index], result, error)
+
+    while next_index < len(items) or scheduled or pending:
+        now = time.monotonic()
+        while next_index < len(items) and len(pending) + len(scheduled) < limit:
+            start = not_before(items[next_index]) if not_before is not None else now
+            heapq.heappush(scheduled, (start, next_index))
+            next_index += 1
+        while scheduled and scheduled[0][0] <= now:
+            _, index = heapq.heappop(scheduled)
+            # Each call runs in a copy of the caller's context so per-rerun state (e.g. the API tracer) follows it
+            future = executor.submit(contextvars.copy_context().run, run, index, items[index])
+            futures[future] = index
+            pending.add(future)
+
+        wait_for = None
+        if scheduled:
+            wait_for = max(0.0, scheduled[0][0] - now)
+        if timeout is not None and pending:
+            deadlines = [started[futures[f]] + timeout for f in pending if started[futures[f]] is not None]
+            if deadlines:
+                wait_for = min(wait_for if wait_for is not None else float("inf"), max(0.0, min(deadlines) - now))
+            # Calls still queued behind the pool have no deadline yet; poll until they start
+            if len(deadlines) < len(pending):
+                wait_for = min(wait_for if wait_for is not None else 0.05, 0.05)
+
+        if not pending:
+            time.sleep(wait_for or 0)
+            continue
+        done, pending = wait(pending, timeout=wait_for, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, e
+            finish(futures[future], result, error)
+
+        if timeout is not None:
+            now = time.monotonic()
+            for future in list(pending):
+                index = futures[future]
+                if started[index] is not None and now - started[index] >= timeout:
+                    future.cancel()
+                    pending.discard(future)
+                    finish(index, None, TimeoutError(f"Call for {items[index]!r} timed out after {timeout:.1f}s"))
+
+    return FanOutResult(items, results, errors)
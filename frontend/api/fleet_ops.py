@@ -0,0 +1,91 @@
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from frontend.api.fanout import fan_out
+
+
+def controller_targets(bots: Dict[str, dict]) -> List[dict]:
+    """One row per controller of the running bots in a fleet snapshot, with the fields operations select on."""
+    targets = []
+    for bot_name, bot in bots.items():
+        if bot["status"].get("data", {}).get("status") != "running":
+            continue
+        for config in bot["controller_configs"]:
+            targets.append(
+                {
+                    "bot_name": bot_name,
+                    "controller_id": config.get("id"),
+                    "controller_name": config.get("controller_name", config.get("id")),
+                    "controller_type": config.get("controller_type", ""),
+                    "connector_name": config.get("connector_name", ""),
+                    "trading_pair": config.get("trading_pair", ""),
+                    "stopped": bool(config.get("manual_kill_switch", False)),
+                }
+            )
+    return targets
+
+
+def select_controllers(
+    targets: List[dict],
+    bot_glob: str = "",
+    connectors: Iterable[str] = (),
+    trading_pairs: Iterable[str] = (),
+    controller_types: Iterable[str] = (),
+    controller_names: Iterable[str] = (),
+) -> List[dict]:
+    """Targets matching every given selector: a bot name glob (``*``, ``?``, ``[...]``) and value lists.
+
+    An empty selector matches everything.
+    """
+    connectors, trading_pairs = set(connectors), set(trading_pairs)
+    controller_types, controller_names = set(controller_types), set(controller_names)
+    return [
+        target
+        for target in targets
+        if (not bot_glob or fnmatch(target["bot_name"], bot_glob))
+        and (not connectors or target["connector_name"] in connectors)
+        and (not trading_pairs or target["trading_pair"] in trading_pairs)
+        and (not controller_types or target["controller_type"] in controller_types)
+        and (not controller_names or target["controller_name"] in controller_names)
+    ]
+
+
+def set_kill_switch(
+    update: Callable[[str, str, dict], Any],
+    targets: List[dict],
+    stop: bool,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+    on_result: Optional[Callable[[dict], None]] = None,
+) -> List[dict]:
+    """Stop (``stop=True``) or start every target controller concurrently; returns one result row per controller.
+
+    ``update(bot_name, controller_id, config)`` sends one ``update_bot_controller_config``. At most
+    ``max_concurrency`` updates are in flight, across all bots. ``on_result(row)`` gets each result
+    row as it completes, on the calling thread.
+    """
+    action = "stop" if stop else "start"
+
+    def run(target):
+        return update(target["bot_name"], target["controller_id"], {"manual_kill_switch": stop})
+
+    def result_row(target, response, error):
+        if error is not None:
+            status, message = "failed", str(error)
+        elif isinstance(response, dict) and response.get("status", "success") != "success":
+            status, message = "failed", response.get("message", "Unknown error")
+        else:
+            status, message = "done", ""
+        return {
+            "bot_name": target["bot_name"],
+            "controller_id": target["controller_id"],
+            "connector_name": target.get("connector_name", ""),
+            "trading_pair": target.get("trading_pair", ""),
+            "action": action,
+            "status": status,
+            "message": message,
+        }
+
+    notify = (lambda target, response, error: on_result(result_row(target, response, error))) if on_result else None
+    result = fan_out(run, targets, timeout=timeout, max_concurrency=max_concurrency, on_result=notify)
+    return [result_row(target, response, error) for target, response, error in result]
@@ -0,0 +1,255 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from frontend.api.fanout import fan_out
+from frontend.api.log_tail import LogTail
+
+logger = logging.getLogger(__name__)
+
+# Bot states worth showing; anything else is a container still starting or being removed
+LISTED_STATES = ("running", "stopped")
+# Log sections of a get_bot_status payload, moved into per-bot LogTails
+LOG_KINDS = {"error": "error_logs", "general": "general_logs"}
+SUMMARY_COLUMNS = [
+    "bot_name", "status", "controllers", "active", "stopped", "errors",
+    "net_pnl", "unrealized_pnl", "net_pnl_pct", "volume", "error_logs",
+]
+
+
+def bot_summary(bot_name: str, bot: dict) -> dict:
+    """One fleet table row: a bot's status, controller counts and PnL and volume summed over its controllers."""
+    data = bot["status"].get("data", {})
+    configs = {config.get("id"): config for config in bot["controller_configs"]}
+    row = {
+        "bot_name": bot_name,
+        "status": data.get("status", "unknown"),
+        "controllers": 0,
+        "active": 0,
+        "stopped": 0,
+        "errors": 0,
+        "net_pnl": 0.0,
+        "unrealized_pnl": 0.0,
+        "volume": 0.0,
+        "error_logs": len(bot["logs"]["error"]) if "logs" in bot else len(data.get("error_logs") or []),
+    }
+    for controller, inner in (data.get("performance") or {}).items():
+        row["controllers"] += 1
+        if inner.get("status") == "error":
+            row["errors"] += 1
+            continue
+        performance = inner.get("performance", {})
+        if configs.get(controller, {}).get("manual_kill_switch", False):
+            row["stopped"] += 1
+        else:
+            row["active"] += 1
+        row["net_pnl"] += performance.get("global_pnl_quote", 0) or 0
+        row["unrealized_pnl"] += performance.get("unrealized_pnl_quote", 0) or 0
+        row["volume"] += performance.get("volume_traded", 0) or 0
+    row["net_pnl_pct"] = row["net_pnl"] / row["volume"] if row["volume"] > 0 else 0.0
+    return row
+
+
+class FleetSnapshot:
+    """Immutable view of the bot fleet at one poll.
+
+    ``bots`` maps each bot name to ``{"status": <get_bot_status response>, "controller_configs": [...],
+    "logs": {"error": LogTail, "general": LogTail}, "version": int, "updated_at": float}``. The status
+    comes without its log lines, which live in the bot's log tails instead. ``version`` moves whenever
+    any bot changed, and a bot's own ``version`` only when that bot did, so viewers can skip work for
+    the bots that didn't.
+    """
+
+    def __init__(
+        self,
+        bots: Dict[str, dict],
+        version: int,
+        updated_at: float,
+        error: Optional[str] = None,
+        summary: Optional[pd.DataFrame] = None,
+    ):
+        self.bots = bots
+        self.version = version
+        self.updated_at = updated_at
+        self.error = error
+        self._summary = summary
+
+    def summary(self) -> pd.DataFrame:
+        """One row per bot (see ``bot_summary``), built once per fleet version and shared by every viewer."""
+        if self._summary is None:
+            self._summary = pd.DataFrame(
+                [bot_summary(bot_name, bot) for bot_name, bot in self.bots.items()],
+                columns=SUMMARY_COLUMNS,
+            )
+        return self._summary
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.updated_at
+
+
+class FleetPoller:
+    """Process-wide background poller of bot statuses and controller configs.
+
+    Every ``interval`` seconds one thread lists the active bots and fetches each bot's status (and
+    controller configs when it is running) concurrently, then publishes a new ``FleetSnapshot``. Pages
+    render from ``snapshot()``, so backend load is one status and one config request per bot per
+    interval however many sessions are open. Polling pauses once nobody has read the snapshot for
+    ``idle_timeout`` seconds and resumes on the next read.
+    """
+
+    def __init__(
+        self,
+        fetch_active_bots: Callable[[], Any],
+        fetch_bot_status: Callable[[str], dict],
+        fetch_controller_configs: Callable[[str], List[dict]],
+        interval: float = 10.0,
+        idle_timeout: float = 300.0,
+        timeout: Optional[float] = None,
+        max_log_lines: int = 1000,
+    ):
+        self._fetch_active_bots = fetch_active_bots
+        self._fetch_bot_status = fetch_bot_status
+        self._fetch_controller_configs = fetch_controller_configs
+        self.interval = interval
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.max_log_lines = max_log_lines
+        self._logs: Dict[str, Dict[str, LogTail]] = {}
+        self._snapshot: Optional[FleetSnapshot] = None
+        self._lock = threading.Lock()
+        self._polled = threading.Condition(self._lock)
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_read = time.monotonic()
+        self.polls = 0
+
+    def _fetch_bot(self, bot_name: str) -> dict:
+        status = self._fetch_bot_status(bot_name)
+        configs = []
+        if isinstance(status, dict) and status.get("data", {}).get("status") == "running":
+            try:
+                configs = self._fetch_controller_configs(bot_name) or []
+            except Exception as e:
+                logger.warning("Could not fetch controller configs for %s: %s", bot_name, e)
+        return {"status": status, "controller_configs": configs}
+
+    def _tail_logs(self, bot_name: str, status: dict) -> dict:
+        """Move the status payload's log lines into the bot's log tails; returns the status without them."""
+        tails = self._logs.setdefault(bot_name, {kind: LogTail(self.max_log_lines) for kind in LOG_KINDS})
+        data = dict(status.get("data", {}))
+        for kind, field in LOG_KINDS.items():
+            tails[kind].extend(data.pop(field, None) or [])
+        return {**status, "data": data}
+
+    def poll(self) -> FleetSnapshot:
+        """Fetch the fleet state now and publish it as the new snapshot."""
+        previous = self._snapshot
+        bots = dict(previous.bots) if previous else {}
+        error = None
+        try:
+            response = self._fetch_active_bots()
+            if not isinstance(response, dict) or response.get("status") != "success":
+                raise RuntimeError("Failed to fetch active bots status.")
+            names = list((response.get("data") or {}).keys())
+            result = fan_out(self._fetch_bot, names, timeout=self.timeout)
+            now = time.time()
+            fresh = {}
+            for bot_name, bot, fetch_error in result:
+                if fetch_error is not None or bot["status"].get("status") != "success":
+                    continue
+                if bot["status"].get("data", {}).get("status") not in LISTED_STATES:
+                    continue
+                # Logs repeat in every payload; only lines past each tail's cursor are kept
+                bot["status"] = self._tail_logs(bot_name, bot["status"])
+                bot["logs"] = self._logs[bot_name]
+                bot["log_sequence"] = tuple(tail.sequence for tail in bot["logs"].values())
+                held = bots.get(bot_name)
+                if (
+                    held
+                    and held["status"] == bot["status"]
+                    and held["controller_configs"] == bot["controller_configs"]
+                    and held["log_sequence"] == bot["log_sequence"]
+                ):
+                    fresh[bot_name] = held
+                else:
+                    fresh[bot_name] = {**bot, "version": (held["version"] + 1) if held else 1, "updated_at": now}
+            bots = fresh
+            for bot_name in set(self._logs) - set(bots):
+                del self._logs[bot_name]
+        except Exception as e:
+            # Keep serving the last known fleet
+            error = str(e)
+        changed = previous is None or bots.keys() != previous.bots.keys() or any(
+            bot is not previous.bots.get(name) for name, bot in bots.items()
+        )
+        version = (previous.version if previous else 0) + (1 if changed else 0)
+        # An unchanged fleet keeps the summary table already built for it
+        summary = None if changed else previous._summary
+        snapshot = FleetSnapshot(bots, version, time.time(), error, summary)
+        with self._polled:
+            self._snapshot = snapshot
+            self.polls += 1
+            self._polled.notify_all()
+        return snapshot
+
+    def _loop(self):
+        while not self._stop_event.is_set():
+            if time.monotonic() - self._last_read <= self.idle_timeout:
+                try:
+                    self.poll()
+                except Exception:
+                    logger.exception("Fleet poll failed")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def start(self) -> "FleetPoller":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="fleet-poller", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        self._stop_event.set()
+        self._wake.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def refresh(self, wait: Optional[float] = None) -> Optional[FleetSnapshot]:
+        """Poll right away instead of at the next tick, e.g. after stopping a bot; waits up to ``wait`` seconds."""
+        with self._lock:
+            polls = self.polls
+        self._last_read = time.monotonic()
+        self._wake.set()
+        if wait:
+            with self._polled:
+                self._polled.wait_for(lambda: self.polls > polls, timeout=wait)
+        return self._snapshot
+
+    def snapshot(self, wait: float = 0.0) -> Optional[FleetSnapshot]:
+        """The latest fleet snapshot, waiting up to ``wait`` seconds for the first poll.
+
+        A read after an idle pause wakes the poller, so the following reads are fresh again.
+        """
+        idle = time.monotonic() - self._last_read > self.idle_timeout
+        self._last_read = time.monotonic()
+        if idle or self._snapshot is None:
+            self._wake.set()
+        if self._snapshot is None and wait:
+            with self._polled:
+                self._polled.wait_for(lambda: self._snapshot is not None, timeout=wait)
+        return self._snapshot
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "polls": self.polls,
+            "bots": len(snapshot.bots) if snapshot else 0,
+            "version": snapshot.version if snapshot else 0,
+            "age": snapshot.age if snapshot else None,
+        }
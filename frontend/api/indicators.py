@@ -0,0 +1,228 @@
+import math
+from collections import deque
+from itertools import islice
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+NAN = float("nan")
+
+
+class Indicator:
+    """Streaming indicator whose state after each closed candle takes O(1) memory and time to advance.
+
+    ``step(state, candle)`` is pure: it returns the next state and the indicator values without
+    touching ``state``. ``update`` commits a closed candle; ``preview`` evaluates the still-forming
+    candle on top of the committed state, so the next refresh can drop it and apply its newer version.
+    """
+
+    columns: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self._state = self.initial_state()
+
+    def initial_state(self) -> Any:
+        raise NotImplementedError
+
+    def step(self, state: Any, candle: dict) -> Tuple[Any, Tuple[float, ...]]:
+        raise NotImplementedError
+
+    def update(self, candle: dict) -> Tuple[float, ...]:
+        self._state, values = self.step(self._state, candle)
+        return values
+
+    def preview(self, candle: dict) -> Tuple[float, ...]:
+        return self.step(self._state, candle)[1]
+
+
+class EMA(Indicator):
+    """Exponential moving average of the close, seeded with the simple average of the first ``period`` closes."""
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self.columns = (f"ema_{period}",)
+        super().__init__()
+
+    def initial_state(self):
+        return 0, 0.0, NAN  # candles seen, sum of the seed closes, average
+
+    def step(self, state, candle):
+        count, seed_sum, value = state
+        close = float(candle["close"])
+        count += 1
+        if count < self.period:
+            return (count, seed_sum + close, NAN), (NAN,)
+        if count == self.period:
+            value = (seed_sum + close) / self.period
+        else:
+            value += self.alpha * (close - value)
+        return (count, 0.0, value), (value,)
+
+
+class VWAP(Indicator):
+    """Volume-weighted average typical price, reset at the start of every UTC day like exchange session VWAPs."""
+
+    columns = ("vwap",)
+
+    def __init__(self, anchor_seconds: int = 86400):
+        self.anchor_seconds = anchor_seconds
+        super().__init__()
+
+    def initial_state(self):
+        return None, 0.0, 0.0  # anchor period, sum of price * volume, sum of volume
+
+    def step(self, state, candle):
+        anchor, price_volume, volume = state
+        candle_anchor = int(candle["timestamp"]) // self.anchor_seconds
+        if candle_anchor != anchor:
+            anchor, price_volume, volume = candle_anchor, 0.0, 0.0
+        typical = (float(candle["high"]) + float(candle["low"]) + float(candle["close"])) / 3
+        candle_volume = float(candle.get("volume") or 0.0)
+        price_volume += typical * candle_volume
+        volume += candle_volume
+        return (anchor, price_volume, volume), (price_volume / volume if volume else NAN,)
+
+
+class BollingerBands(Indicator):
+    """Moving average of the close ± ``width`` population standard deviations over ``period`` candles.
+
+    The mean and the sum of squared deviations are slid with Welford's update (the new close in, the
+    oldest out), and recomputed from the window every ``resync_every`` candles so rounding errors
+    don't build up.
+    """
+
+    def __init__(self, period: int = 20, width: float = 2.0, resync_every: int = 1000):
+        self.period = period
+        self.width = width
+        self.resync_every = resync_every
+        self.columns = (f"bb_mid_{period}", f"bb_upper_{period}", f"bb_lower_{period}")
+        self._window: deque = deque(maxlen=period)
+        self._updates = 0
+        super().__init__()
+
+    def initial_state(self):
+        return 0.0, 0.0  # mean, sum of squared deviations of the window
+
+    def step(self, state, candle):
+        mean, m2 = state
+        close = float(candle["close"])
+        count = len(self._window)
+        if count < self.period:
+            count += 1
+            delta = close - mean
+            mean += delta / count
+            m2 += delta * (close - mean)
+        else:
+            oldest = self._window[0]
+            new_mean = mean + (close - oldest) / count
+            m2 += (close - oldest) * (close - new_mean + oldest - mean)
+            mean = new_mean
+        if count < self.period:
+            return (mean, m2), (NAN, NAN, NAN)
+        deviation = math.sqrt(max(m2, 0.0) / count)
+        return (mean, m2), (mean, mean + self.width * deviation, mean - self.width * deviation)
+
+    def update(self, candle):
+        values = super().update(candle)
+        self._window.append(float(candle["close"]))
+        self._updates += 1
+        if self._updates % self.resync_every == 0:
+            window = np.fromiter(self._window, dtype=float)
+            self._state = (float(window.mean()), float(((window - window.mean()) ** 2).sum()))
+        return values
+
+
+class ATR(Indicator):
+    """Average true range with Wilder's smoothing, seeded with the simple average of the first ``period`` ranges."""
+
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.columns = (f"atr_{period}",)
+        super().__init__()
+
+    def initial_state(self):
+        return None, 0, 0.0, NAN  # previous close, ranges seen, sum of the seed ranges, average
+
+    def step(self, state, candle):
+        previous_close, count, seed_sum, value = state
+        high, low, close = float(candle["high"]), float(candle["low"]), float(candle["close"])
+        true_range = high - low
+        if previous_close is not None:
+            true_range = max(true_range, abs(high - previous_close), abs(low - previous_close))
+        count += 1
+        if count < self.period:
+            return (close, count, seed_sum + true_range, NAN), (NAN,)
+        if count == self.period:
+            value = (seed_sum + true_range) / self.period
+        else:
+            value = (value * (self.period - 1) + true_range) / self.period
+        return (close, count, 0.0, value), (value,)
+
+
+class IndicatorSet:
+    """Indicator values for one candle series, advanced only by the candles closed since the last sync.
+
+    ``sync(candles)`` takes the chart's candle window (oldest first, the last one still forming),
+    commits the closed candles newer than the last committed one, previews the forming candle and
+    returns the values aligned with the window. A window that starts before the committed history
+    or doesn't overlap it (another market, interval or a gap) restarts the indicators from it.
+    """
+
+    def __init__(self, factories: Sequence, max_points: int = 5000):
+        self._factories = list(factories)
+        self.max_points = max_points
+        self.resets = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.indicators: List[Indicator] = [factory() for factory in self._factories]
+        self._timestamps: deque = deque(maxlen=self.max_points)
+        self._values: deque = deque(maxlen=self.max_points)
+        self.updates = 0
+
+    @property
+    def columns(self) -> List[str]:
+        return [column for indicator in self.indicators for column in indicator.columns]
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return self._timestamps[-1] if self._timestamps else None
+
+    def _commit(self, candle: dict) -> None:
+        values = tuple(value for indicator in self.indicators for value in indicator.update(candle))
+        self._timestamps.append(float(candle["timestamp"]))
+        self._values.append(values)
+        self.updates += 1
+
+    def sync(self, candles: List[dict]) -> pd.DataFrame:
+        if not candles:
+            return pd.DataFrame(columns=["timestamp"] + self.columns)
+        *closed, forming = candles
+        first = float(candles[0]["timestamp"])
+        last = self.last_timestamp
+        if last is not None and (first < self._timestamps[0] or (closed and float(closed[0]["timestamp"]) > last)):
+            self._reset()
+            self.resets += 1
+            last = None
+        for candle in closed:
+            if last is None or float(candle["timestamp"]) > last:
+                self._commit(candle)
+
+        timestamps = np.fromiter((float(candle["timestamp"]) for candle in candles), dtype=float, count=len(candles))
+        # The window's closed candles are the newest committed ones, so only that tail is read
+        tail = min(len(candles), len(self._timestamps))
+        committed = np.array(list(islice(reversed(self._timestamps), tail))[::-1], dtype=float)
+        values = np.array(list(islice(reversed(self._values), tail))[::-1], dtype=float).reshape(tail, len(self.columns))
+        aligned = np.full((len(candles), len(self.columns)), np.nan)
+        # With nothing committed yet (only the forming candle so far) every value but the preview is NaN
+        if tail:
+            positions = np.searchsorted(committed, timestamps)
+            found = (positions < tail) & (committed[np.minimum(positions, tail - 1)] == timestamps)
+            aligned[found] = values[positions[found]]
+        if self.last_timestamp is None or timestamps[-1] > self.last_timestamp:
+            aligned[-1] = [value for indicator in self.indicators for value in indicator.preview(forming)]
+        frame = pd.DataFrame(aligned, columns=self.columns)
+        frame.insert(0, "timestamp", timestamps)
+        return frame
@@ -0,0 +1,281 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED, RUNNING, WAITING, DONE, FAILED = "queued", "running", "waiting", "done", "failed"
+FINISHED = (DONE, FAILED)
+
+
+class Job:
+    """One orchestration action: the request that starts it, then polls until the backend reports it done.
+
+    ``status`` moves from ``queued`` to ``running`` (the request is in flight), ``waiting`` (polling
+    ``check``) and finally ``done`` or ``failed``, with the reason in ``message``.
+    """
+
+    def __init__(
+        self,
+        job_id: int,
+        kind: str,
+        target: str,
+        action: Callable[[], Any],
+        check: Optional[Callable[[Any], bool]] = None,
+        owner: Optional[str] = None,
+        on_finished: Optional[Callable[["Job"], None]] = None,
+    ):
+        self.id = job_id
+        self.kind = kind
+        self.target = target
+        self.owner = owner
+        self.action = action
+        self.check = check
+        self.on_finished = on_finished
+        self.status = QUEUED
+        self.message = ""
+        self.result: Any = None
+        self.checks = 0
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def elapsed(self) -> float:
+        start = self.started_at or self.created_at
+        return (self.finished_at or time.time()) - start
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "target": self.target,
+            "status": self.status,
+            "message": self.message,
+            "checks": self.checks,
+            "elapsed": self.elapsed,
+        }
+
+
+class JobQueue:
+    """Background runner for long orchestration actions, so pages never sleep while the backend works.
+
+    ``submit`` returns a ``Job`` handle right away. Workers send the job's request, then a scheduler
+    thread re-checks completion after ``poll_interval`` seconds, multiplying the delay by ``backoff``
+    up to ``max_poll_interval``, until the check passes or ``timeout`` seconds have gone by. Checks run
+    on the workers too, so waiting jobs hold no thread. Finished jobs are kept (the newest ``history``)
+    for the tray to show.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 15.0,
+        backoff: float = 2.0,
+        timeout: float = 300.0,
+        history: int = 50,
+    ):
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.backoff = backoff
+        self.timeout = timeout
+        self.history = history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jobs")
+        self._ids = itertools.count(1)
+        self._jobs: Dict[int, Job] = {}
+        self._timers: List[tuple] = []  # (due, job id, delay) heap of pending completion checks
+        self._lock = threading.Lock()
+        self._scheduled = threading.Condition(self._lock)
+        self._stopped = False
+        self._scheduler: Optional[threading.Thread] = None
+
+    def submit(
+        self,
+        kind: str,
+        target: str,
+        action: Callable[[], Any],
+        check: Optional[Callable[[Any], bool]] = None,
+        owner: Optional[str] = None,
+        on_finished: Optional[Callable[[Job], None]] = None,
+    ) -> Job:
+        """Queue ``action()``; when given, ``check(result)`` is then polled until it returns True.
+
+        ``on_finished(job)`` runs on a worker thread once the job is done or failed.
+        """
+        job = Job(next(self._ids), kind, target, action, check, owner, on_finished)
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Job queue is closed")
+            self._jobs[job.id] = job
+            self._prune()
+        self._executor.submit(self._run, job)
+        return job
+
+    def jobs(self, owner: Optional[str] = None) -> List[Job]:
+        """Held jobs, newest first, optionally only the ones submitted by ``owner``."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job for job in reversed(jobs) if owner is None or job.owner == owner]
+
+    def active(self, owner: Optional[str] = None) -> List[Job]:
+        return [job for job in self.jobs(owner) if not job.finished]
+
+    def clear_finished(self, owner: Optional[str] = None) -> None:
+        with self._lock:
+            for job_id, job in list(self._jobs.items()):
+                if job.finished and (owner is None or job.owner == owner):
+                    del self._jobs[job_id]
+
+    def close(self) -> None:
+        with self._scheduled:
+            self._stopped = True
+            self._scheduled.notify_all()
+        if self._scheduler is not None and self._scheduler is not threading.current_thread():
+            self._scheduler.join(timeout=5)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        jobs = self.jobs()
+        return {status: sum(job.status == status for job in jobs) for status in (QUEUED, RUNNING, WAITING, DONE, FAILED)}
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[: max(0, len(finished) - self.history)]:
+            del self._jobs[job_id]
+
+    def _finish(self, job: Job, status: str, message: str = "") -> None:
+        job.status, job.message, job.finished_at = status, message, time.time()
+        if job.on_finished is not None:
+            try:
+                job.on_finished(job)
+            except Exception:
+                logger.exception("Job finished callback failed")
+
+    def _run(self, job: Job) -> None:
+        job.status, job.started_at = RUNNING, time.time()
+        try:
+            job.result = job.action()
+        except Exception as e:
+            self._finish(job, FAILED, str(e))
+            return
+        if job.check is None:
+            self._finish(job, DONE)
+            return
+        job.status = WAITING
+        self._schedule(job, self.poll_interval)
+
+    def _check(self, job: Job, delay: float) -> None:
+        job.checks += 1
+        try:
+            if job.check(job.result):
+                self._finish(job, DONE)
+                return
+        except Exception as e:
+            # The backend may be briefly unreachable while it restarts containers; keep polling
+            job.message = str(e)
+        if time.time() - job.started_at >= self.timeout:
+            self._finish(job, FAILED, f"Timed out after {self.timeout:g}s waiting for the backend")
+            return
+        self._schedule(job, min(delay * self.backoff, self.max_poll_interval))
+
+    def _schedule(self, job: Job, delay: float) -> None:
+        with self._scheduled:
+            if self._stopped:
+                return
+            heapq.heappush(self._timers, (time.monotonic() + delay, job.id, delay))
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(target=self._schedule_loop, name="jobs-scheduler", daemon=True)
+                self._scheduler.start()
+            self._scheduled.notify()
+
+    def _schedule_loop(self) -> None:
+        while True:
+            with self._scheduled:
+                while not self._stopped and (not self._timers or self._timers[0][0] > time.monotonic()):
+                    self._scheduled.wait(self._timers[0][0] - time.monotonic() if self._timers else None)
+                if self._stopped:
+                    return
+                _, job_id, delay = heapq.heappop(self._timers)
+                job = self._jobs.get(job_id)
+            if job is not None:
+                self._executor.submit(self._check, job, delay)
+
+
+class BotJobs:
+    """Deploy, stop, archive and delete as ``JobQueue`` jobs, checked against the backend's bot list.
+
+    ``call(router, method, *args, **kwargs)`` sends a backend request (``BackendAPIPool.call``), and
+    ``on_finished(job)`` runs after every job, e.g. to refresh the fleet snapshot.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        call: Callable[..., Any],
+        on_finished: Optional[Callable[[Job], None]] = None,
+    ):
+        self.queue = queue
+        self._call = call
+        self._on_finished = on_finished
+
+    def _submit(self, kind, target, action, check=None, owner=None) -> Job:
+        return self.queue.submit(kind, target, action, check, owner, self._on_finished)
+
+    def _active_bots(self) -> dict:
+        response = self._call("bot_orchestration", "get_active_bots_status")
+        if not isinstance(response, dict) or response.get("status") != "success":
+            raise RuntimeError("Failed to fetch active bots status.")
+        return response.get("data") or {}
+
+    def deploy(self, deploy_config: dict, owner: Optional[str] = None) -> Job:
+        """Deploy a bot; done once it shows up among the active bots."""
+        instance_name = deploy_config["instance_name"]
+
+        def action():
+            response = self._call("bot_orchestration", "deploy_v2_controllers", **deploy_config)
+            if isinstance(response, dict) and (response.get("success") is False or response.get("status") == "error"):
+                raise RuntimeError(response.get("message", "Deployment failed"))
+            return response
+
+        def check(response):
+            name = response.get("unique_instance_name") if isinstance(response, dict) else None
+            return any(bot == name or bot.endswith(instance_name) for bot in self._active_bots())
+
+        return self._submit("deploy", instance_name, action, check, owner)
+
+    def stop(self, bot_name: str, owner: Optional[str] = None) -> Job:
+        """Stop and archive a bot; done once it is no longer running."""
+        return self._submit(
+            "stop",
+            bot_name,
+            lambda: self._call("bot_orchestration", "stop_and_archive_bot", bot_name),
+            lambda _: self._active_bots().get(bot_name, {}).get("status") != "running",
+            owner,
+        )
+
+    def archive(self, bot_name: str, owner: Optional[str] = None) -> Job:
+        """Stop and remove a stopped bot's container; done once the bot is no longer listed."""
+
+        def action():
+            self._call("docker", "stop_container", bot_name)
+            return self._call("docker", "remove_container", bot_name)
+
+        return self._submit("archive", bot_name, action, lambda _: bot_name not in self._active_bots(), owner)
+
+    def delete_config(self, config_name: str, owner: Optional[str] = None) -> Job:
+        """Delete a controller config; the request itself completes it."""
+        return self._submit(
+            "delete",
+            config_name,
+            lambda: self._call("controllers", "delete_controller_config", config_name),
+            owner=owner,
+        )
@@ -0,0 +1,70 @@
+import re
+import threading
+from collections import deque
+from typing import Iterable, List, Optional
+
+# Log levels in increasing severity, as reported in ``level_name``
+LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+def _line_key(line: dict) -> tuple:
+    return line.get("timestamp"), line.get("logger_name"), line.get("msg")
+
+
+class LogTail:
+    """Bounded ring buffer of one bot's log lines, advanced by a timestamp cursor.
+
+    ``extend`` takes the lines of a fresh status payload, which repeats the lines already seen, and
+    appends only the ones past the cursor: newer than the last timestamp, or at that timestamp but
+    not seen yet. Every appended line gets an increasing ``seq``, so a reader can ask for just the
+    lines after the last one it showed.
+    """
+
+    def __init__(self, max_lines: int = 1000):
+        self._lines: deque = deque(maxlen=max_lines)
+        self._cursor: Optional[float] = None
+        self._at_cursor: set = set()
+        self._lock = threading.Lock()
+        self.sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def extend(self, lines: Iterable[dict]) -> int:
+        """Append the lines past the cursor, oldest first; returns how many were new."""
+        added = 0
+        with self._lock:
+            for line in sorted(lines or [], key=lambda line: line.get("timestamp") or 0):
+                timestamp = line.get("timestamp") or 0
+                key = _line_key(line)
+                if self._cursor is not None:
+                    if timestamp < self._cursor or (timestamp == self._cursor and key in self._at_cursor):
+                        continue
+                if timestamp != self._cursor:
+                    self._cursor, self._at_cursor = timestamp, set()
+                self._at_cursor.add(key)
+                self.sequence += 1
+                self._lines.append({**line, "seq": self.sequence})
+                added += 1
+        return added
+
+    def lines(self, since: int = 0) -> List[dict]:
+        """Held lines with a ``seq`` above ``since``, oldest first."""
+        with self._lock:
+            if since <= 0:
+                return list(self._lines)
+            return [line for line in self._lines if line["seq"] > since]
+
+
+def filter_lines(lines: List[dict], pattern: str = "", levels: Optional[Iterable[str]] = None) -> List[dict]:
+    """Lines whose message or logger matches the case-insensitive regex ``pattern`` and whose level is in ``levels``.
+
+    Raises ``re.error`` for an invalid pattern.
+    """
+    if levels:
+        levels = {level.upper() for level in levels}
+        lines = [line for line in lines if str(line.get("level_name", "")).upper() in levels]
+    if pattern:
+        regex = re.compile(pattern, re.IGNORECASE)
+        lines = [line for line in lines if regex.search(f"{line.get('logger_name', '')} {line.get('msg', '')}")]
+    return lines
@@ -0,0 +1,373 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from frontend.api.responses import response_data
+
+logger = logging.getLogger(__name__)
+
+ORDER_BOOK = "order_book"
+TRADES = "trades"
+CANDLES = "candles"
+# Candles re-read by each REST poll after the first: the forming candle and the one that just closed
+POLL_CANDLE_TAIL = 3
+
+
+class MarketBuffers:
+    """Latest order book, recent trades and recent candles of one market, held in fixed-size ring buffers.
+
+    Candles are kept per interval; a pushed candle with the timestamp of the last one replaces it,
+    so the still-forming candle is updated in place.
+    """
+
+    def __init__(self, connector: str, trading_pair: str, max_trades: int = 500, max_candles: int = 1000):
+        self.connector = connector
+        self.trading_pair = trading_pair
+        self.max_trades = max_trades
+        self.max_candles = max_candles
+        self.order_book: Optional[dict] = None
+        self.trades: deque = deque(maxlen=max_trades)
+        self.candles: Dict[str, deque] = {}
+        self.updated_at: Dict[Tuple[str, Any], float] = {}
+        self.last_read = time.monotonic()
+        self._lock = threading.Lock()
+
+    def apply(self, kind: str, param: Any, data: Any) -> None:
+        """Apply one pushed message payload of ``kind`` (``param`` is the candle interval or book depth)."""
+        with self._lock:
+            if kind == ORDER_BOOK:
+                self.order_book = data
+            elif kind == TRADES:
+                last_ts = self.trades[-1].get("timestamp", 0) if self.trades else 0
+                self.trades.extend(t for t in data if t.get("timestamp", 0) > last_ts)
+            elif kind == CANDLES:
+                buffer = self.candles.setdefault(param, deque(maxlen=self.max_candles))
+                for candle in sorted(data, key=lambda c: c["timestamp"]):
+                    if buffer and candle["timestamp"] == buffer[-1]["timestamp"]:
+                        buffer[-1] = candle
+                    elif not buffer or candle["timestamp"] > buffer[-1]["timestamp"]:
+                        buffer.append(candle)
+            self.updated_at[(kind, param)] = time.monotonic()
+
+    def age(self, kind: str, param: Any = None) -> Optional[float]:
+        """Seconds since ``kind`` was last pushed, or None if it never was."""
+        updated_at = self.updated_at.get((kind, param))
+        return None if updated_at is None else time.monotonic() - updated_at
+
+    def order_book_snapshot(self, depth: int) -> Optional[dict]:
+        with self._lock:
+            if self.order_book is None:
+                return None
+            return {**self.order_book, "bids": self.order_book.get("bids", [])[:depth], "asks": self.order_book.get("asks", [])[:depth]}
+
+    def trades_snapshot(self) -> List[dict]:
+        with self._lock:
+            return list(self.trades)
+
+    def candles_snapshot(self, interval: str, max_records: int) -> List[dict]:
+        with self._lock:
+            buffer = self.candles.get(interval)
+            return list(buffer)[-max_records:] if buffer else []
+
+
+class MarketDataStream:
+    """Process-wide background subscriber that keeps ``MarketBuffers`` current from a streaming source.
+
+    Reads register interest: the first read of a market starts its subscriptions and returns None
+    (callers fall back to REST for that one view), later reads are served from memory. Each
+    subscription runs on its own connection in a background event loop and reconnects with
+    exponential backoff; markets nobody read for ``idle_timeout`` seconds are unsubscribed.
+
+    ``source.connect()`` must return an async context manager yielding an object with the
+    ``MarketDataWebSocket`` interface (``subscribe_order_book``, ``subscribe_trades``,
+    ``subscribe_candles`` and async iteration over pushed messages).
+    """
+
+    def __init__(
+        self,
+        source,
+        max_trades: int = 500,
+        max_candles: int = 1000,
+        update_interval: float = 1.0,
+        stale_after: float = 10.0,
+        idle_timeout: float = 120.0,
+        max_reconnect_delay: float = 30.0,
+    ):
+        self.source = source
+        self.max_trades = max_trades
+        self.max_candles = max_candles
+        self.update_interval = update_interval
+        self.stale_after = stale_after
+        self.idle_timeout = idle_timeout
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self._markets: Dict[Tuple[str, str], MarketBuffers] = {}
+        self._streams: Dict[tuple, Any] = {}
+        self._errors: Dict[tuple, str] = {}
+        self._unsupported = set()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._reaper = None
+        self.messages = 0
+
+    def start(self):
+        """Start the background event loop."""
+        if self._thread is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="market-data-stream", daemon=True)
+            self._thread.start()
+            self._reaper = asyncio.run_coroutine_threadsafe(self._reap_idle(), self._loop)
+        return self
+
+    async def _shutdown(self) -> None:
+        # Cancel and await every task on the loop, so none is destroyed while still pending
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        close_source = getattr(self.source, "close", None)
+        if close_source is not None:
+            await close_source()
+
+    def close(self):
+        """Cancel every subscription and stop the event loop."""
+        if self._loop is None:
+            return
+        with self._lock:
+            self._streams.clear()
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+        except Exception as e:
+            logger.warning("Market data stream did not shut down cleanly: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+
+    def _buffers(self, connector: str, trading_pair: str) -> MarketBuffers:
+        with self._lock:
+            buffers = self._markets.get((connector, trading_pair))
+            if buffers is None:
+                buffers = MarketBuffers(connector, trading_pair, self.max_trades, self.max_candles)
+                self._markets[(connector, trading_pair)] = buffers
+        buffers.last_read = time.monotonic()
+        return buffers
+
+    def _ensure(self, key: tuple, replaces: Optional[tuple] = None) -> None:
+        """Start the subscription ``key`` unless it is already running."""
+        if self._loop is None or key[0] in self._unsupported:
+            return
+        with self._lock:
+            if key in self._streams and not self._streams[key].done():
+                return
+            if replaces is not None and replaces in self._streams:
+                self._streams.pop(replaces).cancel()
+            self._streams[key] = asyncio.run_coroutine_threadsafe(self._run(key), self._loop)
+
+    def _subscribed_depth(self, connector: str, trading_pair: str) -> Optional[int]:
+        with self._lock:
+            depths = [
+                key[3] for key, future in self._streams.items() if key[:3] == (ORDER_BOOK, connector, trading_pair) and not future.done()
+            ]
+        return max(depths, default=None)
+
+    async def _subscribe(self, ws, key: tuple) -> None:
+        kind, connector, trading_pair, param = key
+        if kind == ORDER_BOOK:
+            await ws.subscribe_order_book(connector, trading_pair, depth=param, update_interval=self.update_interval)
+        elif kind == TRADES:
+            await ws.subscribe_trades(connector, trading_pair, update_interval=self.update_interval)
+        else:
+            await ws.subscribe_candles(
+                connector, trading_pair, interval=param, max_records=self.max_candles, update_interval=self.update_interval
+            )
+
+    async def _run(self, key: tuple) -> None:
+        kind, connector, trading_pair, param = key
+        buffers = self._buffers(connector, trading_pair)
+        delay = 1.0
+        while True:
+            try:
+                async with self.source.connect() as ws:
+                    await self._subscribe(ws, key)
+                    delay = 1.0
+                    async for message in ws:
+                        if message.get("type") == "error":
+                            raise RuntimeError(message.get("message", "stream error"))
+                        if message.get("type") != kind or "data" not in message:
+                            continue  # acks, pongs and heartbeats
+                        buffers.apply(kind, param, message["data"])
+                        self.messages += 1
+                        self._errors.pop(key, None)
+            except asyncio.CancelledError:
+                raise
+            except NotImplementedError as e:
+                # The source can't stream this kind at all; don't retry
+                self._unsupported.add(kind)
+                self._errors[key] = str(e)
+                return
+            except Exception as e:
+                self._errors[key] = f"{type(e).__name__}: {e}"
+                logger.debug("Market data stream %s failed, reconnecting in %.0fs: %s", key, delay, e)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
+
+    async def _reap_idle(self) -> None:
+        while True:
+            await asyncio.sleep(max(1.0, self.idle_timeout / 4))
+            now = time.monotonic()
+            with self._lock:
+                idle = [market for market, buffers in self._markets.items() if now - buffers.last_read > self.idle_timeout]
+                for market in idle:
+                    del self._markets[market]
+                    for key in [key for key in self._streams if key[1:3] == market]:
+                        self._streams.pop(key).cancel()
+                        self._errors.pop(key, None)
+
+    def _fresh(self, buffers: MarketBuffers, kind: str, param: Any = None) -> bool:
+        age = buffers.age(kind, param)
+        return age is not None and age <= self.stale_after
+
+    def order_book(self, connector: str, trading_pair: str, depth: int = 10) -> Optional[dict]:
+        """Latest streamed order book cut to ``depth`` levels, or None until a fresh one arrived."""
+        buffers = self._buffers(connector, trading_pair)
+        subscribed = self._subscribed_depth(connector, trading_pair)
+        if subscribed is None or subscribed < depth:
+            # One book subscription per market, at the deepest depth any view asked for
+            replaces = None if subscribed is None else (ORDER_BOOK, connector, trading_pair, subscribed)
+            self._ensure((ORDER_BOOK, connector, trading_pair, depth), replaces=replaces)
+            subscribed = depth
+        if not self._fresh(buffers, ORDER_BOOK, subscribed):
+            return None
+        return buffers.order_book_snapshot(depth)
+
+    def trades(self, connector: str, trading_pair: str) -> Optional[List[dict]]:
+        """Recent streamed public trades, oldest first, or None until fresh ones arrived."""
+        buffers = self._buffers(connector, trading_pair)
+        self._ensure((TRADES, connector, trading_pair, None))
+        if not self._fresh(buffers, TRADES):
+            return None
+        return buffers.trades_snapshot()
+
+    def candles(self, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 100) -> Optional[List[dict]]:
+        """The last ``max_records`` streamed candles (forming candle last), or None until fresh ones arrived."""
+        buffers = self._buffers(connector, trading_pair)
+        self._ensure((CANDLES, connector, trading_pair, interval))
+        if not self._fresh(buffers, CANDLES, interval):
+            return None
+        return buffers.candles_snapshot(interval, max_records)
+
+    def price(self, connector: str, trading_pair: str) -> Optional[float]:
+        """Last streamed trade price, else the mid price of the streamed book."""
+        buffers = self._buffers(connector, trading_pair)
+        if self._fresh(buffers, TRADES) and buffers.trades:
+            return float(buffers.trades[-1]["price"])
+        book = self.order_book(connector, trading_pair, depth=1)
+        if book and book.get("bids") and book.get("asks"):
+            return (float(book["bids"][0]["price"]) + float(book["asks"][0]["price"])) / 2
+        return None
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "markets": len(self._markets),
+                "subscriptions": sum(1 for future in self._streams.values() if not future.done()),
+                "messages": self.messages,
+                "errors": {" ".join(str(part) for part in key): error for key, error in self._errors.items()},
+            }
+
+
+class WebSocketSource:
+    """Streams from the API's ``/ws/market-data`` endpoint through ``hummingbot_api_client``."""
+
+    def __init__(self, base_url: str, username: str, password: str):
+        self.base_url = base_url
+        self._username = username
+        self._password = password
+        self._client = None
+
+    @asynccontextmanager
+    async def connect(self):
+        if self._client is None:
+            from hummingbot_api_client import HummingbotAPIClient
+
+            client = HummingbotAPIClient(base_url=self.base_url, username=self._username, password=self._password)
+            await client.init()
+            self._client = client
+        async with self._client.ws.market_data() as ws:
+            yield ws
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+
+class _PollingMarketDataSocket:
+    """``MarketDataWebSocket`` look-alike that long-polls the REST endpoints through the client pool.
+
+    One poll per subscription for the whole process, however many sessions read the market. Candle
+    subscriptions download ``max_records`` candles once, then only the newest ``POLL_CANDLE_TAIL``,
+    which ``MarketBuffers`` merges into the buffered ones by timestamp.
+    """
+
+    def __init__(self, pool):
+        self._pool = pool
+        self._request = None
+        self._tail_kwargs: Optional[dict] = None
+        self._interval = 1.0
+        self._next_poll = 0.0
+
+    async def subscribe_order_book(self, connector: str, trading_pair: str, depth: int = 10, update_interval: float = 1.0) -> str:
+        self._request = (ORDER_BOOK, "get_order_book", {"connector_name": connector, "trading_pair": trading_pair, "depth": depth})
+        self._interval = update_interval
+        return f"poll-{ORDER_BOOK}-{connector}-{trading_pair}"
+
+    async def subscribe_trades(self, connector: str, trading_pair: str, update_interval: float = 1.0) -> str:
+        raise NotImplementedError("Public trades are only available from the websocket stream")
+
+    async def subscribe_candles(
+        self, connector: str, trading_pair: str, interval: str = "1m", max_records: int = 100, update_interval: float = 1.0
+    ) -> str:
+        kwargs = {"connector_name": connector, "trading_pair": trading_pair, "interval": interval, "max_records": max_records}
+        self._request = (CANDLES, "get_candles", kwargs)
+        self._tail_kwargs = {**kwargs, "max_records": min(max_records, POLL_CANDLE_TAIL)}
+        self._interval = update_interval
+        return f"poll-{CANDLES}-{connector}-{trading_pair}-{interval}"
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        delay = self._next_poll - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._next_poll = time.monotonic() + self._interval
+        kind, method_name, kwargs = self._request
+        response = await asyncio.get_running_loop().run_in_executor(None, lambda: self._pool.call("market_data", method_name, **kwargs))
+        # An error raises so the stream reconnects, and readers fall back to REST instead of an empty book
+        data = response_data(response)
+        if kind == ORDER_BOOK and not (isinstance(data, dict) and "bids" in data and "asks" in data):
+            raise RuntimeError(f"Unexpected order book response: {response}")
+        if kind == CANDLES and not isinstance(data, list):
+            raise RuntimeError(f"Unexpected candles response: {response}")
+        if self._tail_kwargs is not None:
+            # Seeded; later polls only read the tail
+            self._request, self._tail_kwargs = (kind, method_name, self._tail_kwargs), None
+        return {"type": kind, "data": data}
+
+
+class RestPollingSource:
+    """Stand-in source for backends without the websocket endpoint: polls REST in the background."""
+
+    def __init__(self, pool):
+        self._pool = pool
+
+    @asynccontextmanager
+    async def connect(self):
+        yield _PollingMarketDataSocket(self._pool)
@@ -0,0 +1,197 @@
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+BIDS = "bids"
+ASKS = "asks"
+# Price grouping choices offered by the order book panel; None keeps every level
+TICK_GROUPS = [None, 0.01, 0.1, 1.0, 10.0]
+
+
+def levels_to_arrays(levels: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+    """Prices and amounts of order book levels given as ``{"price", "amount"}`` dicts or ``[price, amount]`` pairs."""
+    levels = list(levels)
+    if not levels:
+        return np.empty(0), np.empty(0)
+    if isinstance(levels[0], dict):
+        prices = np.fromiter((level["price"] for level in levels), dtype=float, count=len(levels))
+        amounts = np.fromiter((level["amount"] for level in levels), dtype=float, count=len(levels))
+        return prices, amounts
+    table = np.asarray(levels, dtype=float)
+    return table[:, 0], table[:, 1]
+
+
+def group_levels(prices: np.ndarray, amounts: np.ndarray, tick: Optional[float], side: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Sum level amounts into ``tick``-wide price buckets, sorted best price first.
+
+    Bids round down and asks round up, so a bucket never shows a better price than its levels.
+    """
+    if tick:
+        rounding = np.floor if side == BIDS else np.ceil
+        # Scale to integer ticks first so float noise doesn't split a bucket
+        buckets = rounding(np.round(prices / tick, 8))
+        keys, inverse = np.unique(buckets, return_inverse=True)
+        prices, amounts = keys * tick, np.bincount(inverse, weights=amounts, minlength=len(keys))
+    order = np.argsort(-prices if side == BIDS else prices, kind="stable")
+    return prices[order], amounts[order]
+
+
+class BookSide:
+    """One side of an order book as aggregated arrays, best price first, with cumulative depth."""
+
+    def __init__(self, prices: np.ndarray, amounts: np.ndarray):
+        self.prices = prices
+        self.amounts = amounts
+        self.quote = prices * amounts
+        self.cumulative_base = np.cumsum(amounts)
+        self.cumulative_quote = np.cumsum(self.quote)
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+
+class OrderBook:
+    """Order book held as sorted NumPy price/amount arrays per side.
+
+    ``update`` replaces the book with a snapshot, ``apply_diff`` upserts changed levels (an amount of
+    zero removes a level) without rebuilding the untouched ones, and ``side`` aggregates a side into
+    price groups with cumulative base and quote depth.
+    """
+
+    def __init__(self):
+        self.bid_prices = self.bid_amounts = np.empty(0)
+        self.ask_prices = self.ask_amounts = np.empty(0)
+        self.update_id = None
+        self.timestamp = None
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "OrderBook":
+        book = cls()
+        book.update(snapshot)
+        return book
+
+    def update(self, snapshot: dict) -> None:
+        """Replace the book with a ``{"bids": [...], "asks": [...]}`` snapshot."""
+        self.bid_prices, self.bid_amounts = group_levels(*levels_to_arrays(snapshot.get(BIDS) or []), None, BIDS)
+        self.ask_prices, self.ask_amounts = group_levels(*levels_to_arrays(snapshot.get(ASKS) or []), None, ASKS)
+        self.update_id = snapshot.get("update_id")
+        self.timestamp = snapshot.get("timestamp")
+
+    def apply_diff(self, diff: dict) -> None:
+        """Upsert the changed levels of a ``{"bids": [...], "asks": [...]}`` diff; zero amounts delete."""
+        for side in (BIDS, ASKS):
+            changes = diff.get(side)
+            if not changes:
+                continue
+            prices, amounts = (self.bid_prices, self.bid_amounts) if side == BIDS else (self.ask_prices, self.ask_amounts)
+            new_prices, new_amounts = levels_to_arrays(changes)
+            # Changed levels win over held ones at the same price
+            merged_prices = np.concatenate([new_prices, prices])
+            merged_amounts = np.concatenate([new_amounts, amounts])
+            merged_prices, first = np.unique(merged_prices, return_index=True)
+            merged_amounts = merged_amounts[first]
+            live = merged_amounts > 0
+            merged_prices, merged_amounts = group_levels(merged_prices[live], merged_amounts[live], None, side)
+            if side == BIDS:
+                self.bid_prices, self.bid_amounts = merged_prices, merged_amounts
+            else:
+                self.ask_prices, self.ask_amounts = merged_prices, merged_amounts
+        self.update_id = diff.get("update_id", self.update_id)
+        self.timestamp = diff.get("timestamp", self.timestamp)
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return float(self.bid_prices[0]) if len(self.bid_prices) else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return float(self.ask_prices[0]) if len(self.ask_prices) else None
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid + self.best_ask) / 2
+
+    def side(self, side: str, tick: Optional[float] = None, limit: Optional[float] = None) -> BookSide:
+        """Levels of ``side`` grouped into ``tick``-wide buckets, with cumulative base and quote depth.
+
+        ``limit`` keeps only the levels at or better than that price.
+        """
+        prices, amounts = (self.bid_prices, self.bid_amounts) if side == BIDS else (self.ask_prices, self.ask_amounts)
+        if limit is not None:
+            keep = prices >= limit if side == BIDS else prices <= limit
+            prices, amounts = prices[keep], amounts[keep]
+        return BookSide(*group_levels(prices, amounts, tick, side))
+
+    def depth_within(
+        self, percentage: float, reference: Optional[float] = None, tick: Optional[float] = None
+    ) -> Tuple[BookSide, BookSide]:
+        """Bids and asks within ``percentage`` % of ``reference`` (the mid price by default)."""
+        reference = reference or self.mid_price
+        if not reference:
+            return self.side(BIDS, tick), self.side(ASKS, tick)
+        band = reference * percentage / 100
+        return self.side(BIDS, tick, reference - band), self.side(ASKS, tick, reference + band)
+
+    def imbalance(self, percentage: Optional[float] = None) -> Optional[float]:
+        """(bid - ask) / (bid + ask) quote depth, over the whole book or within ``percentage`` % of mid.
+
+        +1 means only bids, -1 only asks.
+        """
+        if percentage is None:
+            bids, asks = self.side(BIDS), self.side(ASKS)
+        else:
+            bids, asks = self.depth_within(percentage)
+        bid_quote = bids.cumulative_quote[-1] if len(bids) else 0.0
+        ask_quote = asks.cumulative_quote[-1] if len(asks) else 0.0
+        total = bid_quote + ask_quote
+        return float((bid_quote - ask_quote) / total) if total else None
+
+    def quote_volume_for_price(self, price: float, is_buy: bool) -> float:
+        """Quote volume a market order can take before the price moves past ``price``.
+
+        Local equivalent of the API's ``get_quote_volume_for_price``: buys take asks up to ``price``,
+        sells take bids down to it.
+        """
+        levels = self.side(ASKS if is_buy else BIDS)
+        if is_buy:
+            count = np.searchsorted(levels.prices, price, side="right")
+        else:
+            count = np.searchsorted(-levels.prices, -price, side="right")
+        return float(levels.cumulative_quote[count - 1]) if count else 0.0
+
+    def estimate_fill(self, amount: float, is_buy: bool, in_quote: bool = False) -> Optional[dict]:
+        """Expected outcome of a market order for ``amount`` (base, or quote if ``in_quote``) walking the book.
+
+        Returns the average fill price, the worst price reached, the filled base and quote amounts,
+        the slippage of the average price from the mid price in bps, and whether the visible book
+        was deep enough to fill it all. None when that side of the book is empty.
+        """
+        levels = self.side(ASKS if is_buy else BIDS)
+        if not len(levels) or amount <= 0:
+            return None
+        cumulative = levels.cumulative_quote if in_quote else levels.cumulative_base
+        index = int(np.searchsorted(cumulative, amount, side="left"))
+        complete = index < len(levels)
+        if not complete:
+            index, amount = len(levels) - 1, float(cumulative[-1])
+        # Whole levels before ``index``, then part of level ``index``
+        base = levels.cumulative_base[index - 1] if index else 0.0
+        quote = levels.cumulative_quote[index - 1] if index else 0.0
+        remaining = amount - (cumulative[index - 1] if index else 0.0)
+        price = levels.prices[index]
+        if in_quote:
+            base, quote = base + remaining / price, quote + remaining
+        else:
+            base, quote = base + remaining, quote + remaining * price
+        average_price = float(quote / base)
+        reference = self.mid_price or float(levels.prices[0])
+        return {
+            "average_price": average_price,
+            "worst_price": float(price),
+            "base_amount": float(base),
+            "quote_amount": float(quote),
+            "slippage_bps": abs(average_price - reference) / reference * 10_000,
+            "complete": complete,
+        }
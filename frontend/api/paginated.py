@@ -0,0 +1,130 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+
+def response_rows(response: Any) -> Tuple[List[dict], dict]:
+    """Rows and ``pagination`` metadata of a list endpoint response, whichever format it came in."""
+    if isinstance(response, list):
+        return response, {}
+    if isinstance(response, dict):
+        if response.get("status") not in (None, "success"):
+            return [], {}
+        return response.get("data") or [], response.get("pagination") or {}
+    return [], {}
+
+
+def iter_pages(call: Callable[..., Any], page_size: int = 500, max_rows: Optional[int] = None, **filters) -> Iterator[List[dict]]:
+    """Yield the pages of a cursor-paginated endpoint, following ``pagination.next_cursor``.
+
+    ``call(limit=..., cursor=..., **filters)`` fetches one page. Stops after the last page or once
+    ``max_rows`` rows were yielded.
+    """
+    cursor = None
+    fetched = 0
+    while True:
+        rows, pagination = response_rows(call(limit=page_size, cursor=cursor, **filters))
+        if max_rows is not None:
+            rows = rows[: max(0, max_rows - fetched)]
+        fetched += len(rows)
+        yield rows
+        cursor = pagination.get("next_cursor")
+        if not rows or not pagination.get("has_more") or cursor is None:
+            return
+        if max_rows is not None and fetched >= max_rows:
+            return
+
+
+def fetch_all(call: Callable[..., Any], page_size: int = 500, max_rows: Optional[int] = None, **filters) -> List[dict]:
+    """Every row of a cursor-paginated endpoint (up to ``max_rows``)."""
+    rows: List[dict] = []
+    for page in iter_pages(call, page_size, max_rows, **filters):
+        rows.extend(page)
+    return rows
+
+
+class KeyedStore:
+    """Client-side copy of a remote list, keyed by ``key(row)``, that only applies the rows that changed.
+
+    ``replace`` syncs to a full snapshot (missing keys are removed), ``upsert`` merges a partial one
+    (e.g. the newest page of an append-mostly history). ``version`` only moves when something
+    changed, and ``frame()`` rebuilds its DataFrame only then, so an unchanged refresh costs a
+    dict comparison instead of a new table.
+    """
+
+    def __init__(self, key: Callable[[dict], Hashable]):
+        self.key = key
+        self._rows: Dict[Hashable, dict] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        self._frame: Optional[pd.DataFrame] = None
+        self._frame_version = -1
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def _apply(self, rows: List[dict], remove_missing: bool) -> dict:
+        added, updated = [], []
+        seen = set()
+        with self._lock:
+            for row in rows:
+                key = self.key(row)
+                seen.add(key)
+                current = self._rows.get(key)
+                if current is None:
+                    added.append(key)
+                elif current != row:
+                    updated.append(key)
+                else:
+                    continue
+                self._rows[key] = row
+            removed = [key for key in self._rows if key not in seen] if remove_missing else []
+            for key in removed:
+                del self._rows[key]
+            if added or updated or removed:
+                self.version += 1
+        return {"added": added, "updated": updated, "removed": removed}
+
+    def replace(self, rows: List[dict]) -> dict:
+        """Sync to a full snapshot; returns the added, updated and removed keys."""
+        return self._apply(rows, remove_missing=True)
+
+    def upsert(self, rows: List[dict]) -> dict:
+        """Merge rows without removing the ones not given; returns the added and updated keys."""
+        return self._apply(rows, remove_missing=False)
+
+    def get(self, key: Hashable) -> Optional[dict]:
+        return self._rows.get(key)
+
+    def rows(self) -> List[dict]:
+        with self._lock:
+            return list(self._rows.values())
+
+    def frame(self) -> pd.DataFrame:
+        """The rows as a DataFrame, rebuilt only when the store changed since the last call."""
+        with self._lock:
+            if self._frame_version != self.version:
+                self._frame = pd.DataFrame(list(self._rows.values()))
+                self._frame_version = self.version
+            return self._frame
+
+
+def sync_newest(store: KeyedStore, call: Callable[..., Any], page_size: int = 500, max_rows: Optional[int] = None, **filters) -> dict:
+    """Upsert an append-mostly, newest-first list (e.g. order history) into ``store``.
+
+    The first sync reads every page (up to ``max_rows``); later ones stop at the first page with no
+    new or changed rows, which on a quiet account is the first page.
+    """
+    initial = len(store) == 0
+    changes = {"added": [], "updated": [], "removed": []}
+    for page in iter_pages(call, page_size, max_rows, **filters):
+        diff = store.upsert(page)
+        changes["added"] += diff["added"]
+        changes["updated"] += diff["updated"]
+        if not initial and not diff["added"] and not diff["updated"]:
+            break
+    return changes
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+# Maintenance margin ratio assumed when estimating liquidation prices the API doesn't report
+DEFAULT_MAINTENANCE_MARGIN = 0.005
+
+
+def _column(df: pd.DataFrame, name: str, default: float = np.nan) -> np.ndarray:
+    if name not in df.columns:
+        return np.full(len(df), default)
+    return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float)
+
+
+def base_assets(trading_pairs: pd.Series) -> np.ndarray:
+    """Base asset of each ``BASE-QUOTE`` trading pair."""
+    return trading_pairs.astype(str).str.split("-", n=1).str[0].to_numpy()
+
+
+def signed_amounts(df: pd.DataFrame) -> np.ndarray:
+    """Position amounts, negative for shorts, whether the API signs them or reports a ``side``."""
+    amounts = _column(df, "amount", 0.0)
+    if "side" in df.columns:
+        short = df["side"].astype(str).str.upper().isin(["SHORT", "SELL"]).to_numpy()
+        return np.where(short, -np.abs(amounts), amounts)
+    return amounts
+
+
+def estimated_liquidation_prices(
+    entry: np.ndarray, leverage: np.ndarray, is_long: np.ndarray, maintenance_margin: float
+) -> np.ndarray:
+    """Isolated-margin liquidation price: the entry price moved by the initial margin less the maintenance margin."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        buffer = 1 / leverage - maintenance_margin
+    return np.where(is_long, entry * (1 - buffer), entry * (1 + buffer))
+
+
+class PositionRisk:
+    """Exposure, liquidation and shock metrics of a positions table, computed column-wise with NumPy.
+
+    ``positions`` holds the per-position metrics, ``assets`` nets them per base asset across every
+    account and connector, and ``summary`` has the portfolio totals and concentration. Building it is
+    a handful of array operations and one ``bincount`` per column, so thousands of positions cost
+    about as much as a few.
+    """
+
+    def __init__(
+        self,
+        positions: pd.DataFrame,
+        shock_pct: float = 5.0,
+        maintenance_margin: float = DEFAULT_MAINTENANCE_MARGIN,
+    ):
+        self.shock_pct = shock_pct
+        df = positions.reset_index(drop=True).copy()
+        amount = signed_amounts(df)
+        entry = _column(df, "entry_price")
+        mark = _column(df, "mark_price")
+        mark = np.where(np.isnan(mark) | (mark <= 0), entry, mark)
+        leverage = _column(df, "leverage", 1.0)
+        leverage = np.where(np.isnan(leverage) | (leverage <= 0), 1.0, leverage)
+        is_long = amount > 0
+
+        notional = np.abs(amount) * mark
+        liquidation = _column(df, "liquidation_price")
+        estimated = estimated_liquidation_prices(entry, leverage, is_long, maintenance_margin)
+        # Without leverage (spot-like) there is no liquidation
+        estimated = np.where(leverage > 1, estimated, np.nan)
+        liquidation = np.where(np.isnan(liquidation) | (liquidation <= 0), estimated, liquidation)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # How far the mark price can move against the position before liquidation, in %
+            distance = np.where(is_long, mark - liquidation, liquidation - mark) / mark * 100
+
+        df["base_asset"] = base_assets(df["trading_pair"]) if "trading_pair" in df.columns else ""
+        df["amount"] = amount
+        df["original_value"] = amount * entry
+        df["notional"] = notional
+        df["leverage"] = leverage
+        df["margin"] = notional / leverage
+        df["liquidation_price"] = liquidation
+        df["liquidation_distance_pct"] = distance
+        # Linear PnL change of a shock_pct move of the mark price
+        df["pnl_shock"] = amount * mark * shock_pct / 100
+        if "unrealized_pnl" not in df.columns:
+            df["unrealized_pnl"] = amount * (mark - entry)
+        self.positions = df
+        self.assets = self._net_by_asset(df)
+        self.summary = self._summarize(df, self.assets)
+
+    @staticmethod
+    def _net_by_asset(df: pd.DataFrame) -> pd.DataFrame:
+        codes, assets = pd.factorize(df["base_asset"], sort=True)
+        count = len(assets)
+
+        def total(values):
+            return np.bincount(codes, weights=np.nan_to_num(values), minlength=count)
+
+        amount = df["amount"].to_numpy()
+        notional = df["notional"].to_numpy()
+        signed_notional = np.sign(amount) * notional
+        gross = total(notional)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_leverage = total(notional * df["leverage"].to_numpy()) / gross
+            share = gross / gross.sum()
+        # Closest position to liquidation per asset: sort by distance, keep each asset's first row
+        distance = df["liquidation_distance_pct"].to_numpy()
+        min_distance = np.full(count, np.nan)
+        known = ~np.isnan(distance)
+        order = np.lexsort((distance[known], codes[known]))
+        known_codes = codes[known][order]
+        first = np.r_[True, known_codes[1:] != known_codes[:-1]][: len(known_codes)]
+        min_distance[known_codes[first]] = distance[known][order][first]
+        assets_df = pd.DataFrame(
+            {
+                "base_asset": assets,
+                "net_amount": total(amount),
+                "long_notional": total(np.where(amount > 0, notional, 0.0)),
+                "short_notional": total(np.where(amount < 0, notional, 0.0)),
+                "net_notional": total(signed_notional),
+                "gross_notional": gross,
+                "share": share,
+                "avg_leverage": avg_leverage,
+                "margin": total(df["margin"].to_numpy()),
+                "unrealized_pnl": total(pd.to_numeric(df["unrealized_pnl"], errors="coerce").to_numpy(dtype=float)),
+                "pnl_shock": total(df["pnl_shock"].to_numpy()),
+                "min_liquidation_distance_pct": min_distance,
+                "positions": np.bincount(codes, minlength=count),
+            }
+        )
+        return assets_df.sort_values("gross_notional", ascending=False, ignore_index=True)
+
+    @staticmethod
+    def _summarize(df: pd.DataFrame, assets: pd.DataFrame) -> dict:
+        gross = float(assets["gross_notional"].sum())
+        long_value = float(assets["long_notional"].sum())
+        short_value = float(assets["short_notional"].sum())
+        shares = assets["share"].to_numpy(dtype=float)
+        # Herfindahl index of the gross exposure: 1 = everything in one asset
+        hhi = float(np.nansum(shares**2)) if gross else None
+        distance = df["liquidation_distance_pct"].to_numpy(dtype=float)
+        return {
+            "positions": len(df),
+            "unrealized_pnl": float(pd.to_numeric(df["unrealized_pnl"], errors="coerce").sum()),
+            "original_value": float(np.nansum(np.abs(df["original_value"].to_numpy()))),
+            "gross_notional": gross,
+            "net_notional": float(assets["net_notional"].sum()),
+            "long_notional": long_value,
+            "short_notional": short_value,
+            "hedge_ratio": min(long_value, short_value) / max(long_value, short_value) if long_value and short_value else None,
+            "margin": float(assets["margin"].sum()),
+            # Every asset moving up by shock_pct, and each one moving against its net exposure
+            "pnl_shock": float(assets["pnl_shock"].sum()),
+            "worst_shock": -float(np.abs(assets["pnl_shock"]).sum()),
+            "hhi": hhi,
+            "effective_assets": 1 / hhi if hhi else None,
+            "top_asset": assets["base_asset"].iloc[0] if len(assets) else None,
+            "top_share": float(shares[0]) if len(assets) else None,
+            "min_liquidation_distance_pct": float(np.nanmin(distance)) if np.isfinite(distance).any() else None,
+        }
+
+    def near_liquidation(self, within_pct: float) -> pd.DataFrame:
+        """Positions whose mark price is within ``within_pct`` % of their liquidation price."""
+        return self.positions[self.positions["liquidation_distance_pct"] <= within_pct]
@@ -0,0 +1,16 @@
+from typing import Any
+
+
+def response_data(response: Any, default: Any = None) -> Any:
+    """Payload of a backend response: the ``data`` of a ``{"status": "success", ...}`` envelope, or the bare payload.
+
+    Raises on any other status or an error body (``detail``/``error``), so a transient error or rate
+    limit is never mistaken for "no candles" or an empty order book. ``default`` stands in for no payload.
+    """
+    if isinstance(response, dict) and ("status" in response or "detail" in response or "error" in response):
+        if response.get("status") != "success":
+            raise RuntimeError(
+                response.get("message") or response.get("detail") or response.get("error") or f"Request failed: {response}"
+            )
+        response = response.get("data")
+    return default if response is None else response
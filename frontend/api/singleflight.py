@@ -0,0 +1,98 @@
+import copy
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from frontend.api.cache import DEFAULT_POLICIES, make_call_key
+
+# Read endpoints polled by many sessions at once; writes must never be coalesced
+DEFAULT_COALESCED_ENDPOINTS = frozenset(
+    [
+        ("market_data", "get_candles"),
+        ("market_data", "get_candles_last_days"),
+        ("market_data", "get_historical_candles"),
+        ("market_data", "get_order_book"),
+        ("market_data", "get_prices"),
+        ("market_data", "get_funding_info"),
+        ("market_data", "get_quote_volume_for_price"),
+        ("market_data", "get_price_for_quote_volume"),
+        ("bot_orchestration", "get_active_bots_status"),
+        ("bot_orchestration", "get_bot_status"),
+        ("controllers", "get_bot_controller_configs"),
+        *DEFAULT_POLICIES.keys(),
+    ]
+)
+
+
+class _InFlightCall:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Pool middleware coalescing identical concurrent reads into one backend request.
+
+    The first caller for an (endpoint, arguments) key performs the request; callers arriving while it
+    is in flight wait for it and receive a copy of the same result (or the same exception). A caller
+    that waited ``timeout`` seconds for a hung request stops waiting and sends its own.
+    """
+
+    def __init__(self, endpoints: Optional[Iterable[Tuple[str, str]]] = None, timeout: Optional[float] = None):
+        self.endpoints = frozenset(DEFAULT_COALESCED_ENDPOINTS if endpoints is None else endpoints)
+        self.timeout = timeout
+        self._calls: Dict[Tuple, _InFlightCall] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.coalesced = 0
+        self.timeouts = 0
+
+    def __call__(self, call_next: Callable, router_name: str, method_name: str, args: tuple, kwargs: dict) -> Any:
+        if (router_name, method_name) not in self.endpoints:
+            return call_next(router_name, method_name, args, kwargs)
+
+        key = make_call_key(router_name, method_name, args, kwargs)
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self.requests += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not is_leader:
+            if not call.done.wait(self.timeout):
+                with self._lock:
+                    self.timeouts += 1
+                return call_next(router_name, method_name, args, kwargs)
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = call_next(router_name, method_name, args, kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+                has_waiters = call.waiters > 0
+            call.done.set()
+        # Waiters copy the stored result, so the leader must not hand out the original to be mutated
+        return copy.deepcopy(call.result) if has_waiters else call.result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "requests": self.requests,
+                "coalesced": self.coalesced,
+                "timeouts": self.timeouts,
+            }
@@ -0,0 +1,175 @@
+import contextvars
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+from frontend.api.cache import make_call_key
+
+_current_trace: contextvars.ContextVar = contextvars.ContextVar("dashboard_rerun_trace", default=None)
+
+# Frames from these locations are plumbing (pool, middlewares, stdlib, Streamlit), not the code that asked for the call
+_INTERNAL_PATHS = (
+    os.path.dirname(os.path.abspath(__file__)),
+    os.path.dirname(os.path.abspath(os.__file__)),
+)
+
+
+def _find_caller() -> str:
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if not filename.startswith(_INTERNAL_PATHS) and f"{os.sep}streamlit{os.sep}" not in filename:
+            return f"{frame.f_code.co_name} ({os.path.relpath(filename)}:{frame.f_lineno})"
+        frame = frame.f_back
+    return "unknown"
+
+
+def _payload_size(value: Any) -> Optional[int]:
+    try:
+        return len(json.dumps(value, default=str))
+    except Exception:
+        return None
+
+
+class RerunTrace:
+    """Spans (backend calls and render steps) recorded during a single script rerun."""
+
+    def __init__(self, page: str):
+        self.page = page
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self.spans: List[dict] = []
+        self._lock = threading.Lock()
+
+    def add_span(self, kind: str, name: str, started: float, ended: float, caller: str, **extra) -> None:
+        span = {
+            "kind": kind,
+            "name": name,
+            "start_ms": round((started - self._started) * 1000, 2),
+            "duration_ms": round((ended - started) * 1000, 2),
+            "caller": caller,
+            "thread": threading.current_thread().name,
+            **extra,
+        }
+        with self._lock:
+            self.spans.append(span)
+
+    @property
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self._started) * 1000, 2)
+
+    def api_spans(self) -> List[dict]:
+        with self._lock:
+            return [span for span in self.spans if span["kind"] == "api"]
+
+    def duplicate_calls(self) -> List[dict]:
+        """Backend calls issued more than once with identical arguments in this rerun."""
+        counts = {}
+        for span in self.api_spans():
+            counts.setdefault((span["name"], span["key"]), []).append(span)
+        return [
+            {"endpoint": name, "calls": len(spans), "total_ms": round(sum(s["duration_ms"] for s in spans), 2)}
+            for (name, _), spans in counts.items()
+            if len(spans) > 1
+        ]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s["start_ms"])
+        return {
+            "page": self.page,
+            "started_at": self.started_at,
+            "elapsed_ms": self.elapsed_ms,
+            "api_calls": sum(1 for s in spans if s["kind"] == "api"),
+            "payload_bytes": sum(s.get("payload_bytes") or 0 for s in spans),
+            "spans": spans,
+            "duplicates": self.duplicate_calls(),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2, default=str)
+
+
+def start_trace(page: str) -> RerunTrace:
+    """Start recording spans for the current rerun (and any fan-out it triggers)."""
+    trace = RerunTrace(page)
+    _current_trace.set(trace)
+    return trace
+
+
+def stop_trace() -> None:
+    _current_trace.set(None)
+
+
+def get_current_trace() -> Optional[RerunTrace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_span(name: str, kind: str = "render"):
+    """Record the wrapped block as a span of the current rerun; a no-op when nothing is being traced."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield
+        return
+    caller = _find_caller()
+    started = time.perf_counter()
+    error = None
+    try:
+        yield
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        trace.add_span(kind, name, started, time.perf_counter(), caller, error=error)
+
+
+def traced(fn: Callable, name: str, kind: str = "render") -> Callable:
+    """Wrap ``fn`` so every call is recorded as a span while a rerun is being traced."""
+
+    def wrapper(*args, **kwargs):
+        if _current_trace.get() is None:
+            return fn(*args, **kwargs)
+        with trace_span(name, kind):
+            return fn(*args, **kwargs)
+
+    wrapper.__wrapped__ = fn
+    wrapper.__name__ = getattr(fn, "__name__", name)
+    wrapper.__doc__ = getattr(fn, "__doc__", None)
+    return wrapper
+
+
+class ApiTracer:
+    """Pool middleware recording latency, payload size and caller of each backend call in the traced rerun."""
+
+    def __call__(self, call_next: Callable, router_name: str, method_name: str, args: tuple, kwargs: dict) -> Any:
+        trace = _current_trace.get()
+        if trace is None:
+            return call_next(router_name, method_name, args, kwargs)
+
+        caller = _find_caller()
+        started = time.perf_counter()
+        result = None
+        error = None
+        try:
+            result = call_next(router_name, method_name, args, kwargs)
+            return result
+        except Exception as e:
+            error = str(e)
+            raise
+        finally:
+            ended = time.perf_counter()
+            trace.add_span(
+                "api",
+                f"{router_name}.{method_name}",
+                started,
+                ended,
+                caller,
+                key=make_call_key(router_name, method_name, args, kwargs)[2:],
+                payload_bytes=_payload_size(result) if error is None else None,
+                error=error,
+            )
@@ -0,0 +1,235 @@
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from frontend.api.candle_resample import interval_to_seconds
+from frontend.api.fanout import fan_out
+
+Market = Tuple[str, str]
+
+
+def price_map(response: Any) -> Dict[str, float]:
+    """``{trading_pair: price}`` from a ``get_prices`` response, whichever format it came in."""
+    if isinstance(response, dict):
+        if response.get("status") == "success":
+            response = response.get("data", {})
+        elif "prices" in response:
+            response = response["prices"]
+        return {pair: float(price) for pair, price in response.items() if isinstance(price, (int, float, str))}
+    if isinstance(response, list):
+        return {
+            item["trading_pair"]: float(item["price"])
+            for item in response
+            if isinstance(item, dict) and "trading_pair" in item and "price" in item
+        }
+    return {}
+
+
+class PriceHistory:
+    """Fixed-size ring buffer of ``(timestamp, price)`` samples, at most one per ``sample_interval``.
+
+    A sample in the same ``sample_interval`` bucket as the last one replaces it, so polling faster
+    than the sample interval keeps the latest price without growing the buffer.
+    """
+
+    def __init__(self, capacity: int, sample_interval: float = 60.0):
+        self.sample_interval = sample_interval
+        self._times = np.zeros(capacity)
+        self._prices = np.zeros(capacity)
+        self._head = 0  # next slot to write
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_time(self) -> Optional[float]:
+        return float(self._times[self._head - 1]) if self._size else None
+
+    @property
+    def last_price(self) -> Optional[float]:
+        return float(self._prices[self._head - 1]) if self._size else None
+
+    def add(self, timestamp: float, price: float) -> None:
+        last_time = self.last_time
+        if last_time is not None:
+            if timestamp < last_time:
+                return
+            if timestamp // self.sample_interval == last_time // self.sample_interval:
+                self._times[self._head - 1], self._prices[self._head - 1] = timestamp, price
+                return
+        self._times[self._head], self._prices[self._head] = timestamp, price
+        self._head = (self._head + 1) % len(self._times)
+        self._size = min(self._size + 1, len(self._times))
+
+    def series(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and prices, oldest first."""
+        order = np.arange(self._head - self._size, self._head) % len(self._times)
+        return self._times[order], self._prices[order]
+
+    def change(self, seconds: float, now: Optional[float] = None) -> Optional[float]:
+        """Fractional price change over the last ``seconds``, or None without a sample close enough to that time.
+
+        The reference is the last sample at or before ``now - seconds``, and must be no older than a
+        quarter of ``seconds`` beyond it, so a restart after a long gap doesn't report a stale change.
+        """
+        if not self._size:
+            return None
+        times, prices = self.series()
+        target = (now or times[-1]) - seconds
+        index = int(np.searchsorted(times, target, side="right")) - 1
+        if index < 0 or times[index] < target - seconds / 4 or not prices[index]:
+            return None
+        return float(prices[-1] / prices[index] - 1)
+
+    def sparkline(self, seconds: float, points: int = 48, now: Optional[float] = None) -> List[float]:
+        """Up to ``points`` prices evenly spaced over the last ``seconds``, interpolated between samples."""
+        if not self._size:
+            return []
+        times, prices = self.series()
+        end = now or times[-1]
+        grid = np.linspace(end - seconds, end, points)
+        grid = grid[grid >= times[0]]
+        return np.interp(grid, times, prices).tolist()
+
+
+class Watchlist:
+    """Prices of many markets, polled in one request per connector and kept as short rolling histories.
+
+    ``fetch_prices(connector, trading_pairs)`` returns ``{trading_pair: price}`` for a batch of
+    pairs. ``fetch_history(connector, trading_pair, interval, max_records)`` returns candles; when
+    given, a market's history is seeded once from ``seed_interval`` candles covering ``window``
+    seconds, so its 1h and 24h change are known right away instead of after a day of polling.
+
+    Shared by every session: within ``min_interval`` a connector is only polled again for pairs no
+    session requested yet that interval, however many sessions refresh.
+    """
+
+    def __init__(
+        self,
+        fetch_prices: Callable[[str, List[str]], Dict[str, float]],
+        fetch_history: Optional[Callable[[str, str, str, int], List[dict]]] = None,
+        window: float = 86400 + 3600,
+        sample_interval: float = 60.0,
+        seed_interval: str = "15m",
+        min_interval: float = 2.0,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        self._fetch_prices = fetch_prices
+        self._fetch_history = fetch_history
+        self.window = window
+        self.sample_interval = sample_interval
+        self.seed_interval = seed_interval
+        self.min_interval = min_interval
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self._histories: Dict[Market, PriceHistory] = {}
+        self._polled: Dict[str, Tuple[float, frozenset]] = {}
+        self._lock = threading.Lock()
+        self.price_requests = 0
+        self.history_requests = 0
+
+    def _new_history(self) -> PriceHistory:
+        return PriceHistory(int(self.window // self.sample_interval) + 1, self.sample_interval)
+
+    def _seed(self, markets: List[Market]) -> None:
+        step = interval_to_seconds(self.seed_interval)
+        records = int(self.window // step) + 1
+
+        def fetch(market):
+            return self._fetch_history(market[0], market[1], self.seed_interval, records)
+
+        result = fan_out(fetch, markets, timeout=self.timeout, max_concurrency=self.max_concurrency)
+        now = time.time()
+        with self._lock:
+            self.history_requests += len(markets)
+            for market, candles, error in result:
+                history = self._histories.setdefault(market, self._new_history())
+                # Failed seeds aren't retried; polling fills the history in instead
+                if error is not None or not candles:
+                    continue
+                for candle in candles:
+                    if "timestamp" in candle and "close" in candle:
+                        # A candle's close is the price at its close time
+                        history.add(min(float(candle["timestamp"]) + step, now), float(candle["close"]))
+
+    def refresh(self, markets: Iterable[Market]) -> None:
+        """Poll the current prices of ``markets`` with one batched request per connector, concurrently."""
+        markets = list(dict.fromkeys(markets))
+        now = time.time()
+        with self._lock:
+            new = [market for market in markets if market not in self._histories]
+        if new and self._fetch_history is not None:
+            self._seed(new)
+
+        by_connector: Dict[str, List[str]] = defaultdict(list)
+        for connector, trading_pair in markets:
+            by_connector[connector].append(trading_pair)
+        with self._lock:
+            due: Dict[str, List[str]] = {}
+            for connector, pairs in by_connector.items():
+                polled_at, polled_pairs = self._polled.get(connector, (0.0, frozenset()))
+                if now - polled_at >= self.min_interval:
+                    polled_at, polled_pairs = now, frozenset()
+                # Only the pairs no session polled yet this interval
+                missing = [pair for pair in pairs if pair not in polled_pairs]
+                if not missing:
+                    continue
+                # Claim them before fetching so concurrent sessions don't repeat the poll
+                self._polled[connector] = (polled_at, polled_pairs | frozenset(missing))
+                due[connector] = missing
+            self.price_requests += len(due)
+        if not due:
+            return
+
+        def fetch(connector):
+            return self._fetch_prices(connector, due[connector])
+
+        result = fan_out(fetch, list(due), timeout=self.timeout, max_concurrency=self.max_concurrency)
+        now = time.time()
+        with self._lock:
+            for connector, prices, error in result:
+                if error is not None:
+                    # Release the claim so the next refresh retries instead of waiting out min_interval
+                    polled_at, polled_pairs = self._polled.get(connector, (0.0, frozenset()))
+                    self._polled[connector] = (polled_at, polled_pairs - frozenset(due[connector]))
+                    continue
+                for trading_pair, price in (prices or {}).items():
+                    if price:
+                        self._histories.setdefault((connector, trading_pair), self._new_history()).add(now, price)
+
+    def history(self, connector: str, trading_pair: str) -> Optional[PriceHistory]:
+        return self._histories.get((connector, trading_pair))
+
+    def snapshot(self, markets: Iterable[Market], sparkline_seconds: float = 86400, points: int = 48) -> List[dict]:
+        """One row per market: last price, 1h and 24h change, and a sparkline of the last ``sparkline_seconds``."""
+        now = time.time()
+        rows = []
+        with self._lock:
+            for connector, trading_pair in markets:
+                history = self._histories.get((connector, trading_pair))
+                has_data = history is not None and len(history) > 0
+                rows.append(
+                    {
+                        "connector": connector,
+                        "trading_pair": trading_pair,
+                        "price": history.last_price if has_data else None,
+                        "change_1h": history.change(3600, now) if has_data else None,
+                        "change_24h": history.change(86400, now) if has_data else None,
+                        "sparkline": history.sparkline(sparkline_seconds, points, now) if has_data else [],
+                        "updated": history.last_time if has_data else None,
+                    }
+                )
+        return rows
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "markets": len(self._histories),
+                "price_requests": self.price_requests,
+                "history_requests": self.history_requests,
+            }
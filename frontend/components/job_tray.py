@@ -0,0 +1,50 @@
+import uuid
+
+import streamlit as st
+
+from frontend.api.jobs import JobQueue
+
+# Seconds between tray refreshes while this session has jobs in flight
+JOB_TRAY_REFRESH_INTERVAL = 2
+
+JOB_STATUS_ICONS = {"queued": "⏳", "running": "🔄", "waiting": "🔄", "done": "✅", "failed": "❌"}
+JOB_KIND_LABELS = {"deploy": "Deploy", "stop": "Stop", "archive": "Archive", "delete": "Delete config"}
+
+
+def job_owner() -> str:
+    """Id of this browser session, so the tray only lists the jobs it submitted."""
+    if "job_owner" not in st.session_state:
+        st.session_state.job_owner = uuid.uuid4().hex
+    return st.session_state.job_owner
+
+
+def render_job_tray(queue: JobQueue):
+    """Sidebar list of this session's background jobs, refreshed while any is in flight.
+
+    When the last one finishes the whole page reruns, so it shows what the jobs changed.
+    """
+    owner = job_owner()
+    if not queue.jobs(owner):
+        return
+    was_active = bool(queue.active(owner))
+
+    @st.fragment(run_every=JOB_TRAY_REFRESH_INTERVAL if was_active else None)
+    def job_tray():
+        jobs = queue.jobs(owner)
+        active = [job for job in jobs if not job.finished]
+        if was_active and not active:
+            st.rerun()
+        with st.expander(f"Jobs ({len(active)} running)" if active else "Jobs", expanded=bool(active)):
+            for job in jobs:
+                details = f"{job.status} · {job.elapsed:.0f}s"
+                if job.message:
+                    details += f" · {job.message}"
+                st.markdown(
+                    f"{JOB_STATUS_ICONS.get(job.status, '')} **{JOB_KIND_LABELS.get(job.kind, job.kind)}** "
+                    f"{job.target}  \n:gray[{details}]"
+                )
+            if len(active) < len(jobs) and st.button("Clear Finished", key="job_tray_clear", use_container_width=True):
+                queue.clear_finished(owner)
+                st.rerun()
+
+    job_tray()
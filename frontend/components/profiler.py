@@ -0,0 +1,94 @@
+import datetime
+from typing import Optional
+
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from CONFIG import PROFILER_ENABLED
+from frontend.api.tracer import RerunTrace, start_trace, stop_trace, traced
+from frontend.visualization.theme import get_default_layout
+
+# Render steps that dominate rerun time on the heavier pages
+TRACED_RENDER_STEPS = ["plotly_chart", "dataframe", "data_editor"]
+
+SPAN_COLORS = {"api": "#22d3ee", "render": "#8b5cf6"}
+
+
+def _instrument_render_steps():
+    """Wrap the expensive ``st.*`` render calls once per process; the wrappers are no-ops unless a rerun is traced."""
+    for step in TRACED_RENDER_STEPS:
+        render_fn = getattr(st, step)
+        if not getattr(render_fn, "_dashboard_traced", False):
+            wrapped = traced(render_fn, f"st.{step}")
+            wrapped._dashboard_traced = True
+            setattr(st, step, wrapped)
+
+
+def start_page_profiler(page_name: str) -> Optional[RerunTrace]:
+    """Start tracing this rerun when the developer profiler is enabled and toggled on in the sidebar."""
+    if not PROFILER_ENABLED:
+        return None
+    if not st.sidebar.toggle("Profile reruns", key="profiler_enabled", help="Record backend calls and render steps of each rerun"):
+        stop_trace()
+        return None
+    _instrument_render_steps()
+    return start_trace(page_name)
+
+
+def _waterfall_figure(spans):
+    labels = [f"{i + 1:02d}. {span['name']}" for i, span in enumerate(spans)]
+    fig = go.Figure(
+        go.Bar(
+            x=[max(span["duration_ms"], 0.5) for span in spans],
+            y=labels,
+            base=[span["start_ms"] for span in spans],
+            orientation="h",
+            marker=dict(color=[SPAN_COLORS.get(span["kind"], "#94a3b8") for span in spans]),
+            customdata=[[span["duration_ms"], span["caller"], span.get("payload_bytes") or 0] for span in spans],
+            hovertemplate="%{y}<br>%{customdata[0]:.1f} ms<br>%{customdata[1]}<br>%{customdata[2]:,} bytes<extra></extra>",
+        )
+    )
+    layout = get_default_layout(height=max(250, 22 * len(spans) + 80), width=None)
+    layout.update(
+        {
+            "margin": {"l": 10, "r": 10, "t": 10, "b": 30},
+            "xaxis": {"title": "ms since rerun start"},
+            "yaxis": {"autorange": "reversed", "tickfont": {"size": 10}},
+            "hovermode": "closest",
+        }
+    )
+    fig.update_layout(**layout)
+    return fig
+
+
+def render_profiler_panel(trace: Optional[RerunTrace]):
+    """Show the rerun waterfall in the sidebar with a JSON export, then stop tracing."""
+    if trace is None:
+        return
+    profile = trace.to_dict()
+    stop_trace()
+
+    with st.sidebar.expander("Rerun Profile", expanded=True):
+        st.caption(
+            f"{profile['elapsed_ms']:,.0f} ms · {profile['api_calls']} API calls · "
+            f"{profile['payload_bytes'] / 1024:,.1f} KB received"
+        )
+        if profile["spans"]:
+            st.plotly_chart(_waterfall_figure(profile["spans"]), use_container_width=True)
+            slowest = pd.DataFrame(profile["spans"]).sort_values("duration_ms", ascending=False).head(10)
+            st.dataframe(
+                slowest[["name", "duration_ms", "payload_bytes", "caller"]],
+                use_container_width=True,
+                hide_index=True,
+            )
+        if profile["duplicates"]:
+            st.warning(f"{len(profile['duplicates'])} endpoint(s) called more than once with the same arguments")
+            st.dataframe(pd.DataFrame(profile["duplicates"]), use_container_width=True, hide_index=True)
+        st.download_button(
+            label="Export JSON",
+            data=trace.to_json(),
+            file_name=f"profile_{profile['page']}_{datetime.datetime.now():%Y%m%d-%H%M%S}.json",
+            mime="application/json",
+            key="profiler_export",
+        )
@@ -0,0 +1,28 @@
+import pandas as pd
+import streamlit as st
+
+PAGE_SIZES = [50, 100, 250, 500]
+
+
+def paginate_frame(df: pd.DataFrame, key: str, default_page_size: int = 100) -> pd.DataFrame:
+    """Show page controls under a large table and return only the rows of the selected page.
+
+    Tables that fit in one page are returned unchanged, without controls.
+    """
+    if len(df) <= default_page_size:
+        return df
+    size_col, page_col, info_col = st.columns([1, 1, 2])
+    with size_col:
+        page_size = st.selectbox(
+            "Rows per page",
+            PAGE_SIZES,
+            index=PAGE_SIZES.index(default_page_size) if default_page_size in PAGE_SIZES else 0,
+            key=f"{key}_page_size",
+        )
+    pages = max(1, -(-len(df) // page_size))
+    with page_col:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1, key=f"{key}_page")
+    start = (min(page, pages) - 1) * page_size
+    with info_col:
+        st.caption(f"Rows {start + 1:,}–{min(start + page_size, len(df)):,} of {len(df):,}")
+    return df.iloc[start:start + page_size]
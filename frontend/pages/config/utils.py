@@ -1,7 +1,11 @@
+import time
+
 import pandas as pd
 import streamlit as st
 
-from frontend.st_utils import get_backend_api_client
+from CONFIG import CANDLE_RESAMPLE_BASE_INTERVAL, CANDLE_RESAMPLE_MAX_BASE_ROWS
+from frontend.api.candle_resample import choose_base_interval, resample_candles
+from frontend.st_utils import get_backend_api_client, get_candle_archive
 
 
 def get_max_records(days_to_download: int, interval: str) -> int:
@@ -15,18 +19,41 @@ def get_max_records(days_to_download: int, interval: str) -> int:
 def get_candles(
     connector_name="binance", trading_pair="BTC-USDT", interval="1m", days=7
 ):
-    backend_client = get_backend_api_client()
-
-    # Use the market_data.get_candles_last_days method
-    candles = backend_client.market_data.get_candles_last_days(
-        connector_name=connector_name,
-        trading_pair=trading_pair,
-        days=days,
-        interval=interval,
-    )
-
-    # Convert the response to DataFrame (response is a list of candles)
-    df = pd.DataFrame(candles)
+    # Coarser intervals are resampled from one cached base download, so switching the interval
+    # doesn't fetch again
+    base_interval = None
+    if CANDLE_RESAMPLE_BASE_INTERVAL:
+        base_interval = choose_base_interval(
+            interval, days * 86400, CANDLE_RESAMPLE_MAX_BASE_ROWS, CANDLE_RESAMPLE_BASE_INTERVAL
+        )
+    if base_interval is None:
+        return download_candles(connector_name, trading_pair, interval, days)
+    df = download_candles(connector_name, trading_pair, base_interval, days)
+    if df.empty or "timestamp" not in df.columns:
+        return df
+    return resample_candles(df, interval)
+
+
+@st.cache_data
+def download_candles(connector_name, trading_pair, interval, days):
+    archive = get_candle_archive()
+    if archive is not None:
+        # Only the days missing from the on-disk archive are downloaded
+        end_time = time.time()
+        df = archive.get(connector_name, trading_pair, interval, end_time - days * 86400, end_time)
+    else:
+        backend_client = get_backend_api_client()
+
+        # Use the market_data.get_candles_last_days method
+        candles = backend_client.market_data.get_candles_last_days(
+            connector_name=connector_name,
+            trading_pair=trading_pair,
+            days=days,
+            interval=interval,
+        )
+
+        # Convert the response to DataFrame (response is a list of candles)
+        df = pd.DataFrame(candles)
     if not df.empty and "timestamp" in df.columns:
         df.index = pd.to_datetime(df.timestamp, unit="s")
     return df
@@ -4,7 +4,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from frontend.st_utils import get_backend_api_client, initialize_st_page
+from frontend.st_utils import get_backend_api_client, get_candle_archive, initialize_st_page
 
 # Initialize Streamlit page
 initialize_st_page(title="Download Candles", icon=None, ms_icon="download")
@@ -42,15 +42,25 @@ if get_data_button:
         st.error("End Date should be greater than Start Date.")
         st.stop()
 
-    candles = backend_api_client.market_data.get_historical_candles(
-        connector_name=connector,
-        trading_pair=trading_pair,
-        interval=interval,
-        start_time=int(start_datetime.timestamp()),
-        end_time=int(end_datetime.timestamp()),
-    )
-
-    candles_df = pd.DataFrame(candles)
+    candle_archive = get_candle_archive()
+    if candle_archive is not None:
+        # Candles already on disk are reused; only the missing ranges are downloaded
+        candles_df = candle_archive.get(
+            connector,
+            trading_pair,
+            interval,
+            start_datetime.timestamp(),
+            end_datetime.timestamp(),
+        )
+    else:
+        candles = backend_api_client.market_data.get_historical_candles(
+            connector_name=connector,
+            trading_pair=trading_pair,
+            interval=interval,
+            start_time=int(start_datetime.timestamp()),
+            end_time=int(end_datetime.timestamp()),
+        )
+        candles_df = pd.DataFrame(candles)
     candles_df.index = pd.to_datetime(candles_df["timestamp"], unit="s")
 
     # Plotting the candlestick chart
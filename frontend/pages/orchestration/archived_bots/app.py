@@ -9,13 +9,17 @@ import plotly.graph_objects as go
 import streamlit as st
 from plotly.subplots import make_subplots
 
-from frontend.st_utils import get_backend_api_client, initialize_st_page
+from CONFIG import BACKEND_API_FANOUT_TIMEOUT
+from frontend.api.fanout import fan_out
+from frontend.components.profiler import render_profiler_panel, start_page_profiler
+from frontend.st_utils import get_backend_api_client, get_candle_archive, initialize_st_page
 
 # Enable nested async
 nest_asyncio.apply()
 
 # Initialize page
 initialize_st_page(layout="wide", show_readme=False)
+profiler_trace = start_page_profiler("archived_bots")
 
 # Session state initialization
 if "selected_database" not in st.session_state:
@@ -140,9 +144,16 @@ def load_all_databases_status():
     if not st.session_state.databases_list:
         return
 
+    statuses = fan_out(
+        load_database_status,
+        st.session_state.databases_list,
+        timeout=BACKEND_API_FANOUT_TIMEOUT,
+    )
     status_dict = {}
-    for db_path in st.session_state.databases_list:
-        status_dict[db_path] = load_database_status(db_path)
+    for db_path, status, error in statuses:
+        status_dict[db_path] = (
+            {"status": "error", "error": str(error)} if error else status
+        )
 
     st.session_state.databases_status = status_dict
     return status_dict
@@ -514,6 +525,17 @@ def get_historical_candles(
         extended_start = start_time - buffer_time
         extended_end = end_time + buffer_time
 
+        archive = get_candle_archive()
+        if archive is not None:
+            # Stored candles are read from disk; only missing ranges are downloaded
+            return archive.get(
+                connector_name,
+                trading_pair,
+                interval,
+                extended_start.timestamp(),
+                extended_end.timestamp(),
+            ).to_dict("records")
+
         # Call backend API to get historical candles using market_data service
         candles = backend_client.market_data.get_historical_candles(
             connector_name=connector_name,
@@ -1251,3 +1273,5 @@ st.sidebar.info(
     "- Use pagination for large datasets\n"
     "- Export data for external analysis"
 )
+
+render_profiler_panel(profiler_trace)
@@ -1,6 +1,8 @@
 import nest_asyncio
 import streamlit as st
 
+from CONFIG import BACKEND_API_FANOUT_TIMEOUT
+from frontend.api.fanout import fan_out
 from frontend.st_utils import get_backend_api_client, initialize_st_page
 
 nest_asyncio.apply()
@@ -15,15 +17,25 @@ NUM_COLUMNS = 4
 def get_all_connectors_config_map():
     # Get fresh client instance inside cached function
     connectors = client.connectors.list_connectors()
-    config_map_dict = {}
-    for connector_name in connectors:
-        try:
-            config_map = client.connectors.get_config_map(connector_name=connector_name)
-            config_map_dict[connector_name] = config_map
-        except Exception as e:
-            st.warning(f"Could not get config map for {connector_name}: {e}")
-            config_map_dict[connector_name] = []
-    return config_map_dict
+    config_maps = fan_out(
+        lambda connector_name: client.connectors.get_config_map(connector_name=connector_name),
+        connectors,
+        timeout=BACKEND_API_FANOUT_TIMEOUT,
+    )
+    for connector_name, e in config_maps.failures():
+        st.warning(f"Could not get config map for {connector_name}: {e}")
+    return config_maps.to_dict(default=[])
+
+
+def get_all_account_credentials(accounts):
+    account_credentials = fan_out(
+        client.accounts.list_account_credentials,
+        accounts,
+        timeout=BACKEND_API_FANOUT_TIMEOUT,
+    )
+    for account, e in account_credentials.failures():
+        st.warning(f"Could not get credentials for {account}: {e}")
+    return account_credentials.to_dict(default=[])
 
 
 all_connector_config_map = get_all_connectors_config_map()
@@ -31,8 +43,9 @@ all_connector_config_map = get_all_connectors_config_map()
 
 @st.fragment
 def accounts_section():
-    # Get fresh accounts list
+    # Get fresh accounts list and all their credentials in one concurrent batch
     accounts = client.accounts.list_accounts()
+    credentials_by_account = get_all_account_credentials(accounts) if accounts else {}
 
     if accounts:
         n_accounts = len(accounts)
@@ -45,8 +58,7 @@ def accounts_section():
             for j, account in enumerate(accounts[i: i + NUM_COLUMNS]):
                 with cols[j]:
                     st.subheader(f"{account}")
-                    credentials = client.accounts.list_account_credentials(account)
-                    st.json(credentials)
+                    st.json(credentials_by_account.get(account, []))
     else:
         st.write("No accounts available.")
 
@@ -103,9 +115,7 @@ def accounts_section():
             "Select the credentials account",
             options=accounts if accounts else ["No accounts available"],
         )
-        credentials_data = client.accounts.list_account_credentials(
-            delete_account_cred_name
-        )
+        credentials_data = credentials_by_account.get(delete_account_cred_name, [])
         # Handle different possible return formats
         if isinstance(credentials_data, list):
             # If it's a list of strings in format "connector.key"
@@ -1,112 +1,150 @@
-import time
+import re
 
 import pandas as pd
 import streamlit as st
 
-from frontend.st_utils import get_backend_api_client, initialize_st_page
+from CONFIG import BACKEND_API_FANOUT_TIMEOUT, FLEET_OPS_MAX_CONCURRENCY, FLEET_POLL_INTERVAL
+from frontend.api.fleet_ops import controller_targets, select_controllers, set_kill_switch
+from frontend.api.log_tail import LEVELS, filter_lines
+from frontend.components.job_tray import job_owner
+from frontend.components.profiler import render_profiler_panel, start_page_profiler
+from frontend.components.table_pager import paginate_frame
+from frontend.st_utils import get_backend_api_client, get_bot_jobs, get_fleet_poller, initialize_st_page
 
 initialize_st_page(icon=None, show_readme=False, ms_icon="hub")
+profiler_trace = start_page_profiler("instances")
 
 # Initialize backend client
 backend_api_client = get_backend_api_client()
+# Bot statuses and controller configs, polled in the background once for all sessions
+fleet_poller = get_fleet_poller()
+# Stop and archive run as background jobs, tracked in the sidebar
+bot_jobs = get_bot_jobs()
 
 # Initialize session state for auto-refresh
 if "auto_refresh_enabled" not in st.session_state:
     st.session_state.auto_refresh_enabled = True
 
-# Set refresh interval
-REFRESH_INTERVAL = 10  # seconds
+# Re-render as often as the fleet snapshot is refreshed
+REFRESH_INTERVAL = FLEET_POLL_INTERVAL  # seconds
+# Newest log lines shown per log section, in a single text block
+LOG_LINES_SHOWN = 200
+# Pages with at most this many bots show every bot's detail card; larger ones only the selected bots'
+MAX_AUTO_DETAIL_CARDS = 10
+
+FLEET_SORT_COLUMNS = {
+    "Bot": "bot_name",
+    "NET PNL": "net_pnl",
+    "NET PNL (%)": "net_pnl_pct",
+    "Unrealized PNL": "unrealized_pnl",
+    "Volume": "volume",
+    "Controller Errors": "errors",
+    "Error Logs": "error_logs",
+}
 
 
 def stop_bot(bot_name):
-    """Stop a running bot."""
-    try:
-        backend_api_client.bot_orchestration.stop_and_archive_bot(bot_name)
-        st.success(f"Bot {bot_name} stopped and archived successfully")
-        time.sleep(2)  # Give time for the backend to process
-    except Exception as e:
-        st.error(f"Failed to stop bot {bot_name}: {e}")
+    """Stop and archive a running bot in the background."""
+    bot_jobs.stop(bot_name, owner=job_owner())
+    st.toast(f"Stopping and archiving {bot_name}...")
+    # Full rerun, so the sidebar job tray picks the job up
+    st.rerun()
 
 
 def archive_bot(bot_name):
-    """Archive a stopped bot."""
-    try:
-        backend_api_client.docker.stop_container(bot_name)
-        backend_api_client.docker.remove_container(bot_name)
-        st.success(f"Bot {bot_name} archived successfully")
-        time.sleep(1)
-    except Exception as e:
-        st.error(f"Failed to archive bot {bot_name}: {e}")
-
-
-def stop_controllers(bot_name, controllers):
-    """Stop selected controllers."""
-    success_count = 0
-    for controller in controllers:
-        try:
-            backend_api_client.controllers.update_bot_controller_config(
-                bot_name, controller, {"manual_kill_switch": True}
-            )
-            success_count += 1
-        except Exception as e:
-            st.error(f"Failed to stop controller {controller}: {e}")
+    """Archive a stopped bot in the background."""
+    bot_jobs.archive(bot_name, owner=job_owner())
+    st.toast(f"Archiving {bot_name}...")
+    st.rerun()
+
+
+def update_controllers(targets, stop):
+    """Stop or start controllers concurrently with a live progress bar; returns the per-controller results."""
+    verb = "Stopping" if stop else "Starting"
+    progress = st.progress(0.0, text=f"{verb} {len(targets)} controller(s)...")
+    finished = []
+
+    def on_result(row):
+        finished.append(row)
+        failed = sum(r["status"] == "failed" for r in finished)
+        progress.progress(
+            len(finished) / len(targets),
+            text=f"{verb} controllers: {len(finished)}/{len(targets)} done, {failed} failed",
+        )
 
+    results = set_kill_switch(
+        backend_api_client.controllers.update_bot_controller_config,
+        targets,
+        stop,
+        max_concurrency=FLEET_OPS_MAX_CONCURRENCY,
+        timeout=BACKEND_API_FANOUT_TIMEOUT,
+        on_result=on_result,
+    )
+    progress.empty()
+    if any(r["status"] == "done" for r in results):
+        fleet_poller.refresh()
+    return results
+
+
+def update_bot_controllers(bot_name, controllers, stop):
+    """Stop or start the selected controllers of one bot."""
+    verb, done = ("stop", "stopped") if stop else ("start", "started")
+    results = update_controllers(
+        [{"bot_name": bot_name, "controller_id": controller} for controller in controllers], stop
+    )
+    for row in results:
+        if row["status"] == "failed":
+            st.error(f"Failed to {verb} controller {row['controller_id']}: {row['message']}")
+
+    success_count = sum(r["status"] == "done" for r in results)
     if success_count > 0:
-        st.success(f"Successfully stopped {success_count} controller(s)")
+        st.success(f"Successfully {done} {success_count} controller(s)")
         # Temporarily disable auto-refresh to prevent immediate state reset
         st.session_state.auto_refresh_enabled = False
 
     return success_count > 0
 
 
-def start_controllers(bot_name, controllers):
-    """Start selected controllers."""
-    success_count = 0
-    for controller in controllers:
-        try:
-            backend_api_client.controllers.update_bot_controller_config(
-                bot_name, controller, {"manual_kill_switch": False}
-            )
-            success_count += 1
-        except Exception as e:
-            st.error(f"Failed to start controller {controller}: {e}")
+def stop_controllers(bot_name, controllers):
+    """Stop selected controllers."""
+    return update_bot_controllers(bot_name, controllers, stop=True)
 
-    if success_count > 0:
-        st.success(f"Successfully started {success_count} controller(s)")
-        # Temporarily disable auto-refresh to prevent immediate state reset
-        st.session_state.auto_refresh_enabled = False
 
-    return success_count > 0
+def start_controllers(bot_name, controllers):
+    """Start selected controllers."""
+    return update_bot_controllers(bot_name, controllers, stop=False)
 
 
-def render_bot_card(bot_name):
-    """Render a bot performance card using native Streamlit components."""
+def render_log_tail(bot_name, kind, tail):
+    """Newest lines of a bot's log tail, filtered by a regex and by level."""
+    pattern_col, levels_col = st.columns([3, 2])
+    with pattern_col:
+        pattern = st.text_input("Filter (regex)", key=f"{kind}_log_pattern_{bot_name}")
+    with levels_col:
+        levels = st.multiselect("Levels", LEVELS, key=f"{kind}_log_levels_{bot_name}")
+    try:
+        lines = filter_lines(tail.lines(), pattern, levels)
+    except re.error as e:
+        st.error(f"Invalid regex: {e}")
+        return
+    if not lines:
+        st.info(f"No {kind} logs available.")
+        return
+    shown = lines[-LOG_LINES_SHOWN:]
+    st.caption(f"Newest {len(shown)} of {len(lines)} matching lines ({len(tail)} kept)")
+    st.code(
+        "\n".join(
+            f"{pd.to_datetime(int(log.get('timestamp', 0)), unit='s')} - {log.get('level_name', '')} - "
+            f"{log.get('logger_name', '')}: {log.get('msg', '')}"
+            for log in reversed(shown)
+        ),
+        language=None,
+    )
+
+
+def render_bot_card(bot_name, bot_status, controller_configs, logs):
+    """Render a bot performance card from the fleet snapshot using native Streamlit components."""
     try:
-        # Get bot status first
-        bot_status = backend_api_client.bot_orchestration.get_bot_status(bot_name)
-
-        # Only try to get controller configs if bot exists and is running
-        controller_configs = []
-        if bot_status.get("status") == "success":
-            bot_data = bot_status.get("data", {})
-            is_running = bot_data.get("status") == "running"
-            if is_running:
-                try:
-                    controller_configs = (
-                        backend_api_client.controllers.get_bot_controller_configs(
-                            bot_name
-                        )
-                    )
-                    controller_configs = (
-                        controller_configs if controller_configs else []
-                    )
-                except Exception as e:
-                    # If controller configs fail, continue without them
-                    st.warning(
-                        f"Could not fetch controller configs for {bot_name}: {e}"
-                    )
-                    controller_configs = []
-
         with st.container(border=True):
             if bot_status.get("status") == "error":
                 # Error state
@@ -120,8 +158,6 @@ def render_bot_card(bot_name):
                 bot_data = bot_status.get("data", {})
                 is_running = bot_data.get("status") == "running"
                 performance = bot_data.get("performance", {})
-                error_logs = bot_data.get("error_logs", [])
-                general_logs = bot_data.get("general_logs", [])
 
                 # Bot header
                 col1, col2, col3 = st.columns([2, 1, 1])
@@ -291,7 +327,6 @@ def render_bot_card(bot_name):
                                     f"Stopping {len(selected_active)} controller(s)..."
                                 ):
                                     stop_controllers(bot_name, selected_active)
-                                    time.sleep(1)
 
                     # Stopped Controllers
                     if stopped_controllers:
@@ -334,7 +369,6 @@ def render_bot_card(bot_name):
                                     f"Starting {len(selected_stopped)} controller(s)..."
                                 ):
                                     start_controllers(bot_name, selected_stopped)
-                                    time.sleep(1)
 
                     # Error Controllers
                     if error_controllers:
@@ -346,28 +380,13 @@ def render_bot_card(bot_name):
                             error_df, use_container_width=True, hide_index=True
                         )
 
-                # Logs sections (available for both running and stopped bots)
-                with st.expander("Error Logs"):
-                    if error_logs:
-                        for log in error_logs[:50]:
-                            timestamp = log.get("timestamp", "")
-                            message = log.get("msg", "")
-                            logger_name = log.get("logger_name", "")
-                            st.text(f"{timestamp} - {logger_name}: {message}")
-                    else:
-                        st.info("No error logs available.")
+                # Logs sections (available for both running and stopped bots), read from the
+                # bot's log tails, which the poller only extends with lines it hasn't seen
+                with st.expander(f"Error Logs ({len(logs['error'])})"):
+                    render_log_tail(bot_name, "error", logs["error"])
 
-                with st.expander("General Logs"):
-                    if general_logs:
-                        for log in general_logs[:50]:
-                            timestamp = pd.to_datetime(
-                                int(log.get("timestamp", 0)), unit="s"
-                            )
-                            message = log.get("msg", "")
-                            logger_name = log.get("logger_name", "")
-                            st.text(f"{timestamp} - {logger_name}: {message}")
-                    else:
-                        st.info("No general logs available.")
+                with st.expander(f"General Logs ({len(logs['general'])})"):
+                    render_log_tail(bot_name, "general", logs["general"])
 
     except Exception as e:
         with st.container(border=True):
@@ -375,6 +394,159 @@ def render_bot_card(bot_name):
             st.error(f"An error occurred while fetching bot status: {str(e)}")
 
 
+def filter_fleet(summary, search, statuses, sort_label, descending):
+    """Rows of the fleet summary matching the name search and statuses, sorted before paging."""
+    rows = summary
+    if search:
+        rows = rows[rows["bot_name"].str.contains(search, case=False, regex=False)]
+    if statuses:
+        rows = rows[rows["status"].isin(statuses)]
+    return rows.sort_values(FLEET_SORT_COLUMNS[sort_label], ascending=not descending, kind="stable")
+
+
+def render_fleet_operations(snapshot):
+    """Stop or start every controller matching the selectors, across all running bots at once."""
+    targets = controller_targets(snapshot.bots)
+    if not targets:
+        st.caption("No controllers on running bots.")
+        return
+
+    glob_col, connector_col, pair_col, type_col = st.columns(4)
+    with glob_col:
+        bot_glob = st.text_input("Bot name", key="fleet_ops_bot_glob", placeholder="Glob, e.g. pmm-*")
+    with connector_col:
+        connectors = st.multiselect(
+            "Connector", sorted({t["connector_name"] for t in targets}), key="fleet_ops_connectors"
+        )
+    with pair_col:
+        trading_pairs = st.multiselect(
+            "Trading pair", sorted({t["trading_pair"] for t in targets}), key="fleet_ops_trading_pairs"
+        )
+    with type_col:
+        controller_types = st.multiselect(
+            "Controller type", sorted({t["controller_type"] for t in targets}), key="fleet_ops_controller_types"
+        )
+
+    selected = select_controllers(targets, bot_glob, connectors, trading_pairs, controller_types)
+    active = [t for t in selected if not t["stopped"]]
+    stopped = [t for t in selected if t["stopped"]]
+    st.caption(
+        f"{len(selected)} of {len(targets)} controllers match across "
+        f"{len({t['bot_name'] for t in selected})} bots: {len(active)} active, {len(stopped)} stopped"
+    )
+
+    to_update, stop = None, True
+    stop_col, start_col, _ = st.columns([1, 1, 2])
+    with stop_col:
+        with st.popover(f"Stop {len(active)} Controllers", disabled=not active, use_container_width=True):
+            st.write(f"Set the kill switch of {len(active)} controllers?")
+            if st.button("Confirm", type="primary", key="fleet_ops_confirm_stop"):
+                to_update, stop = active, True
+    with start_col:
+        with st.popover(f"Start {len(stopped)} Controllers", disabled=not stopped, use_container_width=True):
+            st.write(f"Start {len(stopped)} stopped controllers?")
+            if st.button("Confirm", type="primary", key="fleet_ops_confirm_start"):
+                to_update, stop = stopped, False
+    if to_update:
+        st.session_state["fleet_ops_results"] = update_controllers(to_update, stop)
+
+    results = st.session_state.get("fleet_ops_results")
+    if results:
+        failed = [r for r in results if r["status"] == "failed"]
+        if failed:
+            st.error(f"Updated {len(results) - len(failed)} of {len(results)} controllers; {len(failed)} failed")
+        else:
+            st.success(f"Updated {len(results)} controllers")
+        st.dataframe(
+            pd.DataFrame(results).sort_values("status", kind="stable"),
+            hide_index=True,
+            use_container_width=True,
+        )
+        if st.button("Clear Report", key="fleet_ops_clear"):
+            del st.session_state["fleet_ops_results"]
+            st.rerun(scope="fragment")
+
+
+def select_fleet_rows(key, page_bots):
+    """Turn the table's row selection into bot names, so it survives re-sorts, refreshes and paging.
+
+    Rows on the page the user clicked replace that page's picks; picks on other pages are kept.
+    """
+    rows = st.session_state[key].selection.rows
+    picked = {page_bots[row] for row in rows if row < len(page_bots)}
+    kept = [bot for bot in st.session_state.get("fleet_selected_bots", []) if bot not in page_bots]
+    st.session_state.fleet_selected_bots = kept + [bot for bot in page_bots if bot in picked]
+
+
+def render_fleet_table(snapshot):
+    """Fleet summary table with filters, sorting and paging; returns the bots whose detail cards to show."""
+    summary = snapshot.summary()
+    total_col1, total_col2, total_col3, total_col4 = st.columns(4)
+    with total_col1:
+        st.metric("Bots", f"{len(summary)}", help=f"{(summary['status'] == 'running').sum()} running")
+    with total_col2:
+        st.metric("Fleet NET PNL", f"${summary['net_pnl'].sum():,.2f}")
+    with total_col3:
+        st.metric("Fleet Unrealized PNL", f"${summary['unrealized_pnl'].sum():,.2f}")
+    with total_col4:
+        st.metric("Fleet Volume", f"${summary['volume'].sum():,.2f}")
+
+    search_col, status_col, sort_col, order_col = st.columns([2, 2, 1, 1])
+    with search_col:
+        search = st.text_input("Filter bots", key="fleet_search", placeholder="Bot name contains...")
+    with status_col:
+        statuses = st.multiselect("Status", ["running", "stopped"], key="fleet_status")
+    with sort_col:
+        sort_label = st.selectbox("Sort by", list(FLEET_SORT_COLUMNS), index=1, key="fleet_sort")
+    with order_col:
+        descending = st.toggle("Descending", value=True, key="fleet_sort_descending")
+
+    # Filtered, sorted and paged here, so the browser only receives the visible page
+    rows = filter_fleet(summary, search, statuses, sort_label, descending)
+    page = paginate_frame(rows, "fleet_table", default_page_size=50)
+    page_bots = page["bot_name"].tolist()
+    # The widget only reports row positions, so give each distinct page (and each cleared selection) its
+    # own key: a position is never read against rows that moved, and the selection itself is kept by name
+    table_key = f"fleet_table_selection_{st.session_state.get('fleet_selection_generation', 0)}_{hash(tuple(page_bots))}"
+    st.dataframe(
+        page.assign(net_pnl_pct=page["net_pnl_pct"] * 100),
+        key=table_key,
+        on_select=lambda: select_fleet_rows(table_key, page_bots),
+        selection_mode="multi-row",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "bot_name": st.column_config.TextColumn("Bot"),
+            "status": st.column_config.TextColumn("Status"),
+            "controllers": st.column_config.NumberColumn("Controllers"),
+            "active": st.column_config.NumberColumn("Active"),
+            "stopped": st.column_config.NumberColumn("Stopped"),
+            "errors": st.column_config.NumberColumn("Errors"),
+            "net_pnl": st.column_config.NumberColumn("NET PNL", format="$%.2f"),
+            "unrealized_pnl": st.column_config.NumberColumn("Unrealized PNL", format="$%.2f"),
+            "net_pnl_pct": st.column_config.NumberColumn("NET PNL (%)", format="%.2f%%"),
+            "volume": st.column_config.NumberColumn("Volume", format="$%.2f"),
+            "error_logs": st.column_config.NumberColumn("Error Logs"),
+        },
+    )
+    fleet_bots = set(summary["bot_name"])
+    selected = [bot for bot in st.session_state.get("fleet_selected_bots", []) if bot in fleet_bots]
+    if selected:
+        caption_col, clear_col = st.columns([5, 1])
+        with caption_col:
+            st.caption(f"Showing {len(selected)} selected bot(s): {', '.join(selected)}")
+        with clear_col:
+            if st.button("Clear Selection", key="fleet_selection_clear", use_container_width=True):
+                st.session_state.fleet_selected_bots = []
+                st.session_state.fleet_selection_generation = st.session_state.get("fleet_selection_generation", 0) + 1
+                st.rerun()
+        return selected
+    if len(page) <= MAX_AUTO_DETAIL_CARDS:
+        return page_bots
+    st.caption("Select bots in the table to show their controllers and logs.")
+    return []
+
+
 # Page Header
 st.title("Hummingbot Instances")
 
@@ -400,7 +572,7 @@ with col3:
         # Re-enable auto-refresh if it was temporarily disabled
         if not st.session_state.auto_refresh_enabled:
             st.session_state.auto_refresh_enabled = True
-        pass
+        fleet_poller.refresh(wait=REFRESH_INTERVAL)
 
 
 @st.fragment(
@@ -408,53 +580,42 @@ with col3:
 )
 def show_bot_instances():
     """Fragment to display bot instances with auto-refresh."""
-    try:
-        active_bots_response = (
-            backend_api_client.bot_orchestration.get_active_bots_status()
-        )
-
-        if active_bots_response.get("status") == "success":
-            active_bots = active_bots_response.get("data", {})
-
-            # Filter out any bots that might be in transitional state
-            truly_active_bots = {}
-            for bot_name, bot_info in active_bots.items():
-                try:
-                    bot_status = backend_api_client.bot_orchestration.get_bot_status(
-                        bot_name
-                    )
-                    if bot_status.get("status") == "success":
-                        bot_data = bot_status.get("data", {})
-                        if bot_data.get("status") in ["running", "stopped"]:
-                            truly_active_bots[bot_name] = bot_info
-                except Exception:
-                    continue
-
-            if truly_active_bots:
-                # Show refresh status
-                if st.session_state.auto_refresh_enabled:
-                    status_placeholder.info(
-                        f"Auto-refreshing every {REFRESH_INTERVAL} seconds"
-                    )
-                else:
-                    status_placeholder.warning(
-                        "Auto-refresh paused. Click 'Refresh Now' to resume."
-                    )
-
-                # Render each bot
-                for bot_name in truly_active_bots.keys():
-                    render_bot_card(bot_name)
-            else:
-                status_placeholder.info(
-                    "No active bot instances found. Deploy a bot to see it here."
-                )
+    snapshot = fleet_poller.snapshot(wait=REFRESH_INTERVAL)
+    if snapshot is None:
+        st.error("Failed to fetch active bots status.")
+        return
+    if snapshot.error:
+        st.error(f"Failed to refresh bot instances: {snapshot.error}")
+        if not snapshot.bots:
+            st.info("Please make sure the backend is running and accessible.")
+            return
+
+    if snapshot.bots:
+        # Show refresh status
+        if st.session_state.auto_refresh_enabled:
+            status_placeholder.info(
+                f"Auto-refreshing every {REFRESH_INTERVAL:g} seconds · updated {snapshot.age:.0f}s ago"
+            )
         else:
-            st.error("Failed to fetch active bots status.")
+            status_placeholder.warning(
+                "Auto-refresh paused. Click 'Refresh Now' to resume."
+            )
 
-    except Exception as e:
-        st.error(f"Failed to connect to backend: {e}")
-        st.info("Please make sure the backend is running and accessible.")
+        with st.expander("Fleet Operations", expanded="fleet_ops_results" in st.session_state):
+            render_fleet_operations(snapshot)
+
+        # Detail cards only for the selected bots (or a small page), so render time doesn't grow
+        # with the fleet; all data comes from the shared snapshot, no per-viewer requests
+        for bot_name in render_fleet_table(snapshot):
+            bot = snapshot.bots[bot_name]
+            render_bot_card(bot_name, bot["status"], bot["controller_configs"], bot["logs"])
+    else:
+        status_placeholder.info(
+            "No active bot instances found. Deploy a bot to see it here."
+        )
 
 
 # Call the fragment
 show_bot_instances()
+
+render_profiler_panel(profiler_trace)
@@ -4,12 +4,15 @@ import time
 import pandas as pd
 import streamlit as st
 
-from frontend.st_utils import get_backend_api_client, initialize_st_page
+from frontend.components.job_tray import job_owner
+from frontend.st_utils import get_backend_api_client, get_bot_jobs, initialize_st_page
 
 initialize_st_page(icon=None, ms_icon="rocket_launch", show_readme=False)
 
 # Initialize backend client
 backend_api_client = get_backend_api_client()
+# Deploys and deletes run as background jobs, tracked in the sidebar
+bot_jobs = get_bot_jobs()
 
 
 def get_controller_configs():
@@ -61,47 +64,34 @@ def launch_new_bot(
     start_time_str = time.strftime("%Y%m%d-%H%M")
     full_bot_name = f"{bot_name}-{start_time_str}"
 
-    try:
-        # Use the new deploy_v2_controllers method
-        deploy_config = {
-            "instance_name": full_bot_name,
-            "credentials_profile": credentials,
-            "controllers_config": selected_controllers,
-            "image": image_name,
-        }
-
-        # Add optional drawdown parameters if set
-        if max_global_drawdown is not None and max_global_drawdown > 0:
-            deploy_config["max_global_drawdown_quote"] = max_global_drawdown
-        if max_controller_drawdown is not None and max_controller_drawdown > 0:
-            deploy_config["max_controller_drawdown_quote"] = max_controller_drawdown
-
-        backend_api_client.bot_orchestration.deploy_v2_controllers(**deploy_config)
-        st.success(f"Successfully deployed bot: {full_bot_name}")
-        time.sleep(3)
-        return True
+    # Use the new deploy_v2_controllers method
+    deploy_config = {
+        "instance_name": full_bot_name,
+        "credentials_profile": credentials,
+        "controllers_config": selected_controllers,
+        "image": image_name,
+    }
 
-    except Exception as e:
-        st.error(f"Failed to deploy bot: {e}")
-        return False
+    # Add optional drawdown parameters if set
+    if max_global_drawdown is not None and max_global_drawdown > 0:
+        deploy_config["max_global_drawdown_quote"] = max_global_drawdown
+    if max_controller_drawdown is not None and max_controller_drawdown > 0:
+        deploy_config["max_controller_drawdown_quote"] = max_controller_drawdown
+
+    # Runs in the background until the bot shows up as active
+    bot_jobs.deploy(deploy_config, owner=job_owner())
+    st.toast(f"Deploying bot {full_bot_name}...")
+    return True
 
 
 def delete_selected_configs(selected_controllers):
     """Delete selected controller configurations."""
     if selected_controllers:
-        try:
-            for config in selected_controllers:
-                # Remove .yml extension if present
-                config_name = config.replace(".yml", "")
-                response = backend_api_client.controllers.delete_controller_config(  # noqa: F841
-                    config_name
-                )
-                st.success(f"Deleted {config_name}")
-            return True
-
-        except Exception as e:
-            st.error(f"Failed to delete configs: {e}")
-            return False
+        for config in selected_controllers:
+            # Remove .yml extension if present
+            bot_jobs.delete_config(config.replace(".yml", ""), owner=job_owner())
+        st.toast(f"Deleting {len(selected_controllers)} config(s)...")
+        return True
     else:
         st.warning(
             "You need to select the controllers configs that you want to delete."
@@ -310,18 +300,15 @@ with st.container(border=True):
                 "Deploy Bot", type=deploy_button_style, use_container_width=True
             ):
                 if selected_controllers:
-                    with st.spinner(
-                        "Starting Bot... This process may take a few seconds"
+                    if launch_new_bot(
+                        bot_name,
+                        image_name,
+                        credentials,
+                        selected_controllers,
+                        max_global_drawdown,
+                        max_controller_drawdown,
                     ):
-                        if launch_new_bot(
-                            bot_name,
-                            image_name,
-                            credentials,
-                            selected_controllers,
-                            max_global_drawdown,
-                            max_controller_drawdown,
-                        ):
-                            st.rerun()
+                        st.rerun()
                 else:
                     st.warning("Please select at least one controller to deploy")
 
@@ -2,10 +2,12 @@ import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+from frontend.components.profiler import render_profiler_panel, start_page_profiler
 from frontend.st_utils import download_csv_button, get_backend_api_client, initialize_st_page
 from frontend.visualization.theme import get_default_layout
 
 initialize_st_page(title="Portfolio", icon=None, ms_icon="finance")
+profiler_trace = start_page_profiler("portfolio")
 
 # Page content
 client = get_backend_api_client()
@@ -525,3 +527,5 @@ with history_tab:
     portfolio_history()
 with details_tab:
     portfolio_details()
+
+render_profiler_panel(profiler_trace)
@@ -7,15 +7,45 @@ import plotly.graph_objects as go
 import streamlit as st
 from plotly.subplots import make_subplots
 
-from frontend.st_utils import get_backend_api_client, initialize_st_page
+from CONFIG import (
+    ACCOUNT_DATA_MAX_ROWS,
+    ACCOUNT_DATA_PAGE_SIZE,
+    BACKEND_API_FANOUT_TIMEOUT,
+    BULK_CANCEL_MAX_CONCURRENCY,
+    BULK_CANCEL_RATE_LIMIT,
+    WATCHLIST_DEFAULT_PAIRS,
+    WATCHLIST_REFRESH_INTERVAL,
+)
+from frontend.api.bulk_orders import bulk_cancel
+from frontend.api.fanout import fan_out
+from frontend.api.indicators import ATR, EMA, VWAP, BollingerBands, IndicatorSet
+from frontend.api.order_book import ASKS, BIDS, TICK_GROUPS, OrderBook
+from frontend.api.paginated import KeyedStore, fetch_all, sync_newest
+from frontend.api.position_risk import PositionRisk
+from frontend.components.profiler import render_profiler_panel, start_page_profiler
+from frontend.components.table_pager import paginate_frame
+from frontend.st_utils import (
+    get_backend_api_client,
+    get_candle_store,
+    get_market_data_stream,
+    get_watchlist,
+    initialize_st_page,
+)
 
 # Enable nested async
 nest_asyncio.apply()
 
 initialize_st_page(layout="wide", show_readme=False, ms_icon="show_chart")
+profiler_trace = start_page_profiler("trading")
 
 # Initialize backend client
 backend_api_client = get_backend_api_client()
+# Background market data subscriber (None unless MARKET_DATA_STREAM is enabled)
+market_stream = get_market_data_stream()
+# Incremental candle cache shared by all sessions
+candle_store = get_candle_store()
+# Batched price polling for the watchlist, shared by all sessions
+watchlist = get_watchlist()
 
 # Initialize session state
 if "selected_account" not in st.session_state:
@@ -27,6 +57,8 @@ if "selected_market" not in st.session_state:
         "connector": "binance_perpetual",
         "trading_pair": "BTC-USDT",
     }
+if "trading_pair_input" not in st.session_state:
+    st.session_state.trading_pair_input = "BTC-USDT"
 if "candles_connector" not in st.session_state:
     st.session_state.candles_connector = None
 if "auto_refresh_enabled" not in st.session_state:
@@ -37,8 +69,6 @@ if "max_candles" not in st.session_state:
     st.session_state.max_candles = 100  # Reduced for better performance
 if "last_api_request" not in st.session_state:
     st.session_state.last_api_request = 0  # Track last API request time
-if "last_refresh_time" not in st.session_state:
-    st.session_state.last_refresh_time = 0  # Track last refresh time
 
 # Trading form session state
 if "trade_custom_price" not in st.session_state:
@@ -48,21 +78,45 @@ if "trade_price_set_by_user" not in st.session_state:
 if "last_order_type" not in st.session_state:
     st.session_state.last_order_type = "market"  # Track order type changes
 
-# Set refresh interval for real-time updates
-REFRESH_INTERVAL = 30  # seconds
+# Each panel is a fragment with its own refresh interval (seconds), so a fast order book update
+# reruns only the order book instead of the whole page and never resets the order form
+MARKET_REFRESH_INTERVAL = 2  # prices, top of book, depth and order book
+CANDLES_REFRESH_INTERVAL = 5  # chart refresh; only new and still-forming candles are fetched
+ACCOUNT_REFRESH_INTERVAL = 15  # balances, positions, active orders and order history
+FUNDING_REFRESH_INTERVAL = 30
+# Levels per side fetched for the depth metrics and the order book chart, once per refresh for all panels
+ORDER_BOOK_DEPTH = 1000
+
+CHART_INTERVALS = ["1m", "3m", "5m", "15m", "1h", "4h", "1d"]
+# Chart overlays; each keeps O(1) state and only advances by the candles closed since the last refresh
+CHART_INDICATORS = {
+    "EMA 20": lambda: EMA(20),
+    "EMA 50": lambda: EMA(50),
+    "VWAP": VWAP,
+    "Bollinger Bands (20, 2)": lambda: BollingerBands(20, 2.0),
+    "ATR 14": lambda: ATR(14),
+}
+
+
+def refresh_every(seconds):
+    """Fragment ``run_every`` for a panel: ``seconds`` while auto-refresh is on, otherwise manual only."""
+    return seconds if st.session_state.auto_refresh_enabled else None
 
 
 def get_accounts_and_credentials():
     """Get available accounts and their credentials."""
     try:
         accounts_list = backend_api_client.accounts.list_accounts()
-        credentials_list = {}
-        for account in accounts_list:
-            credentials = backend_api_client.accounts.list_account_credentials(
+        credentials = fan_out(
+            lambda account: backend_api_client.accounts.list_account_credentials(
                 account_name=account
-            )
-            credentials_list[account] = credentials
-        return accounts_list, credentials_list
+            ),
+            accounts_list,
+            timeout=BACKEND_API_FANOUT_TIMEOUT,
+        )
+        for account, e in credentials.failures():
+            st.warning(f"Could not fetch credentials for {account}: {e}")
+        return accounts_list, credentials.to_dict(default=[])
     except Exception as e:
         st.error(f"Failed to fetch accounts: {e}")
         return [], {}
@@ -85,67 +139,70 @@ def get_candles_connectors():
         return []
 
 
+def account_store(name, key):
+    """Session-wide keyed copy of an account list, so refreshes only apply the rows that changed."""
+    if name not in st.session_state:
+        st.session_state[name] = KeyedStore(key)
+    return st.session_state[name]
+
+
 def get_positions():
-    """Get current positions."""
+    """Get current positions, every page of them."""
+    store = account_store(
+        "positions_store",
+        lambda p: (p.get("account_name"), p.get("connector_name"), p.get("trading_pair"), p.get("position_side")),
+    )
     try:
-        response = backend_api_client.trading.get_positions(limit=100)
-        # Handle both response formats
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict) and response.get("status") == "success":
-            return response.get("data", [])
-        elif isinstance(response, dict) and "data" in response:
-            # Handle the actual API response format
-            return response.get("data", [])
-        return []
+        store.replace(
+            fetch_all(
+                backend_api_client.trading.get_positions,
+                page_size=ACCOUNT_DATA_PAGE_SIZE,
+                max_rows=ACCOUNT_DATA_MAX_ROWS,
+            )
+        )
     except Exception as e:
         st.error(f"Failed to fetch positions: {e}")
-        return []
+    return store.frame()
 
 
 def get_active_orders():
-    """Get active orders."""
+    """Get active orders, every page of them."""
+    store = account_store("active_orders_store", lambda o: o.get("client_order_id"))
     try:
-        response = backend_api_client.trading.get_active_orders(limit=100)
-        # Handle both response formats
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict):
-            # Check for different response formats
-            if response.get("status") == "success":
-                return response.get("data", [])
-            elif "data" in response:
-                # Handle response format like {"data": [...], "pagination": {...}}
-                return response.get("data", [])
-        return []
+        store.replace(
+            fetch_all(
+                backend_api_client.trading.get_active_orders,
+                page_size=ACCOUNT_DATA_PAGE_SIZE,
+                max_rows=ACCOUNT_DATA_MAX_ROWS,
+            )
+        )
     except Exception as e:
         st.error(f"Failed to fetch active orders: {e}")
-        return []
+    return store.frame()
 
 
 def get_order_history():
-    """Get recent order history."""
+    """Get order history; after the first load only the newest pages are read until nothing changed."""
+    store = account_store("order_history_store", lambda o: o.get("client_order_id"))
     try:
-        # Try to get orders instead of order_history since that method doesn't exist
-        response = backend_api_client.trading.search_orders(limit=50)
-        # Handle both response formats
-        if isinstance(response, list):
-            return response
-        elif isinstance(response, dict):
-            # Check for different response formats
-            if response.get("status") == "success":
-                return response.get("data", [])
-            elif "data" in response:
-                # Handle response format like {"data": [...], "pagination": {...}}
-                return response.get("data", [])
-        return []
+        sync_newest(
+            store,
+            backend_api_client.trading.search_orders,
+            page_size=ACCOUNT_DATA_PAGE_SIZE,
+            max_rows=ACCOUNT_DATA_MAX_ROWS,
+        )
     except Exception:
-        # If get_orders doesn't exist either, just return empty list without warning
-        return []
+        # Keep showing the rows already loaded
+        pass
+    return store.frame()
 
 
 def get_order_book(connector, trading_pair, depth=10):
     """Get order book data for the selected trading pair."""
+    if market_stream is not None:
+        order_book = market_stream.order_book(connector, trading_pair, depth)
+        if order_book:
+            return order_book
     try:
         response = backend_api_client.market_data.get_order_book(
             connector_name=connector, trading_pair=trading_pair, depth=depth
@@ -203,7 +260,7 @@ def get_trade_history(account_name, connector_name, trading_pair):
         # If method doesn't exist, try alternative approach
         try:
             # Get all orders and filter for filled ones
-            orders = get_order_history()
+            orders = get_order_history().to_dict("records")
             trades = []
             for order in orders:
                 if (
@@ -217,74 +274,88 @@ def get_trade_history(account_name, connector_name, trading_pair):
             return []
 
 
-def get_market_data(
+def get_candles(
     connector, trading_pair, interval="1m", max_records=100, candles_connector=None
 ):
-    """Get market data with proper error handling."""
+    """Get candles with proper error handling."""
     start_time = time.time()
+    candles = []
+    # Use candles_connector if provided, otherwise use main connector
+    candles_conn = candles_connector if candles_connector else connector
+    if market_stream is not None:
+        streamed = market_stream.candles(candles_conn, trading_pair, interval, max_records)
+        if streamed:
+            return streamed
     try:
-        # Get candles
-        candles = []
-        try:
-            # Use candles_connector if provided, otherwise use main connector
-            candles_conn = candles_connector if candles_connector else connector
-            candles_response = backend_api_client.market_data.get_candles(
-                connector_name=candles_conn,
-                trading_pair=trading_pair,
-                interval=interval,
-                max_records=max_records,
-            )
-            # Handle both response formats
-            if isinstance(candles_response, list):
-                # Direct list response
-                candles = candles_response
-            elif (
-                isinstance(candles_response, dict)
-                and candles_response.get("status") == "success"
-            ):
-                # Response object with status and data
-                candles = candles_response.get("data", [])
-        except Exception as e:
-            st.warning(f"Could not fetch candles: {e}")
+        # Only the candles opened since the last refresh (and the forming one) are downloaded
+        candles = candle_store.get(candles_conn, trading_pair, interval, max_records)
+    except Exception as e:
+        st.warning(f"Could not fetch candles: {e}")
 
-        # Get current price
-        prices = {}
-        try:
-            price_response = backend_api_client.market_data.get_prices(
-                connector_name=connector, trading_pairs=[trading_pair]
-            )
-            # Handle both response formats
-            if isinstance(price_response, dict):
-                if (
-                    "status" in price_response
-                    and price_response.get("status") == "success"
-                ):
-                    prices = price_response.get("data", {})
-                elif "prices" in price_response:
-                    # Response has a "prices" field containing the actual price data
-                    prices = price_response.get("prices", {})
-                else:
-                    # Direct dict response with prices
-                    prices = price_response
-            elif isinstance(price_response, list):
-                # If it's a list, try to convert to dict
-                prices = {
-                    item.get("trading_pair", "unknown"): item.get("price", 0)
-                    for item in price_response
-                    if isinstance(item, dict)
-                }
-        except Exception as e:
-            st.warning(f"Could not fetch prices: {e}")
+    # Calculate fetch time for performance monitoring
+    fetch_time = (time.time() - start_time) * 1000
+    st.session_state["last_fetch_time"] = fetch_time
+    st.session_state["last_fetch_timestamp"] = time.time()
+    return candles
 
-        # Calculate fetch time for performance monitoring
-        fetch_time = (time.time() - start_time) * 1000
-        st.session_state["last_fetch_time"] = fetch_time
-        st.session_state["last_fetch_timestamp"] = time.time()
 
-        return candles, prices
+def get_prices(connector, trading_pair):
+    """Get the current price of the trading pair."""
+    if market_stream is not None:
+        price = market_stream.price(connector, trading_pair)
+        if price is not None:
+            return {trading_pair: price}
+    try:
+        price_response = backend_api_client.market_data.get_prices(
+            connector_name=connector, trading_pairs=[trading_pair]
+        )
+        # Handle both response formats
+        if isinstance(price_response, dict):
+            if "status" in price_response and price_response.get("status") == "success":
+                return price_response.get("data", {})
+            elif "prices" in price_response:
+                # Response has a "prices" field containing the actual price data
+                return price_response.get("prices", {})
+            # Direct dict response with prices
+            return price_response
+        elif isinstance(price_response, list):
+            # If it's a list, try to convert to dict
+            return {
+                item.get("trading_pair", "unknown"): item.get("price", 0)
+                for item in price_response
+                if isinstance(item, dict)
+            }
+        return {}
     except Exception as e:
-        st.error(f"Failed to fetch market data: {e}")
-        return [], {}
+        st.warning(f"Could not fetch prices: {e}")
+        return {}
+
+
+def session_cached(name, key, fetch, max_age=None):
+    """Return ``fetch()`` kept in session state under ``name`` until ``key`` changes or it is ``max_age`` seconds old.
+
+    Lets a fast-refreshing panel reuse data that changes at a slower rate.
+    """
+    cached = st.session_state.get(name)
+    now = time.time()
+    if (
+        cached is None
+        or cached["key"] != key
+        or (max_age is not None and now - cached["fetched_at"] >= max_age)
+    ):
+        cached = {"key": key, "fetched_at": now, "value": fetch()}
+        st.session_state[name] = cached
+    return cached["value"]
+
+
+def get_shared_order_book(connector, trading_pair):
+    """The ``ORDER_BOOK_DEPTH`` book, fetched once per market refresh and shared by every panel that reads it."""
+    return session_cached(
+        "order_book",
+        (connector, trading_pair),
+        lambda: get_order_book(connector, trading_pair, depth=ORDER_BOOK_DEPTH),
+        max_age=MARKET_REFRESH_INTERVAL / 2,
+    )
 
 
 def place_order(order_data):
@@ -306,25 +377,34 @@ def place_order(order_data):
         return False
 
 
-def cancel_order(account_name, connector_name, order_id):
-    """Cancel an order."""
-    try:
-        response = backend_api_client.trading.cancel_order(
-            account_name=account_name,
-            connector_name=connector_name,
-            client_order_id=order_id,
-        )
-        if response.get("status") == "success":
-            st.success(f"Order {order_id} cancelled successfully!")
-            return True
-        else:
-            st.error(
-                f"Failed to cancel order: {response.get('message', 'Unknown error')}"
-            )
-            return False
-    except Exception as e:
-        st.error(f"Failed to cancel order: {e}")
-        return False
+def cancel_orders(orders):
+    """Cancel orders concurrently and keep the per-order results to show after the refresh."""
+    results = bulk_cancel(
+        lambda order: backend_api_client.trading.cancel_order(
+            account_name=order.get("account_name", ""),
+            connector_name=order.get("connector_name", ""),
+            client_order_id=order.get("client_order_id", ""),
+        ),
+        orders,
+        max_concurrency=BULK_CANCEL_MAX_CONCURRENCY,
+        rate_limit=BULK_CANCEL_RATE_LIMIT,
+        timeout=BACKEND_API_FANOUT_TIMEOUT,
+    )
+    st.session_state["cancel_results"] = results
+    return results
+
+
+def render_cancel_results():
+    """Summary of the last bulk cancel, shown once after the refresh it triggered."""
+    results = st.session_state.pop("cancel_results", None)
+    if not results:
+        return
+    failed = [r for r in results if r["status"] != "cancelled"]
+    if failed:
+        st.error(f"Cancelled {len(results) - len(failed)} of {len(results)} orders; {len(failed)} failed")
+    else:
+        st.success(f"Cancelled {len(results)} orders")
+    st.dataframe(pd.DataFrame(results), hide_index=True, use_container_width=True)
 
 
 def get_default_layout(title=None, height=800, width=1100):
@@ -345,10 +425,55 @@ def get_default_layout(title=None, height=800, width=1100):
     return layout
 
 
+def add_indicator_traces(fig, x, indicators):
+    """Overlay the indicator columns on the price subplot; ATR goes on the volume subplot's right axis."""
+    band_line = dict(width=1, color="rgba(120, 160, 255, 0.6)")
+    for column in indicators.columns.drop("timestamp", errors="ignore"):
+        # Columns are named <kind>_<period>, except vwap
+        kind, _, period = column.rpartition("_")
+        kind = kind or column
+        if kind == "atr":
+            fig.add_trace(
+                go.Scatter(x=x, y=indicators[column], name=f"ATR {period}", line=dict(width=1.5)),
+                row=2,
+                col=1,
+                secondary_y=True,
+            )
+        elif kind == "bb_upper":
+            fig.add_trace(go.Scatter(x=x, y=indicators[column], name=f"BB Upper {period}", line=band_line), row=1, col=1)
+        elif kind == "bb_lower":
+            # Added after the upper band, so the fill shades the band between them
+            fig.add_trace(
+                go.Scatter(
+                    x=x,
+                    y=indicators[column],
+                    name=f"BB Lower {period}",
+                    line=band_line,
+                    fill="tonexty",
+                    fillcolor="rgba(120, 160, 255, 0.08)",
+                ),
+                row=1,
+                col=1,
+            )
+        elif kind == "bb_mid":
+            fig.add_trace(
+                go.Scatter(x=x, y=indicators[column], name=f"BB Mid {period}", line=dict(width=1, dash="dot")),
+                row=1,
+                col=1,
+            )
+        else:
+            name = "VWAP" if kind == "vwap" else f"{kind.upper()} {period}"
+            line = dict(width=1.5, dash="dash") if kind == "vwap" else dict(width=1.5)
+            fig.add_trace(go.Scatter(x=x, y=indicators[column], name=name, line=line), row=1, col=1)
+
+
 def create_candlestick_chart(
-    candles_data, connector_name="", trading_pair="", interval="", trades_data=None
+    candles_data, connector_name="", trading_pair="", interval="", trades_data=None, indicators=None
 ):
-    """Create a candlestick chart with custom theme, trade markers, and volume bars."""
+    """Create a candlestick chart with custom theme, trade markers, indicator overlays and volume bars.
+
+    ``indicators`` is a DataFrame of indicator columns aligned row for row with ``candles_data``.
+    """
     if not candles_data:
         fig = go.Figure()
         fig.add_annotation(
@@ -386,6 +511,8 @@ def create_candlestick_chart(
             vertical_spacing=0.01,
             row_heights=[0.8, 0.2],
             subplot_titles=(None, None),  # No subplot titles
+            # Right-hand axis on the volume subplot for ATR
+            specs=[[{}], [{"secondary_y": True}]],
         )
 
         # Add candlestick trace to first subplot
@@ -402,6 +529,9 @@ def create_candlestick_chart(
             col=1,
         )
 
+        if indicators is not None and len(indicators) == len(df):
+            add_indicator_traces(fig, df["datetime"] if "datetime" in df.columns else df.index, indicators)
+
         # Add volume bars to second subplot if volume data exists
         if "quote_volume" in df.columns and df["quote_volume"].sum() > 0:
             # Color volume bars based on price movement (green for up, red for down)
@@ -550,6 +680,7 @@ def create_candlestick_chart(
                     "gridcolor": "rgba(255,255,255,0.1)",
                     "color": "white",
                 },
+                "yaxis3": {"showgrid": False, "color": "white"},
             }
         )
 
@@ -572,9 +703,12 @@ def create_candlestick_chart(
 
 
 def create_order_book_chart(
-    order_book_data, current_price=None, depth_percentage=1.0, trading_pair=""
+    order_book_data, current_price=None, depth_percentage=1.0, trading_pair="", tick=None
 ):
-    """Create an order book histogram with price on Y-axis and volume on X-axis."""
+    """Create an order book histogram with price on Y-axis and volume on X-axis.
+
+    Levels are grouped into ``tick``-wide price buckets when a tick is given.
+    """
     if (
         not order_book_data
         or not order_book_data.get("bids")
@@ -613,72 +747,45 @@ def create_order_book_chart(
             )
             return fig, None, None
 
-        # Process bids and asks - they're already objects with price/amount keys
-        bids_df = pd.DataFrame(bids)
-        asks_df = pd.DataFrame(asks)
-
-        # Convert to float
-        bids_df["price"] = bids_df["price"].astype(float)
-        bids_df["amount"] = bids_df["amount"].astype(float)
-        asks_df["price"] = asks_df["price"].astype(float)
-        asks_df["amount"] = asks_df["amount"].astype(float)
-
-        # Convert amounts to quote asset (USDT) for better normalization
-        bids_df["quote_volume"] = bids_df["price"] * bids_df["amount"]
-        asks_df["quote_volume"] = asks_df["price"] * asks_df["amount"]
-
-        # Sort bids descending (highest price first) and asks ascending (lowest price first)
-        bids_df = bids_df.sort_values("price", ascending=False)
-        asks_df = asks_df.sort_values("price", ascending=True)
-
-        # Calculate cumulative volumes for better visualization
-        bids_df["cumulative_volume"] = bids_df["quote_volume"].cumsum()
-        asks_df["cumulative_volume"] = asks_df["quote_volume"].cumsum()
-
-        # Filter by depth percentage if current price is available
+        # Hold the book as NumPy arrays and group levels into price buckets
+        book = OrderBook.from_snapshot(order_book_data)
         if current_price:
-            price_range = current_price * (depth_percentage / 100)
-            min_price = current_price - price_range
-            max_price = current_price + price_range
-
-            bids_df = bids_df[bids_df["price"] >= min_price]
-            asks_df = asks_df[asks_df["price"] <= max_price]
+            # Only the levels within the depth percentage are plotted
+            bids_side, asks_side = book.depth_within(depth_percentage, current_price, tick)
+        else:
+            bids_side, asks_side = book.side(BIDS, tick), book.side(ASKS, tick)
 
         # Create order book chart
         fig = go.Figure()
 
         # Add bid bars (green, all positive values) - using cumulative volume
-        if not bids_df.empty:
+        if len(bids_side):
             fig.add_trace(
                 go.Bar(
-                    x=bids_df["cumulative_volume"],  # Using cumulative volume
-                    y=bids_df["price"],
+                    x=bids_side.cumulative_quote,  # Using cumulative volume
+                    y=bids_side.prices,
                     orientation="h",
                     name="Bids",
                     marker=dict(opacity=0.8),
                     hovertemplate="<b>BID</b><br>Price: $%{y:.4f}<br>Cumulative Volume: $%{x:,.0f}<br>Level "
                                   "Volume: $%{customdata:,.0f}<extra></extra>",
-                    customdata=bids_df[
-                        "quote_volume"
-                    ],  # Show individual level volume in hover
+                    customdata=bids_side.quote,  # Show individual level volume in hover
                     offsetgroup="bids",
                 )
             )
 
         # Add ask bars (red, all positive values) - using cumulative volume
-        if not asks_df.empty:
+        if len(asks_side):
             fig.add_trace(
                 go.Bar(
-                    x=asks_df["cumulative_volume"],  # Using cumulative volume
-                    y=asks_df["price"],
+                    x=asks_side.cumulative_quote,  # Using cumulative volume
+                    y=asks_side.prices,
                     orientation="h",
                     name="Asks",
                     marker=dict(opacity=0.8),
                     hovertemplate="<b>ASK</b><br>Price: $%{y:.4f}<br>Cumulative Volume: $%{x:,.0f}<br>Level "
                                   "Volume: $%{customdata:,.0f}<extra></extra>",
-                    customdata=asks_df[
-                        "quote_volume"
-                    ],  # Show individual level volume in hover
+                    customdata=asks_side.quote,  # Show individual level volume in hover
                     offsetgroup="asks",
                 )
             )
@@ -716,13 +823,13 @@ def create_order_book_chart(
         price_min = None
         price_max = None
 
-        if not bids_df.empty and not asks_df.empty:
-            price_min = min(bids_df["price"].min(), asks_df["price"].min())
-            price_max = max(bids_df["price"].max(), asks_df["price"].max())
-        elif not bids_df.empty:
-            price_min = price_max = bids_df["price"].min()
-        elif not asks_df.empty:
-            price_min = price_max = asks_df["price"].max()
+        if len(bids_side) and len(asks_side):
+            price_min = min(bids_side.prices.min(), asks_side.prices.min())
+            price_max = max(bids_side.prices.max(), asks_side.prices.max())
+        elif len(bids_side):
+            price_min = price_max = bids_side.prices.min()
+        elif len(asks_side):
+            price_min = price_max = asks_side.prices.max()
 
         return fig, price_min, price_max
     except Exception as e:
@@ -742,88 +849,74 @@ def create_order_book_chart(
         return fig, None, None
 
 
-def render_positions_table(positions_data):
-    """Render positions table with enhanced metrics and hedging information."""
-    if not positions_data:
-        st.info("No open positions found.")
-        return
-
-    # Convert to DataFrame for better display
-    df = pd.DataFrame(positions_data)
-    if df.empty:
+def render_positions_table(positions_df):
+    """Render positions table with portfolio risk metrics and exposure netted per asset."""
+    if positions_df.empty:
         st.info("No open positions found.")
         return
 
-    # Calculate original value (amount * entry_price)
-    if "amount" in df.columns and "entry_price" in df.columns:
-        df["original_value"] = df["amount"] * df["entry_price"]
-
     st.subheader("Open Positions")
 
+    shock_pct = st.number_input(
+        "Shock ±%",
+        min_value=0.5,
+        max_value=50.0,
+        value=5.0,
+        step=0.5,
+        key="position_shock_pct",
+        help="Price move used for the PnL sensitivity columns",
+    )
+    # Recomputed only when the positions store changed or the shock did
+    risk = session_cached(
+        "position_risk",
+        (st.session_state.positions_store.version, shock_pct),
+        lambda: PositionRisk(positions_df, shock_pct=shock_pct),
+    )
+    summary = risk.summary
+
     # Calculate and display summary metrics
     col1, col2, col3, col4 = st.columns(4)
-
     with col1:
-        total_unrealized_pnl = (
-            df["unrealized_pnl"].sum() if "unrealized_pnl" in df.columns else 0
-        )
+        st.metric("Total Unrealized PnL", f"${summary['unrealized_pnl']:,.2f}")
         st.metric(
-            "Total Unrealized PnL",
-            f"${total_unrealized_pnl:,.2f}",
-            delta=None,
-            delta_color="normal" if total_unrealized_pnl >= 0 else "inverse",
+            "Net Exposure",
+            f"${summary['net_notional']:,.2f}",
+            help="Long minus short notional at mark price, across all accounts and connectors",
         )
-
     with col2:
-        total_original_value = (
-            abs(df["original_value"]).sum() if "original_value" in df.columns else 0
-        )
-        st.metric("Total Position Amount", f"${abs(total_original_value):,.2f}")
-
-    # Separate long and short positions for hedging analysis
-    long_positions = df[df["amount"] > 0] if "amount" in df.columns else pd.DataFrame()
-    short_positions = df[df["amount"] < 0] if "amount" in df.columns else pd.DataFrame()
-
+        st.metric("Total Position Amount", f"${summary['original_value']:,.2f}")
+        st.metric("Margin Used", f"${summary['margin']:,.2f}", help="Notional / leverage")
     with col3:
-        long_value = (
-            long_positions["original_value"].sum()
-            if not long_positions.empty and "original_value" in long_positions.columns
-            else 0
-        )
+        st.metric("Long Exposure", f"${summary['long_notional']:,.2f}", help="Notional of long positions")
         st.metric(
-            "Long Exposure",
-            f"${abs(long_value):,.2f}",
-            help="Total value of long positions",
+            f"PnL if all +{shock_pct:g}%",
+            f"${summary['pnl_shock']:,.2f}",
+            help=f"Worst case, each asset moving {shock_pct:g}% against its net exposure: ${summary['worst_shock']:,.2f}",
         )
-
     with col4:
-        short_value = (
-            short_positions["original_value"].sum()
-            if not short_positions.empty and "original_value" in short_positions.columns
-            else 0
-        )
+        st.metric("Short Exposure", f"${summary['short_notional']:,.2f}", help="Notional of short positions")
+        closest = summary["min_liquidation_distance_pct"]
         st.metric(
-            "Short Exposure",
-            f"${abs(short_value):,.2f}",
-            help="Total value of short positions",
+            "Closest Liquidation",
+            f"{closest:.2f}%" if closest is not None else "N/A",
+            help="Smallest adverse move that liquidates a position; estimated from leverage when not reported",
         )
 
-    # Calculate hedge ratio if we have both long and short positions
-    if long_value != 0 and short_value != 0:
-        hedge_ratio = (
-            min(abs(short_value), abs(long_value))
-            / max(abs(short_value), abs(long_value))
-            * 100
-        )
-        st.info(f"Hedge Ratio: {hedge_ratio:.1f}% (Higher = More Hedged)")
-    elif long_value > 0 and short_value == 0:
+    if summary["hedge_ratio"] is not None:
+        st.info(f"Hedge Ratio: {summary['hedge_ratio'] * 100:.1f}% (Higher = More Hedged)")
+    elif summary["long_notional"] > 0:
         st.warning("Portfolio is fully LONG - No short hedging")
-    elif short_value > 0 and long_value == 0:
+    elif summary["short_notional"] > 0:
         st.warning("Portfolio is fully SHORT - No long hedging")
+    if summary["hhi"] is not None:
+        st.caption(
+            f"Concentration: {summary['top_asset']} is {summary['top_share'] * 100:.1f}% of gross exposure · "
+            f"HHI {summary['hhi']:.2f} (~{summary['effective_assets']:.1f} equally weighted assets)"
+        )
 
     # Display positions table with enhanced formatting
     st.dataframe(
-        df,
+        paginate_frame(risk.positions, "positions_table"),
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -838,88 +931,48 @@ def render_positions_table(positions_data):
             "unrealized_pnl": st.column_config.NumberColumn(
                 "Unrealized PnL", format="$%.2f"
             ),
+            "notional": st.column_config.NumberColumn("Notional", format="$%.2f"),
+            "margin": st.column_config.NumberColumn("Margin", format="$%.2f"),
+            "liquidation_price": st.column_config.NumberColumn("Liq. Price", format="$%.4f"),
+            "liquidation_distance_pct": st.column_config.NumberColumn("Liq. Distance", format="%.2f%%"),
+            "pnl_shock": st.column_config.NumberColumn(f"PnL +{shock_pct:g}%", format="$%.2f"),
         },
     )
 
-    # Show separate long/short breakdown if there are both types
-    if not long_positions.empty and not short_positions.empty:
-        st.divider()
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            st.subheader("🟢 Long Positions")
-            if not long_positions.empty:
-                long_pnl = (
-                    long_positions["unrealized_pnl"].sum()
-                    if "unrealized_pnl" in long_positions.columns
-                    else 0
-                )
-                st.caption(f"PnL: ${long_pnl:,.2f}")
-                st.dataframe(
-                    long_positions,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "amount": st.column_config.NumberColumn(
-                            "Amount", format="%.6f"
-                        ),
-                        "entry_price": st.column_config.NumberColumn(
-                            "Entry Price", format="$%.4f"
-                        ),
-                        "unrealized_pnl": st.column_config.NumberColumn(
-                            "PnL", format="$%.2f"
-                        ),
-                    },
-                )
-
-        with col2:
-            st.subheader("Short Positions")
-            if not short_positions.empty:
-                short_pnl = (
-                    short_positions["unrealized_pnl"].sum()
-                    if "unrealized_pnl" in short_positions.columns
-                    else 0
-                )
-                st.caption(f"PnL: ${short_pnl:,.2f}")
-                st.dataframe(
-                    short_positions,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "amount": st.column_config.NumberColumn(
-                            "Amount", format="%.6f"
-                        ),
-                        "entry_price": st.column_config.NumberColumn(
-                            "Entry Price", format="$%.4f"
-                        ),
-                        "unrealized_pnl": st.column_config.NumberColumn(
-                            "PnL", format="$%.2f"
-                        ),
-                    },
-                )
-    elif not long_positions.empty:
-        st.info("All positions are LONG")
-    elif not short_positions.empty:
-        st.info("All positions are SHORT")
+    st.subheader("Exposure by Asset")
+    st.dataframe(
+        risk.assets.assign(share=risk.assets["share"] * 100),
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "base_asset": st.column_config.TextColumn("Asset"),
+            "net_amount": st.column_config.NumberColumn("Net Amount", format="%.6f"),
+            "long_notional": st.column_config.NumberColumn("Long", format="$%.2f"),
+            "short_notional": st.column_config.NumberColumn("Short", format="$%.2f"),
+            "net_notional": st.column_config.NumberColumn("Net", format="$%.2f"),
+            "gross_notional": st.column_config.NumberColumn("Gross", format="$%.2f"),
+            "share": st.column_config.ProgressColumn("Share", format="%.1f%%", min_value=0.0, max_value=100.0),
+            "avg_leverage": st.column_config.NumberColumn("Avg Leverage", format="%.1fx"),
+            "margin": st.column_config.NumberColumn("Margin", format="$%.2f"),
+            "unrealized_pnl": st.column_config.NumberColumn("PnL", format="$%.2f"),
+            "pnl_shock": st.column_config.NumberColumn(f"PnL +{shock_pct:g}%", format="$%.2f"),
+            "min_liquidation_distance_pct": st.column_config.NumberColumn("Closest Liq.", format="%.2f%%"),
+            "positions": st.column_config.NumberColumn("Positions"),
+        },
+    )
 
 
-def render_orders_table(orders_data):
+def render_orders_table(orders_df):
     """Render active orders table."""
-    if not orders_data:
-        st.info("No active orders found.")
-        return
-
-    # Convert to DataFrame
-    df = pd.DataFrame(orders_data)
-    if df.empty:
+    render_cancel_results()
+    if orders_df.empty:
         st.info("No active orders found.")
         return
 
     st.subheader("Active Orders")
 
-    # Add cancel column to dataframe
-    df_with_cancel = df.copy()
+    # Only the selected page is sent to the browser; add the cancel column to it
+    df_with_cancel = paginate_frame(orders_df, "orders_table").copy()
     df_with_cancel["cancel"] = False
 
     # Create column configurations based on what's available in the data
@@ -952,21 +1005,251 @@ def render_orders_table(orders_data):
         key="orders_editor",
     )
 
-    # Handle order cancellation
-    if "cancel" in edited_df.columns:
-        selected_orders = edited_df[edited_df["cancel"]]
-        if not selected_orders.empty and st.button(
-            f"Cancel Selected ({len(selected_orders)}) Orders", type="secondary"
-        ):
-            with st.spinner("Cancelling orders..."):
-                for _, order in selected_orders.iterrows():
-                    cancel_order(
-                        order.get("account_name", ""),
-                        order.get("connector_name", ""),
-                        order.get("client_order_id", ""),
-                    )
+    # Handle order cancellation; cancels run concurrently and the orders refresh once at the end
+    to_cancel = []
+    selected_col, market_col = st.columns(2)
+    with selected_col:
+        if "cancel" in edited_df.columns:
+            selected_orders = edited_df[edited_df["cancel"]]
+            if not selected_orders.empty and st.button(
+                f"Cancel Selected ({len(selected_orders)}) Orders", type="secondary"
+            ):
+                to_cancel = selected_orders.drop(columns="cancel").to_dict("records")
+    with market_col:
+        connector = st.session_state.selected_market["connector"]
+        trading_pair = st.session_state.selected_market["trading_pair"]
+        market_orders = []
+        if {"connector_name", "trading_pair"}.issubset(orders_df.columns):
+            market_orders = orders_df[
+                (orders_df["connector_name"] == connector)
+                & (orders_df["trading_pair"] == trading_pair)
+            ].to_dict("records")
+        if market_orders:
+            with st.popover(f"Cancel All {trading_pair} ({len(market_orders)})"):
+                st.write(f"Cancel all {len(market_orders)} {trading_pair} orders on {connector}?")
+                if st.button("Confirm", type="primary", key="cancel_all_market_orders"):
+                    to_cancel = market_orders
+    if to_cancel:
+        with st.spinner(f"Cancelling {len(to_cancel)} orders..."):
+            cancel_orders(to_cancel)
+        # Only the account panel shows orders
+        st.rerun(scope="fragment")
+
+
+@st.fragment(run_every=refresh_every(MARKET_REFRESH_INTERVAL))
+def market_overview_panel():
+    """Price, depth and funding metrics with the refresh controls."""
+    connector = st.session_state.selected_market["connector"]
+    trading_pair = st.session_state.selected_market["trading_pair"]
+
+    # Create sub-columns for organized display
+    price_col, depth_col, funding_col, controls_col = st.columns([1, 1, 1, 1])
+
+    with price_col:
+        # Get order book data for bid/ask prices and volumes
+        order_book = get_shared_order_book(connector, trading_pair)
+
+        if order_book and "bids" in order_book and "asks" in order_book:
+            bid_price = (
+                float(order_book["bids"][0]["price"]) if order_book["bids"] else 0
+            )
+            ask_price = (
+                float(order_book["asks"][0]["price"]) if order_book["asks"] else 0
+            )
+            mid_price = (
+                (bid_price + ask_price) / 2 if bid_price > 0 and ask_price > 0 else 0
+            )
+
+            st.metric(f"{trading_pair}", f"${mid_price:.4f}")
+            st.metric("Bid Price", f"${bid_price:.4f}")
+            st.metric("Ask Price", f"${ask_price:.4f}")
+        else:
+            # Fallback to current price if no order book
+            prices = get_prices(connector, trading_pair)
+            if prices and trading_pair in prices:
+                current_price = prices[trading_pair]
+                st.metric(f"{trading_pair}", f"${float(current_price):,.4f}")
+            else:
+                st.metric(f"{trading_pair}", "Loading...")
+    with depth_col:
+        # Order book depth configuration
+        depth_percentage = st.number_input(
+            "Depth ±%",
+            min_value=0.1,
+            max_value=10.0,
+            value=1.0,
+            step=0.1,
+            format="%.1f",
+            key="depth_percentage",
+        )
+
+        # Calculate depth from the fetched order book
+        if order_book and "bids" in order_book and "asks" in order_book:
+            bid_price = (
+                float(order_book["bids"][0]["price"]) if order_book["bids"] else 0
+            )
+            ask_price = (
+                float(order_book["asks"][0]["price"]) if order_book["asks"] else 0
+            )
+
+            if bid_price > 0 and ask_price > 0:
+                # Calculate prices at depth percentage
+                depth_factor = depth_percentage / 100
+                buy_price = bid_price * (
+                    1 - depth_factor
+                )  # Price below current bid
+                sell_price = ask_price * (
+                    1 + depth_factor
+                )  # Price above current ask
+
+                # Walk the fetched book locally instead of two quote-volume requests per refresh
+                book = OrderBook.from_snapshot(order_book)
+                buy_vol = book.quote_volume_for_price(sell_price, is_buy=True)
+                sell_vol = book.quote_volume_for_price(buy_price, is_buy=False)
+
+                st.metric(
+                    "Buy Depth (USDT)",
+                    f"${buy_vol:,.0f}" if buy_vol != 0 else "N/A",
+                    help="Volume available when buying (hitting asks)",
+                )
+                st.metric(
+                    "Sell Depth (USDT)",
+                    f"${sell_vol:,.0f}" if sell_vol != 0 else "N/A",
+                    help="Volume available when selling (hitting bids)",
+                )
+            else:
+                st.metric(f"Depth ±{depth_percentage:.1f}%", "No data")
+        else:
+            st.metric(f"Depth ±{depth_percentage:.1f}%", "No order book")
+
+    with funding_col:
+        # Funding rate for perpetual contracts
+        if "perpetual" in connector.lower():
+            # Funding moves far slower than the book, so reuse it across this panel's reruns
+            funding_data = session_cached(
+                "funding_info",
+                (connector, trading_pair),
+                lambda: get_funding_rate(connector, trading_pair),
+                max_age=FUNDING_REFRESH_INTERVAL,
+            )
+            if funding_data and "funding_rate" in funding_data:
+                funding_rate = float(funding_data["funding_rate"]) * 100
+                st.metric("Funding Rate", f"{funding_rate:.4f}%")
+            else:
+                st.metric("Funding Rate", "N/A")
+        else:
+            st.metric("Funding Rate", "Spot")
+
+    with controls_col:
+        # Show fetch time and refresh button together
+        if "last_fetch_time" in st.session_state:
+            fetch_time = st.session_state["last_fetch_time"]
+            st.caption(f"Fetch: {fetch_time:.0f}ms")
+
+        # Auto-refresh toggle; the panels pick up the new interval on the next full run
+        auto_refresh = st.toggle(
+            "Auto-refresh",
+            value=st.session_state.auto_refresh_enabled,
+            help=(
+                f"Refresh prices and order book every {MARKET_REFRESH_INTERVAL}s, candles every "
+                f"{CANDLES_REFRESH_INTERVAL}s and account data every {ACCOUNT_REFRESH_INTERVAL}s"
+            ),
+        )
+        if auto_refresh != st.session_state.auto_refresh_enabled:
+            st.session_state.auto_refresh_enabled = auto_refresh
             st.rerun()
 
+        # Refresh button
+        if st.button("Refresh Now", use_container_width=True, type="primary"):
+            st.session_state.pop("funding_info", None)
+            st.rerun()
+
+
+def add_watchlist_pairs(connector):
+    """Add the pairs typed in the watchlist input for ``connector`` and clear the input."""
+    pairs = [pair.strip().upper() for pair in st.session_state.watchlist_add.split(",") if pair.strip()]
+    markets = st.session_state.watchlist
+    st.session_state.watchlist = markets + [
+        (connector, pair) for pair in dict.fromkeys(pairs) if (connector, pair) not in markets
+    ]
+    st.session_state.watchlist_add = ""
+
+
+def open_watchlist_market(markets, account_connectors):
+    """Switch the page to the market selected in the watchlist table."""
+    rows = st.session_state.watchlist_table.selection.rows
+    if not rows:
+        return
+    connector, trading_pair = markets[rows[0]]
+    if connector in account_connectors:
+        st.session_state.connector_selector = connector
+    st.session_state.trading_pair_input = trading_pair
+    # Callbacks can't rerun the page, so the panel does it
+    st.session_state.watchlist_switch_market = True
+
+
+@st.fragment(run_every=refresh_every(WATCHLIST_REFRESH_INTERVAL))
+def watchlist_panel(account_connectors):
+    """Price, 1h/24h change and 24h sparkline of every watched market; selecting a row opens it."""
+    if st.session_state.pop("watchlist_switch_market", False):
+        st.rerun()
+
+    connector = st.session_state.selected_market["connector"]
+    if "watchlist" not in st.session_state:
+        st.session_state.watchlist = [(connector, pair) for pair in WATCHLIST_DEFAULT_PAIRS]
+
+    st.subheader("Watchlist")
+    markets_col, add_col = st.columns([3, 1])
+    with add_col:
+        st.text_input(
+            "Add pairs",
+            key="watchlist_add",
+            placeholder="ETH-USDT, SOL-USDT",
+            help=f"Comma-separated pairs to watch on {connector}",
+            on_change=add_watchlist_pairs,
+            args=(connector,),
+        )
+    with markets_col:
+        # The widget state is the watchlist itself, so removing a market here drops it
+        markets = st.multiselect(
+            "Watching",
+            st.session_state.watchlist,
+            key="watchlist",
+            format_func=lambda market: f"{market[1]} ({market[0]})",
+        )
+
+    if not markets:
+        st.info("Add trading pairs to watch their prices")
+        return
+
+    # One get_prices request per connector for all of its pairs, skipped if polled within the interval
+    watchlist.refresh(markets)
+    rows = watchlist.snapshot(markets)
+    watchlist_df = pd.DataFrame(rows)
+    for column in ("change_1h", "change_24h"):
+        watchlist_df[column] = pd.to_numeric(watchlist_df[column]) * 100
+    st.dataframe(
+        watchlist_df[["trading_pair", "connector", "price", "change_1h", "change_24h", "sparkline"]],
+        key="watchlist_table",
+        on_select=lambda: open_watchlist_market(markets, account_connectors),
+        selection_mode="single-row",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            "trading_pair": st.column_config.TextColumn("Pair"),
+            "connector": st.column_config.TextColumn("Exchange"),
+            "price": st.column_config.NumberColumn("Price", format="%.6g"),
+            "change_1h": st.column_config.NumberColumn("1h %", format="%+.2f%%"),
+            "change_24h": st.column_config.NumberColumn("24h %", format="%+.2f%%"),
+            "sparkline": st.column_config.LineChartColumn("24h"),
+        },
+    )
+    connectors = {market[0] for market in markets}
+    st.caption(
+        f"{len(markets)} markets polled with {len(connectors)} request{'s' if len(connectors) != 1 else ''} "
+        f"every {WATCHLIST_REFRESH_INTERVAL:g}s. Select a row to open its market."
+    )
+
 
 # Page Header
 st.title("Trading Hub")
@@ -979,6 +1262,7 @@ candles_connectors = get_candles_connectors()
 # Account and Trading Selection Section - Reorganized
 selection_col, market_data_col = st.columns([1, 3])
 
+account_connectors = []
 with selection_col:
     st.subheader("Account & Market")
 
@@ -1030,6 +1314,7 @@ with selection_col:
                 key="connector_selector",
             )
             st.session_state.selected_connector = connector
+            account_connectors = [cred["connector_name"] for cred in credentials]
         else:
             st.error("No credentials found for this account")
             connector = None
@@ -1037,9 +1322,8 @@ with selection_col:
         st.error("No credentials available")
         connector = None
 
-    trading_pair = st.text_input(
-        "Trading Pair", value="BTC-USDT", key="trading_pair_input"
-    )
+    # Default set in session state, so the watchlist can switch the market through it
+    trading_pair = st.text_input("Trading Pair", key="trading_pair_input")
 
     # Update selected market
     if connector and trading_pair:
@@ -1055,471 +1339,331 @@ with market_data_col:
     if st.session_state.selected_market.get(
         "connector"
     ) and st.session_state.selected_market.get("trading_pair"):
-        # Get market data for metrics
-        connector = st.session_state.selected_market["connector"]
-        trading_pair = st.session_state.selected_market["trading_pair"]
-        interval = st.session_state.chart_interval
-        max_candles = st.session_state.max_candles
-        candles_connector = st.session_state.candles_connector
-
-        # Create sub-columns for organized display
-        price_col, depth_col, funding_col, controls_col = st.columns([1, 1, 1, 1])
-
-        with price_col:
-            candles, prices = get_market_data(
-                connector, trading_pair, interval, max_candles, candles_connector
-            )
-
-            # Get order book data for bid/ask prices and volumes
-            order_book = get_order_book(connector, trading_pair, depth=1000)
-
-            if order_book and "bids" in order_book and "asks" in order_book:
-                bid_price = (
-                    float(order_book["bids"][0]["price"]) if order_book["bids"] else 0
-                )
-                ask_price = (
-                    float(order_book["asks"][0]["price"]) if order_book["asks"] else 0
-                )
-                mid_price = (
-                    (bid_price + ask_price) / 2
-                    if bid_price > 0 and ask_price > 0
-                    else 0
-                )
+        market_overview_panel()
+    else:
+        st.info("Select account and pair to view extended market data")
 
-                st.metric(f"{trading_pair}", f"${mid_price:.4f}")
-                st.metric("Bid Price", f"${bid_price:.4f}")
-                st.metric("Ask Price", f"${ask_price:.4f}")
-            else:
-                # Fallback to current price if no order book
-                if prices and trading_pair in prices:
-                    current_price = prices[trading_pair]
-                    st.metric(f"{trading_pair}", f"${float(current_price):,.4f}")
-                else:
-                    st.metric(f"{trading_pair}", "Loading...")
-        with depth_col:
-            # Order book depth configuration
-            depth_percentage = st.number_input(
-                "Depth ±%",
-                min_value=0.1,
-                max_value=10.0,
-                value=1.0,
-                step=0.1,
-                format="%.1f",
-                key="depth_percentage",
-            )
+st.divider()
+watchlist_panel(account_connectors)
 
-            # Calculate depth using the actual API method
-            if order_book and "bids" in order_book and "asks" in order_book:
-                bid_price = (
-                    float(order_book["bids"][0]["price"]) if order_book["bids"] else 0
-                )
-                ask_price = (
-                    float(order_book["asks"][0]["price"]) if order_book["asks"] else 0
-                )
 
-                if bid_price > 0 and ask_price > 0:
-                    # Calculate prices at depth percentage
-                    depth_factor = depth_percentage / 100
-                    buy_price = bid_price * (
-                        1 - depth_factor
-                    )  # Price below current bid
-                    sell_price = ask_price * (
-                        1 + depth_factor
-                    )  # Price above current ask
-
-                    try:
-                        # Get buy depth (volume available when buying up to sell_price - hitting asks)
-                        buy_response = backend_api_client.market_data.get_quote_volume_for_price(
-                            connector_name=connector,
-                            trading_pair=trading_pair,
-                            price=sell_price,  # Use sell_price for buying (hitting asks above current price)
-                            is_buy=True,
-                        )
+@st.fragment(run_every=refresh_every(CANDLES_REFRESH_INTERVAL))
+def price_chart_panel():
+    """Candlestick chart with its controls and trade markers."""
+    connector = st.session_state.selected_market["connector"]
+    trading_pair = st.session_state.selected_market["trading_pair"]
 
-                        # Get sell depth (volume available when selling down to buy_price - hitting bids)
-                        sell_response = backend_api_client.market_data.get_quote_volume_for_price(
-                            connector_name=connector,
-                            trading_pair=trading_pair,
-                            price=buy_price,  # Use buy_price for selling (hitting bids below current price)
-                            is_buy=False,
-                        )
+    st.subheader("Price Chart")
 
-                        # Handle response format based on your example
-                        buy_vol = 0
-                        sell_vol = 0
-
-                        if (
-                            isinstance(buy_response, dict)
-                            and "result_quote_volume" in buy_response
-                        ):
-                            buy_vol = buy_response["result_quote_volume"]
-                            # Handle NaN values more robustly
-                            import math
-
-                            if (
-                                buy_vol is None
-                                or (isinstance(buy_vol, float) and math.isnan(buy_vol))
-                                or str(buy_vol).lower() == "nan"
-                            ):
-                                buy_vol = 0
-
-                        if (
-                            isinstance(sell_response, dict)
-                            and "result_quote_volume" in sell_response
-                        ):
-                            sell_vol = sell_response["result_quote_volume"]
-                            # Handle NaN values more robustly
-                            import math
-
-                            if (
-                                sell_vol is None
-                                or (
-                                    isinstance(sell_vol, float) and math.isnan(sell_vol)
-                                )
-                                or str(sell_vol).lower() == "nan"
-                            ):
-                                sell_vol = 0
-
-                        st.metric(
-                            "Buy Depth (USDT)",
-                            f"${float(buy_vol):,.0f}" if buy_vol != 0 else "N/A",
-                            help="Volume available when buying (hitting asks)",
-                        )
-                        st.metric(
-                            "Sell Depth (USDT)",
-                            f"${float(sell_vol):,.0f}" if sell_vol != 0 else "N/A",
-                            help="Volume available when selling (hitting bids)",
-                        )
-                    except Exception:
-                        # Fallback to simple calculation if API fails
-                        total_bid_volume = sum(
-                            float(bid["amount"] * bid["price"])
-                            for bid in order_book["bids"]
-                        )
-                        total_ask_volume = sum(
-                            float(ask["amount"] * ask["price"])
-                            for ask in order_book["asks"]
-                        )
+    # Chart controls live in the fragment, so changing them only rebuilds the chart
+    controls_col1, controls_col2, controls_col3 = st.columns([1, 1, 1])
 
-                        st.metric(
-                            "Buy Depth (USDT)",
-                            f"${total_ask_volume:,.0f}",
-                            help="Total ask volume (for buying)",
-                        )
-                        st.metric(
-                            "Sell Depth (USDT)",
-                            f"${total_bid_volume:,.0f}",
-                            help="Total bid volume (for selling)",
-                        )
-                else:
-                    st.metric(f"Depth ±{depth_percentage:.1f}%", "No data")
-            else:
-                st.metric(f"Depth ±{depth_percentage:.1f}%", "No order book")
-
-        with funding_col:
-            # Funding rate for perpetual contracts
-            if "perpetual" in connector.lower():
-                funding_data = get_funding_rate(connector, trading_pair)
-                if funding_data and "funding_rate" in funding_data:
-                    funding_rate = float(funding_data["funding_rate"]) * 100
-                    st.metric("Funding Rate", f"{funding_rate:.4f}%")
-                else:
-                    st.metric("Funding Rate", "N/A")
-            else:
-                st.metric("Funding Rate", "Spot")
-
-        with controls_col:
-            # Show fetch time and refresh button together
-            if "last_fetch_time" in st.session_state:
-                fetch_time = st.session_state["last_fetch_time"]
-                st.caption(f"Fetch: {fetch_time:.0f}ms")
-
-            # Auto-refresh toggle
-            auto_refresh = st.toggle(
-                "Auto-refresh",
-                value=st.session_state.auto_refresh_enabled,
-                help=f"Refresh data every {REFRESH_INTERVAL} seconds",
+    with controls_col1:
+        interval = st.selectbox(
+            "Chart Interval",
+            CHART_INTERVALS,
+            index=0,
+            key="chart_interval_selector",
+        )
+        st.session_state.chart_interval = interval
+
+    with controls_col2:
+        candles_connectors = get_candles_connectors()
+        if candles_connectors:
+            # Add option to use same connector as trading
+            candles_options = ["Same as trading"] + candles_connectors
+            selected_candles = st.selectbox(
+                "Candles Source",
+                candles_options,
+                index=0,
+                key="chart_candles_connector_selector",
+                help="Some exchanges don't provide candles. Select an alternative source.",
             )
-            st.session_state.auto_refresh_enabled = auto_refresh
-
-            # Refresh button
-            if st.button("Refresh Now", use_container_width=True, type="primary"):
-                st.session_state.last_refresh_time = time.time()
-                st.rerun()
-    else:
-        st.info("Select account and pair to view extended market data")
-
-
-# Main trading data display function
-def show_trading_data():
-    """Display trading data with chart controls."""
+            st.session_state.candles_connector = (
+                None if selected_candles == "Same as trading" else selected_candles
+            )
+        else:
+            st.session_state.candles_connector = None
+
+    with controls_col3:
+        max_candles = st.number_input(
+            "Max Candles",
+            min_value=50,
+            max_value=2000,
+            value=100,
+            step=50,
+            key="chart_max_candles_input",
+        )
+        st.session_state.max_candles = max_candles
 
-    connector = st.session_state.selected_market.get("connector")
-    trading_pair = st.session_state.selected_market.get("trading_pair")
+    indicator_names = st.multiselect(
+        "Indicators",
+        list(CHART_INDICATORS),
+        default=["EMA 20"],
+        key="chart_indicators",
+    )
 
-    if not connector or not trading_pair:
-        st.warning("Please select an account and trading pair")
-        return
+    candles_connector = st.session_state.candles_connector
+    # Streamed candles are read from memory; otherwise the shared candle store only fetches
+    # the candles opened since the last refresh, forming candle included
+    candles = get_candles(
+        connector, trading_pair, interval, max_candles, candles_connector
+    )
+    candles_source = candles_connector if candles_connector else connector
+
+    indicators = None
+    if indicator_names and candles:
+        # Kept per series and indicator choice: a refresh commits the newly closed candles and
+        # re-evaluates only the forming one
+        indicator_set = session_cached(
+            "chart_indicator_set",
+            (candles_source, trading_pair, interval, tuple(indicator_names)),
+            lambda: IndicatorSet([CHART_INDICATORS[name] for name in indicator_names]),
+        )
+        try:
+            indicators = indicator_set.sync(candles)
+        except Exception as e:
+            # A window the indicators can't align with still gets its candles drawn
+            st.warning(f"Could not compute indicators: {e}")
+
+    # Get trade history for the selected account/connector/pair
+    trades = []
+    if st.session_state.selected_account and st.session_state.selected_connector:
+        trades = get_trade_history(
+            st.session_state.selected_account,
+            st.session_state.selected_connector,
+            trading_pair,
+        )
 
-    # Chart and Trade Execution section
-    st.divider()
-    chart_col, orderbook_col, trade_col = st.columns([3, 1, 1])
+    # Add small gap before chart
+    st.write("")
 
-    # Get market data first (needed for both charts)
-    candles, prices = get_market_data(
-        connector,
-        trading_pair,
-        st.session_state.chart_interval,
-        st.session_state.max_candles,
-        st.session_state.candles_connector,
+    # Create candlestick chart
+    candlestick_fig = create_candlestick_chart(
+        candles, candles_source, trading_pair, interval, trades, indicators
     )
-
-    # Get order book data
-    order_book = get_order_book(connector, trading_pair, depth=20)
+    st.plotly_chart(candlestick_fig, use_container_width=True)
+    # Show last update time
+    current_time = datetime.datetime.now().strftime("%H:%M:%S")
+    st.caption(f"Last updated: {current_time}")
+
+
+@st.fragment(run_every=refresh_every(MARKET_REFRESH_INTERVAL))
+def order_book_panel():
+    """Order book histogram around the current price."""
+    connector = st.session_state.selected_market["connector"]
+    trading_pair = st.session_state.selected_market["trading_pair"]
+
+    st.subheader("Order Book")
+
+    tick = st.selectbox(
+        "Price Grouping",
+        TICK_GROUPS,
+        format_func=lambda t: "None" if t is None else f"{t:g}",
+        key="order_book_tick",
+        help="Sum the levels into price buckets of this size",
+    )
+    order_book = get_shared_order_book(connector, trading_pair)
 
     # Get current price and depth percentage
     current_price = 0.0
+    prices = get_prices(connector, trading_pair)
     if prices and trading_pair in prices:
         current_price = float(prices[trading_pair])
     depth_percentage = st.session_state.get("depth_percentage", 1.0)
 
-    with chart_col:
-        st.subheader("Price Chart")
-
-        # Chart controls in the same fragment
-        controls_col1, controls_col2, controls_col3 = st.columns([1, 1, 1])
-
-        with controls_col1:
-            interval = st.selectbox(
-                "Chart Interval",
-                ["1m", "3m", "5m", "15m", "1h", "4h", "1d"],
-                index=0,
-                key="chart_interval_selector",
-            )
-            st.session_state.chart_interval = interval
-
-        with controls_col2:
-            candles_connectors = get_candles_connectors()
-            if candles_connectors:
-                # Add option to use same connector as trading
-                candles_options = ["Same as trading"] + candles_connectors
-                selected_candles = st.selectbox(
-                    "Candles Source",
-                    candles_options,
-                    index=0,
-                    key="chart_candles_connector_selector",
-                    help="Some exchanges don't provide candles. Select an alternative source.",
-                )
-                st.session_state.candles_connector = (
-                    None if selected_candles == "Same as trading" else selected_candles
-                )
-            else:
-                st.session_state.candles_connector = None
-
-        with controls_col3:
-            max_candles = st.number_input(
-                "Max Candles",
-                min_value=50,
-                max_value=500,
-                value=100,
-                step=50,
-                key="chart_max_candles_input",
-            )
-            st.session_state.max_candles = max_candles
-
-        # Get trade history for the selected account/connector/pair
-        trades = []
-        if st.session_state.selected_account and st.session_state.selected_connector:
-            trades = get_trade_history(
-                st.session_state.selected_account,
-                st.session_state.selected_connector,
-                trading_pair,
+    orderbook_fig, price_min, price_max = create_order_book_chart(
+        order_book, current_price, depth_percentage, trading_pair, tick
+    )
+    st.plotly_chart(orderbook_fig, use_container_width=True)
+
+    if order_book and order_book.get("bids") and order_book.get("asks"):
+        imbalance = OrderBook.from_snapshot(order_book).imbalance(depth_percentage)
+        if imbalance is not None:
+            st.caption(
+                f"Imbalance ±{depth_percentage:.1f}%: {imbalance:+.2f} "
+                f"({'bids' if imbalance >= 0 else 'asks'} heavier)"
             )
 
-        # Add small gap before chart
-        st.write("")
 
-        # Create candlestick chart
-        candles_source = (
-            st.session_state.candles_connector
-            if st.session_state.candles_connector
-            else connector
-        )
-        candlestick_fig = create_candlestick_chart(
-            candles, candles_source, trading_pair, interval, trades
-        )
+@st.fragment
+def trade_form_panel():
+    """Order entry form; it has no timer, so the other panels' refreshes never reset it."""
+    connector = st.session_state.selected_market["connector"]
+    trading_pair = st.session_state.selected_market["trading_pair"]
 
-    with orderbook_col:
-        st.subheader("Order Book")
+    st.subheader("Execute Trade")
 
-        # Create and display order book chart
-        orderbook_fig, price_min, price_max = create_order_book_chart(
-            order_book, current_price, depth_percentage, trading_pair
-        )
+    if st.session_state.selected_account and st.session_state.selected_connector:
+        # Get current price for calculations
+        current_price = 0.0
+        prices = get_prices(connector, trading_pair)
+        if prices and trading_pair in prices:
+            current_price = float(prices[trading_pair])
 
-    # Display both charts
-    with chart_col:
-        st.plotly_chart(candlestick_fig, use_container_width=True)
-        # Show last update time
-        current_time = datetime.datetime.now().strftime("%H:%M:%S")
-        st.caption(f"Last updated: {current_time} (auto-refresh every 30s)")
+        # Extract base and quote tokens from trading pair
+        base_token, quote_token = trading_pair.split("-")
 
-    with orderbook_col:
-        st.plotly_chart(orderbook_fig, use_container_width=True)
-
-    with trade_col:
-        st.subheader("Execute Trade")
+        # Order type selection
+        order_type = st.selectbox(
+            "Order Type", ["market", "limit"], key="trade_order_type"
+        )
 
-        if st.session_state.selected_account and st.session_state.selected_connector:
-            # Get current price for calculations
-            current_price = 0.0
-            if prices and trading_pair in prices:
-                current_price = float(prices[trading_pair])
+        # Side selection
+        side = st.selectbox("Side", ["buy", "sell"], key="trade_side")
 
-            # Extract base and quote tokens from trading pair
-            base_token, quote_token = trading_pair.split("-")
+        # Position mode selection
+        position_action = st.selectbox(
+            "Position Mode",
+            ["OPEN", "CLOSE"],
+            index=0,  # Default to OPEN
+            key="trade_position_action",
+            help="OPEN creates new positions, CLOSE reduces existing positions",
+        )
 
-            # Order type selection
-            order_type = st.selectbox(
-                "Order Type", ["market", "limit"], key="trade_order_type"
-            )
+        # Amount input
+        amount = st.number_input(
+            "Amount", min_value=0.0, value=0.001, format="%.6f", key="trade_amount"
+        )
 
-            # Side selection
-            side = st.selectbox("Side", ["buy", "sell"], key="trade_side")
+        # Base/Quote toggle switch
+        is_quote = st.toggle(
+            f"Amount in {quote_token}",
+            value=False,
+            help=f"Toggle to enter amount in {quote_token} instead of {base_token}",
+            key="trade_is_quote",
+        )
 
-            # Position mode selection
-            position_action = st.selectbox(
-                "Position Mode",
-                ["OPEN", "CLOSE"],
-                index=0,  # Default to OPEN
-                key="trade_position_action",
-                help="OPEN creates new positions, CLOSE reduces existing positions",
-            )
+        # Show conversion line
+        if current_price > 0 and amount > 0:
+            if is_quote:
+                # User entered quote amount, show base equivalent
+                base_equivalent = amount / current_price
+                st.caption(f"≈ {base_equivalent:.6f} {base_token}")
+            else:
+                # User entered base amount, show quote equivalent
+                quote_equivalent = amount * current_price
+                st.caption(f"≈ {quote_equivalent:.2f} {quote_token}")
+
+        # Live fill estimate for market orders, walking the order book locally
+        if order_type == "market" and amount > 0:
+            order_book = get_shared_order_book(connector, trading_pair)
+            if order_book and order_book.get("bids") and order_book.get("asks"):
+                estimate = OrderBook.from_snapshot(order_book).estimate_fill(
+                    amount, is_buy=side == "buy", in_quote=is_quote
+                )
+                if estimate:
+                    st.caption(
+                        f"Est. avg fill ${estimate['average_price']:,.4f} · "
+                        f"slippage {estimate['slippage_bps']:.1f} bps"
+                    )
+                    if not estimate["complete"]:
+                        st.warning(
+                            f"Only {estimate['base_amount']:.6f} {base_token} available in the "
+                            f"fetched book (worst price ${estimate['worst_price']:,.4f})"
+                        )
 
-            # Amount input
-            amount = st.number_input(
-                "Amount", min_value=0.0, value=0.001, format="%.6f", key="trade_amount"
+        # Price input for limit orders
+        if order_type == "limit":
+            # Check if order type changed or if user hasn't set a custom price
+            if (
+                st.session_state.last_order_type != order_type
+                or not st.session_state.trade_price_set_by_user
+                or st.session_state.trade_custom_price is None
+            ):
+                # Only set default price when switching to limit or no custom price set
+                if current_price > 0:
+                    st.session_state.trade_custom_price = current_price
+                else:
+                    st.session_state.trade_custom_price = 0.0
+                st.session_state.trade_price_set_by_user = False
+
+            # Update last order type
+            st.session_state.last_order_type = order_type
+
+            price = st.number_input(
+                "Price",
+                min_value=0.0,
+                value=st.session_state.trade_custom_price,
+                format="%.4f",
+                key="trade_price",
+                on_change=lambda: setattr(
+                    st.session_state, "trade_price_set_by_user", True
+                ),
             )
 
-            # Base/Quote toggle switch
-            is_quote = st.toggle(
-                f"Amount in {quote_token}",
-                value=False,
-                help=f"Toggle to enter amount in {quote_token} instead of {base_token}",
-                key="trade_is_quote",
-            )
+            # Update custom price when user changes it
+            if price != st.session_state.trade_custom_price:
+                st.session_state.trade_custom_price = price
+                st.session_state.trade_price_set_by_user = True
 
-            # Show conversion line
-            if current_price > 0 and amount > 0:
+            # Show updated conversion for limit orders
+            if price > 0 and amount > 0:
                 if is_quote:
-                    # User entered quote amount, show base equivalent
-                    base_equivalent = amount / current_price
-                    st.caption(f"≈ {base_equivalent:.6f} {base_token}")
+                    base_equivalent = amount / price
+                    st.caption(
+                        f"At limit price: ≈ {base_equivalent:.6f} {base_token}"
+                    )
                 else:
-                    # User entered base amount, show quote equivalent
-                    quote_equivalent = amount * current_price
-                    st.caption(f"≈ {quote_equivalent:.2f} {quote_token}")
+                    quote_equivalent = amount * price
+                    st.caption(
+                        f"At limit price: ≈ {quote_equivalent:.2f} {quote_token}"
+                    )
+        else:
+            price = None
 
-            # Price input for limit orders
-            if order_type == "limit":
-                # Check if order type changed or if user hasn't set a custom price
-                if (
-                    st.session_state.last_order_type != order_type
-                    or not st.session_state.trade_price_set_by_user
-                    or st.session_state.trade_custom_price is None
-                ):
-                    # Only set default price when switching to limit or no custom price set
-                    if current_price > 0:
-                        st.session_state.trade_custom_price = current_price
-                    else:
-                        st.session_state.trade_custom_price = 0.0
-                    st.session_state.trade_price_set_by_user = False
-
-                # Update last order type
-                st.session_state.last_order_type = order_type
-
-                price = st.number_input(
-                    "Price",
-                    min_value=0.0,
-                    value=st.session_state.trade_custom_price,
-                    format="%.4f",
-                    key="trade_price",
-                    on_change=lambda: setattr(
-                        st.session_state, "trade_price_set_by_user", True
-                    ),
+        # Submit button
+        st.write("")
+        if st.button(
+            "Place Order",
+            type="primary",
+            use_container_width=True,
+            key="place_order_btn",
+        ):
+            if amount > 0:
+                # Convert amount to base if needed
+                final_amount = amount
+                conversion_price = (
+                    price if order_type == "limit" and price else current_price
                 )
 
-                # Update custom price when user changes it
-                if price != st.session_state.trade_custom_price:
-                    st.session_state.trade_custom_price = price
-                    st.session_state.trade_price_set_by_user = True
-
-                # Show updated conversion for limit orders
-                if price > 0 and amount > 0:
-                    if is_quote:
-                        base_equivalent = amount / price
-                        st.caption(
-                            f"At limit price: ≈ {base_equivalent:.6f} {base_token}"
-                        )
-                    else:
-                        quote_equivalent = amount * price
-                        st.caption(
-                            f"At limit price: ≈ {quote_equivalent:.2f} {quote_token}"
-                        )
-            else:
-                price = None
-
-            # Submit button
-            st.write("")
-            if st.button(
-                "Place Order",
-                type="primary",
-                use_container_width=True,
-                key="place_order_btn",
-            ):
-                if amount > 0:
-                    # Convert amount to base if needed
-                    final_amount = amount
-                    conversion_price = (
-                        price if order_type == "limit" and price else current_price
+                if is_quote and conversion_price > 0:
+                    # Convert quote amount to base amount
+                    final_amount = amount / conversion_price
+                    st.success(
+                        f"Converting {amount} {quote_token} to {final_amount:.6f} {base_token}"
                     )
 
-                    if is_quote and conversion_price > 0:
-                        # Convert quote amount to base amount
-                        final_amount = amount / conversion_price
-                        st.success(
-                            f"Converting {amount} {quote_token} to {final_amount:.6f} {base_token}"
-                        )
+                order_data = {
+                    "account_name": st.session_state.selected_account,
+                    "connector_name": st.session_state.selected_connector,
+                    "trading_pair": st.session_state.selected_market[
+                        "trading_pair"
+                    ],
+                    "order_type": order_type.upper(),
+                    "trade_type": side.upper(),
+                    "amount": final_amount,
+                    "position_action": position_action,
+                }
+                if order_type == "limit" and price:
+                    order_data["price"] = price
 
-                    order_data = {
-                        "account_name": st.session_state.selected_account,
-                        "connector_name": st.session_state.selected_connector,
-                        "trading_pair": st.session_state.selected_market[
-                            "trading_pair"
-                        ],
-                        "order_type": order_type.upper(),
-                        "trade_type": side.upper(),
-                        "amount": final_amount,
-                        "position_action": position_action,
-                    }
-                    if order_type == "limit" and price:
-                        order_data["price"] = price
-
-                    with st.spinner("Placing order..."):
-                        place_order(order_data)
-                else:
-                    st.error("Please enter a valid amount")
+                with st.spinner("Placing order..."):
+                    place_order(order_data)
+            else:
+                st.error("Please enter a valid amount")
 
-            st.write("")
-            st.info(
-                f"{st.session_state.selected_connector}\n{st.session_state.selected_market['trading_pair']}"
-            )
-        else:
-            st.warning("Please select an account and exchange to execute trades")
+        st.write("")
+        st.info(
+            f"{st.session_state.selected_connector}\n{st.session_state.selected_market['trading_pair']}"
+        )
+    else:
+        st.warning("Please select an account and exchange to execute trades")
 
-    # Data tables section
-    st.divider()
 
+@st.fragment(run_every=refresh_every(ACCOUNT_REFRESH_INTERVAL))
+def account_data_panel():
+    """Balances, positions, active orders and order history."""
     # Get positions, orders, and history
     positions = get_positions()
     orders = get_active_orders()
@@ -1540,21 +1684,49 @@ def show_trading_data():
         render_order_history_table(order_history)
 
 
-def render_order_history_table(order_history):
-    """Render order history table."""
-    if not order_history:
-        st.info("No order history found.")
+# Main trading data display function
+def show_trading_data():
+    """Display the chart, order book, order form and account panels."""
+
+    connector = st.session_state.selected_market.get("connector")
+    trading_pair = st.session_state.selected_market.get("trading_pair")
+
+    if not connector or not trading_pair:
+        st.warning("Please select an account and trading pair")
         return
 
-    # Convert to DataFrame
-    df = pd.DataFrame(order_history)
-    if df.empty:
+    # Chart and Trade Execution section
+    st.divider()
+    chart_col, orderbook_col, trade_col = st.columns([3, 1, 1])
+
+    with chart_col:
+        price_chart_panel()
+    with orderbook_col:
+        order_book_panel()
+    with trade_col:
+        trade_form_panel()
+
+    # Data tables section
+    st.divider()
+    account_data_panel()
+
+
+def render_order_history_table(order_history_df):
+    """Render order history table."""
+    if order_history_df.empty:
         st.info("No order history found.")
         return
 
+    # Newest first; rows merged in by later refreshes are appended to the store
+    df = order_history_df
+    for time_column in ("created_at", "timestamp"):
+        if time_column in df.columns:
+            df = df.sort_values(time_column, ascending=False)
+            break
+
     st.subheader("Order History")
     st.dataframe(
-        df,
+        paginate_frame(df, "order_history_table"),
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -1634,20 +1806,7 @@ def render_balances_table():
     )
 
 
-# Auto-refresh logic - only if user is not actively trading
-if (
-    st.session_state.auto_refresh_enabled
-    and not st.session_state.trade_price_set_by_user
-):
-    # Check if it's time to refresh
-    current_time = time.time()
-    time_since_last_refresh = current_time - st.session_state.last_refresh_time
-
-    if time_since_last_refresh >= REFRESH_INTERVAL:
-        # Update last refresh time and rerun
-        st.session_state.last_refresh_time = current_time
-        time.sleep(0.1)  # Small delay to prevent rapid refreshes
-        st.rerun()
-
 # Display trading data
 show_trading_data()
+
+render_profiler_panel(profiler_trace)
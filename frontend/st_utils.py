@@ -11,6 +11,7 @@ from streamlit.commands.page_config import InitialSideBarState, Layout
 from yaml import SafeLoader
 
 from CONFIG import AUTH_SYSTEM_ENABLED
+from frontend.api.responses import response_data
 from frontend.pages.permissions import main_page, private_pages, public_pages
 
 
@@ -268,65 +269,240 @@ def style_metric_cards():
     pass
 
 
-def get_backend_api_client():
+@st.cache_resource(show_spinner=False)
+def get_backend_api_pool():
+    """Process-wide backend client pool, shared across all sessions and closed at interpreter exit."""
     import atexit
 
-    from hummingbot_api_client import SyncHummingbotAPIClient
-
-    from CONFIG import BACKEND_API_HOST, BACKEND_API_PASSWORD, BACKEND_API_PORT, BACKEND_API_USERNAME
-
-    # Use Streamlit session state to store singleton instance
-    if (
-        "backend_api_client" not in st.session_state
-        or st.session_state.backend_api_client is None
-    ):
-        try:
-            # Create and enter the client context
-            # Ensure URL has proper protocol
-            if not BACKEND_API_HOST.startswith(("http://", "https://")):
-                base_url = f"http://{BACKEND_API_HOST}:{BACKEND_API_PORT}"
-            else:
-                base_url = f"{BACKEND_API_HOST}:{BACKEND_API_PORT}"
-
-            client = SyncHummingbotAPIClient(
-                base_url=base_url,
-                username=BACKEND_API_USERNAME,
-                password=BACKEND_API_PASSWORD,
-            )
-            # Initialize the client using context manager
-            client.__enter__()
-
-            # Register cleanup function to properly exit the context manager
-            def cleanup_client():
-                try:
-                    if (
-                        "backend_api_client" in st.session_state
-                        and st.session_state.backend_api_client is not None
-                    ):
-                        st.session_state.backend_api_client.__exit__(None, None, None)
-                        st.session_state.backend_api_client = None
-                except Exception:
-                    pass  # Ignore cleanup errors
-
-            # Register cleanup with atexit and session state
-            atexit.register(cleanup_client)
-            if "cleanup_registered" not in st.session_state:
-                st.session_state.cleanup_registered = True
-                # Also register cleanup for session state changes
-                st.session_state.backend_api_client_cleanup = cleanup_client
-
-            # Check Docker after initialization
-            if not client.docker.is_running():
-                st.error("Docker is not running. Please make sure Docker is running.")
-                cleanup_client()  # Clean up before stopping
-                st.stop()
-
-            st.session_state.backend_api_client = client
-        except Exception as e:
-            st.error(f"Failed to initialize API client: {str(e)}")
+    from CONFIG import (
+        BACKEND_API_CACHE_ENABLED,
+        BACKEND_API_FANOUT_TIMEOUT,
+        BACKEND_API_HEALTH_CHECK_INTERVAL,
+        BACKEND_API_HOST,
+        BACKEND_API_PASSWORD,
+        BACKEND_API_POOL_SIZE,
+        BACKEND_API_PORT,
+        BACKEND_API_USERNAME,
+    )
+    from frontend.api.cache import BackendCache
+    from frontend.api.client_pool import BackendClientPool
+    from frontend.api.singleflight import SingleFlight
+    from frontend.api.tracer import ApiTracer
+
+    # Ensure URL has proper protocol
+    if not BACKEND_API_HOST.startswith(("http://", "https://")):
+        base_url = f"http://{BACKEND_API_HOST}:{BACKEND_API_PORT}"
+    else:
+        base_url = f"{BACKEND_API_HOST}:{BACKEND_API_PORT}"
+
+    pool = BackendClientPool(
+        base_url=base_url,
+        username=BACKEND_API_USERNAME,
+        password=BACKEND_API_PASSWORD,
+        size=BACKEND_API_POOL_SIZE,
+        health_check_interval=BACKEND_API_HEALTH_CHECK_INTERVAL,
+    )
+    # Outermost, so traced latency is what the page actually waited for (cache hits included)
+    pool.add_middleware(ApiTracer())
+    if BACKEND_API_CACHE_ENABLED:
+        pool.add_middleware(BackendCache())
+    # Inside the cache, so concurrent misses and refreshes for the same read share one request
+    pool.add_middleware(SingleFlight(timeout=BACKEND_API_FANOUT_TIMEOUT))
+    pool.start()
+    atexit.register(pool.close)
+    return pool
+
+
+@st.cache_resource(show_spinner=False)
+def get_market_data_stream():
+    """Process-wide market data subscriber shared by all sessions, or None when streaming is off."""
+    import atexit
+
+    from CONFIG import (
+        BACKEND_API_PASSWORD,
+        BACKEND_API_USERNAME,
+        MARKET_DATA_STREAM,
+        MARKET_DATA_STREAM_MAX_CANDLES,
+        MARKET_DATA_STREAM_MAX_TRADES,
+    )
+    from frontend.api.market_stream import (
+        MarketDataStream,
+        RestPollingSource,
+        WebSocketSource,
+    )
+
+    pool = get_backend_api_pool()
+    if MARKET_DATA_STREAM == "websocket":
+        source = WebSocketSource(pool.base_url, BACKEND_API_USERNAME, BACKEND_API_PASSWORD)
+    elif MARKET_DATA_STREAM == "poll":
+        source = RestPollingSource(pool)
+    else:
+        return None
+
+    stream = MarketDataStream(
+        source,
+        max_trades=MARKET_DATA_STREAM_MAX_TRADES,
+        max_candles=MARKET_DATA_STREAM_MAX_CANDLES,
+    )
+    stream.start()
+    atexit.register(stream.close)
+    return stream
+
+
+@st.cache_resource(show_spinner=False)
+def get_candle_store():
+    """Process-wide incremental candle cache shared by all sessions."""
+    from CONFIG import (
+        CANDLE_RESAMPLE_BASE_CANDLES,
+        CANDLE_RESAMPLE_BASE_INTERVAL,
+        CANDLE_STORE_MAX_CANDLES,
+    )
+    from frontend.api.candle_store import CandleStore
+
+    pool = get_backend_api_pool()
+
+    def fetch(connector, trading_pair, interval, max_records):
+        response = pool.call(
+            "market_data",
+            "get_candles",
+            connector_name=connector,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        )
+        return response_data(response, [])
+
+    return CandleStore(
+        fetch,
+        max_candles=CANDLE_STORE_MAX_CANDLES,
+        base_interval=CANDLE_RESAMPLE_BASE_INTERVAL or None,
+        base_candles=CANDLE_RESAMPLE_BASE_CANDLES,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_candle_archive():
+    """Process-wide on-disk historical candle store, or None when disabled or Parquet is unavailable."""
+    from CONFIG import CANDLE_ARCHIVE_ENABLED, CANDLE_ARCHIVE_PATH
+    from frontend.api.candle_archive import CandleArchive, parquet_available
+
+    if not CANDLE_ARCHIVE_ENABLED or not parquet_available():
+        return None
+
+    pool = get_backend_api_pool()
+
+    def fetch(connector, trading_pair, interval, start_time, end_time):
+        response = pool.call(
+            "market_data",
+            "get_historical_candles",
+            connector_name=connector,
+            trading_pair=trading_pair,
+            interval=interval,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        return response_data(response, [])
+
+    return CandleArchive(CANDLE_ARCHIVE_PATH, fetch)
+
+
+@st.cache_resource(show_spinner=False)
+def get_fleet_poller():
+    """Process-wide background poller of bot statuses and controller configs, shared by all sessions."""
+    import atexit
+
+    from CONFIG import (
+        BACKEND_API_FANOUT_TIMEOUT,
+        BOT_LOG_TAIL_LINES,
+        FLEET_POLL_IDLE_TIMEOUT,
+        FLEET_POLL_INTERVAL,
+    )
+    from frontend.api.fleet_poller import FleetPoller
+
+    pool = get_backend_api_pool()
+    poller = FleetPoller(
+        lambda: pool.call("bot_orchestration", "get_active_bots_status"),
+        lambda bot_name: pool.call("bot_orchestration", "get_bot_status", bot_name),
+        lambda bot_name: pool.call("controllers", "get_bot_controller_configs", bot_name),
+        interval=FLEET_POLL_INTERVAL,
+        idle_timeout=FLEET_POLL_IDLE_TIMEOUT,
+        timeout=BACKEND_API_FANOUT_TIMEOUT,
+        max_log_lines=BOT_LOG_TAIL_LINES,
+    )
+    poller.start()
+    atexit.register(poller.close)
+    return poller
+
+
+@st.cache_resource(show_spinner=False)
+def get_watchlist():
+    """Process-wide watchlist price histories, polled in batches per connector and shared by all sessions."""
+    from CONFIG import BACKEND_API_FANOUT_TIMEOUT, WATCHLIST_REFRESH_INTERVAL
+    from frontend.api.watchlist import Watchlist, price_map
+
+    pool = get_backend_api_pool()
+
+    def fetch_prices(connector, trading_pairs):
+        return price_map(pool.call("market_data", "get_prices", connector_name=connector, trading_pairs=trading_pairs))
+
+    def fetch_history(connector, trading_pair, interval, max_records):
+        response = pool.call(
+            "market_data",
+            "get_candles",
+            connector_name=connector,
+            trading_pair=trading_pair,
+            interval=interval,
+            max_records=max_records,
+        )
+        return response_data(response, [])
+
+    return Watchlist(
+        fetch_prices,
+        fetch_history,
+        min_interval=WATCHLIST_REFRESH_INTERVAL,
+        timeout=BACKEND_API_FANOUT_TIMEOUT,
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_queue():
+    """Process-wide background queue for deploy, stop, archive and delete jobs, shared by all sessions."""
+    import atexit
+
+    from CONFIG import JOB_POLL_INTERVAL, JOB_POLL_MAX_INTERVAL, JOB_QUEUE_WORKERS, JOB_TIMEOUT
+    from frontend.api.jobs import JobQueue
+
+    queue = JobQueue(
+        max_workers=JOB_QUEUE_WORKERS,
+        poll_interval=JOB_POLL_INTERVAL,
+        max_poll_interval=JOB_POLL_MAX_INTERVAL,
+        timeout=JOB_TIMEOUT,
+    )
+    atexit.register(queue.close)
+    return queue
+
+
+@st.cache_resource(show_spinner=False)
+def get_bot_jobs():
+    """Bot orchestration jobs on the shared queue; each finished job refreshes the fleet snapshot."""
+    from frontend.api.jobs import BotJobs
+
+    pool = get_backend_api_pool()
+    fleet_poller = get_fleet_poller()
+    return BotJobs(get_job_queue(), pool.call, on_finished=lambda job: fleet_poller.refresh())
+
+
+def get_backend_api_client():
+    pool = get_backend_api_pool()
+
+    # Health (API reachable + Docker running) is checked by the pool on a timer, not per session
+    if not pool.is_healthy():
+        # Re-check right away so a recovered backend doesn't wait for the next timer tick
+        if not pool.check_health():
+            st.error(pool.last_error or "Backend API is not available.")
             st.stop()
 
-    return st.session_state.backend_api_client
+    return pool.client()
 
 
 def auth_system():
@@ -7,7 +7,7 @@ from backend.services.backend_api_client import BackendAPIClient
 from backend.utils.performance_data_source import PerformanceDataSource
 from hummingbot.core.data_type.common import TradeType
 
-from frontend.st_utils import download_csv_button, get_backend_api_client
+from frontend.st_utils import download_csv_button, get_backend_api_client, get_candle_archive
 from frontend.visualization.backtesting import create_backtesting_figure
 from frontend.visualization.backtesting_metrics import render_accuracy_metrics, render_backtesting_metrics
 from frontend.visualization.performance_time_evolution import create_combined_subplots
@@ -312,9 +312,15 @@ def display_execution_analysis(data_source: PerformanceDataSource):
 @st.cache_data()
 def fetch_market_data(params: Dict[str, Any] = None):
     with st.spinner(f"Loading market data from {params['connector']}..."):
-        backend_api = get_backend_api_client()
-        candles_dict = backend_api.get_historical_candles(**params)
-        candles_df = pd.DataFrame(candles_dict)
+        archive = get_candle_archive()
+        if archive is not None:
+            candles_df = archive.get(
+                params["connector"], params["trading_pair"], params["interval"], params["start_time"], params["end_time"]
+            )
+        else:
+            backend_api = get_backend_api_client()
+            candles_dict = backend_api.get_historical_candles(**params)
+            candles_df = pd.DataFrame(candles_dict)
         candles_df["datetime"] = pd.to_datetime(candles_df.timestamp, unit="s")
         candles_df.set_index("datetime", inplace=True)
     return candles_df
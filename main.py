@@ -1,6 +1,7 @@
 import streamlit as st
 
-from frontend.st_utils import auth_system
+from frontend.components.job_tray import render_job_tray
+from frontend.st_utils import auth_system, get_job_queue
 
 
 def main():
@@ -13,6 +14,10 @@ def main():
     # Run the selected page
     pg.run()
 
+    # Background jobs of this session, on every page (after it, so jobs it just submitted are listed)
+    with st.sidebar:
+        render_job_tray(get_job_queue())
+
 
 if __name__ == "__main__":
     main()